@@ -1,18 +1,22 @@
 """swimlib - Production-Grade Python SDK for ASDB API.
 
 This module provides the core logging configuration for the swimlib package.
-The logger is configured with Rich terminal formatting for enhanced output readability.
+By default the logger writes plain records to stdout through a stdlib ``StreamHandler``;
+Rich terminal formatting can be enabled for interactive use.
 
 The module exports a singleton logger instance that can be imported and used throughout
 the SDK and by client applications.
 
 Module Attributes:
-    log (logging.Logger): Configured logger instance with RichHandler for colored terminal output.
-        The log level is controlled via the ``SWIMLIB_LOG_LEVEL`` environment variable.
+    log (logging.Logger): Configured logger instance writing to stdout. The log level is
+        controlled via the ``SWIMLIB_LOG_LEVEL`` environment variable.
 
 Environment Variables:
     SWIMLIB_LOG_LEVEL (str): Sets the logging level. Valid values are DEBUG, INFO, WARNING, ERROR.
         Defaults to INFO if not set or if an invalid value is provided.
+    SWIMLIB_PRETTY_LOGS (str): Set to ``1`` to use :class:`rich.logging.RichHandler` instead of
+        the plain stdout handler. Rich is considerably slower for high-volume logging, so it is
+        opt-in. Defaults to ``0``.
 
 Example:
     Basic usage of the logger::
@@ -27,31 +31,56 @@ Note:
     The logger is configured only once to prevent duplicate handlers. Subsequent imports
     will reuse the same configured logger instance.
 
+    Records are handed to a :class:`logging.handlers.QueueHandler` and written by a
+    background :class:`logging.handlers.QueueListener`, so logging calls never block on
+    stdout. The listener is stopped, and the queue drained, at interpreter exit.
+
 See Also:
     - :mod:`rich.logging.RichHandler` for terminal formatting details
     - :mod:`swimlib.asdb` for ASDB client implementation
 
 .. versionadded:: 0.1.0
 """
+import atexit
 import os
+import queue
+import sys
 import logging
-from rich.logging import RichHandler
+from logging.handlers import QueueHandler, QueueListener
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 # module-level logger exposed as `from swimlib import log`
 logger = logging.getLogger("swimlib")
 
-# configure only once
-if not logger.handlers:
+# configure only once per process
+if not getattr(logger, "_swimlib_configured", False):
     level_name = os.getenv("SWIMLIB_LOG_LEVEL", "INFO").upper()
-    try:
-        level = getattr(logging, level_name)
-    except Exception:
-        level = logging.INFO
-    handler = RichHandler()
+    level = _LEVELS.get(level_name, logging.INFO)
+    handler: logging.Handler
+    if os.getenv("SWIMLIB_PRETTY_LOGS", "0") == "1":
+        from rich.logging import RichHandler
+
+        handler = RichHandler()
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
     handler.setLevel(level)
-    logger.addHandler(handler)
+    # callers only enqueue records; formatting and writing happen on the listener thread
+    _queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    logger.addHandler(QueueHandler(_queue))
     logger.setLevel(level)
     logger.propagate = False
+    setattr(logger, "_swimlib_configured", True)
 
 log = logger
 
@@ -9,6 +9,9 @@ degradation when API calls fail.
 
 Classes:
     ASDBClient: HTTP client for ASDB API operations with device context support.
+    ASDBExecutionResolved: Base class for the exceptions that end a device execution.
+    ASDBExecutionFailed: Raised when a device execution is marked failed.
+    ASDBExecutionSucceeded: Raised when a device execution is marked completed.
 
 Environment Variables:
     ASDB_BASE_URL (str): Base URL for the ASDB API endpoint (required for remote mode).
@@ -41,9 +44,10 @@ Note:
     with ``ASDBClient.from_env()`` and ``ExecutionContext`` patterns.
 
 Warning:
-    This implementation calls ``sys.exit()`` on failures, which conflicts with the
-    library design goal of exception-based error handling. This should be refactored
-    to raise ``ASDBError`` exceptions instead.
+    Finalizing an execution raises :class:`ASDBExecutionFailed` or
+    :class:`ASDBExecutionSucceeded`. Both subclass ``SystemExit`` so uncaught they still
+    terminate the process with the matching exit code, but a top-level runner can catch
+    them and perform cleanup once.
 
 See Also:
     - :mod:`swimlib.ssh_connect` for SSH connection management
@@ -51,12 +55,169 @@ See Also:
 
 .. versionadded:: 0.1.0
 """
-from datetime import datetime
 from swimlib import log
+import atexit
+import logging
 import os
-import sys
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Any, Dict, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    def _encode(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:  # optional dependency: pip install swimlib[fast]
+    import json
+
+    def _encode(payload: Any) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+_LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (connect, read) timeout in seconds for every ASDB request
+_REQUEST_TIMEOUT = (3, 10)
+
+# environment defaults, read once at import; explicit constructor arguments take precedence
+_DEFAULT_BASE_URL = os.getenv("ASDB_BASE_URL")
+_DEFAULT_TOKEN = os.getenv("ASDB_TOKEN")
+_DEFAULT_MODE = os.getenv("ASDB_MODE", "remote").lower()
+_DEFAULT_LOG_BATCH = int(os.getenv("SWIMLIB_LOG_BATCH", "25"))
+
+# bound once so _now_ts skips the module attribute lookups on every log entry
+_time = time.time
+_strftime = time.strftime
+_localtime = time.localtime
+
+# (epoch second, formatted timestamp) of the most recent _now_ts() call
+_ts_cache = (0, "")
+
+# ASDB endpoint templates, filled with str.format at call time
+_EP_EXEC_STATUS = "swimv2/execution_log/{}/"
+_EP_EXEC_APPEND = "swimv2/execution_log/{}/append_log/"
+_EP_DEVICE = "swimv2/devices/{}/"
+_EP_DEVICE_HISTORY = "swimv2/device_history/"
+_EP_EXEC_FINALIZE = "swimv2/execution_log/{}/finalize/"
+
+# finalize/ responses meaning the server does not provide the endpoint at all
+_FINALIZE_MISSING_CODES = frozenset({404, 405, 501})
+
+# constant part of every device history metadata record, overlaid with per-call values
+_HISTORY_TEMPLATE = {
+    "volume": "HD1.1",
+    "cr_image_copy": "CR12345678",
+    "cr_image_stage": "CR12345",
+    "current_version": "17.X",
+    "current_volume": "HD1.1",
+    "target_volume": "HD1.2",
+    "checksum_status": True,
+}
+
+
+class ASDBExecutionResolved(SystemExit):
+    """Base class for the exceptions that end a device execution once ASDB is updated.
+
+    Subclasses ``SystemExit`` so an uncaught instance still ends the process with
+    :attr:`exit_code`. A runner that handles several devices in one interpreter catches it
+    at the per-device boundary instead.
+
+    :ivar message: Final message that was sent to ASDB.
+    :vartype message: str
+
+    .. versionadded:: 0.1.0
+    """
+    exit_code = 0
+
+    def __init__(self, message: str = "") -> None:
+        super().__init__(self.exit_code)
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class ASDBExecutionFailed(ASDBExecutionResolved):
+    """Raised by :meth:`ASDBClient.fail_device_execution` after ASDB has been updated.
+
+    Subclasses ``SystemExit``, so an uncaught instance terminates the process with exit
+    code 1.
+
+    Example:
+        Handle the failure in a top-level runner::
+
+            try:
+                run_workflow(client)
+            except ASDBExecutionFailed:
+                notify_team(client.device["device_name"])
+                raise
+            finally:
+                client.close()
+
+    .. versionadded:: 0.1.0
+    """
+    exit_code = 1
+
+
+class ASDBExecutionSucceeded(ASDBExecutionResolved):
+    """Raised by :meth:`ASDBClient.pass_device_execution` after ASDB has been updated.
+
+    Subclasses ``SystemExit``, so an uncaught instance terminates the process with exit
+    code 0.
+
+    .. versionadded:: 0.1.0
+    """
+    exit_code = 0
+
+
+def _max_age(cache_control: Optional[str]) -> float:
+    """Return the ``max-age`` seconds from a Cache-Control header, or 0 if absent/uncacheable."""
+    if not cache_control:
+        return 0.0
+    directives = [d.strip().lower() for d in cache_control.split(",")]
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    for d in directives:
+        if d.startswith("max-age="):
+            try:
+                return float(d[8:])
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+# live clients whose buffered log entries are flushed at interpreter exit
+_live_clients: "weakref.WeakSet[ASDBClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_clients() -> None:
+    for client in list(_live_clients):
+        try:
+            client.flush_logs()
+        except Exception as exc:
+            log.warning("Failed to flush ASDB log entries at exit: %s", exc)
+
+
+def _now_ts() -> str:
+    """Return the current local time formatted with ``_LOG_TIME_FORMAT``.
+
+    The formatted string is cached per wall-clock second, so a burst of log entries
+    within the same second is formatted only once.
+
+    :return: Timestamp string such as ``"2025-01-31 14:05:09"``
+    :rtype: str
+    """
+    global _ts_cache
+    second = int(_time())
+    cached = _ts_cache
+    if cached[0] != second:
+        cached = _ts_cache = (second, _strftime(_LOG_TIME_FORMAT, _localtime(second)))
+    return cached[1]
 
 
 class ASDBClient:
@@ -66,8 +227,8 @@ class ASDBClient:
     production ('remote') and testing ('local') modes. In remote mode, it makes actual
     HTTP API calls. In local mode, it logs the operations without making network requests.
 
-    The client maintains a device context dictionary that tracks execution metadata and
-    automatically updates execution status upon initialization if an execution_log_id is present.
+    The client maintains a device context dictionary that tracks execution metadata. Creating
+    a client makes no API calls; call :meth:`start` to mark the execution as 'inprogress'.
 
     :ivar device: Device context dictionary containing execution metadata.
     :vartype device: Dict[str, Any]
@@ -79,6 +240,14 @@ class ASDBClient:
     :vartype mode: str
     :ivar headers: HTTP headers for API requests including authorization.
     :vartype headers: Dict[str, str]
+    :ivar _session: Persistent HTTP session reused for every API call so the TCP/TLS
+        connection to ASDB is kept alive between requests.
+    :vartype _session: requests.Session
+    :ivar _log_buf: Pending ``append_log`` entries not yet sent to ASDB.
+    :vartype _log_buf: list[dict]
+    :ivar _log_buf_max: Number of buffered entries that triggers a flush. Read from the
+        ``SWIMLIB_LOG_BATCH`` environment variable (default 25).
+    :vartype _log_buf_max: int
 
     Example:
         Initialize client and update execution status::
@@ -90,12 +259,11 @@ class ASDBClient:
                 mode="remote"
             )
 
-            # Client automatically updates status to 'inprogress' on init
+            client.start()  # marks the execution log 'inprogress'
             client.send_log("Starting upgrade process", log_level="info")
 
     .. warning::
-        Initialization will call ``sys.exit(1)`` if the automatic status update fails.
-        This behavior should be refactored to raise exceptions instead.
+        :meth:`start` raises :class:`ASDBExecutionFailed` if the status update fails.
 
     .. versionadded:: 0.1.0
     """
@@ -109,9 +277,9 @@ class ASDBClient:
     ) -> None:
         """Initialize ASDB client with URL, authentication token, optional device context, and operation mode.
 
-        The client reads configuration from environment variables if not explicitly provided.
-        If a device context with an execution_log_id is provided, the client automatically
-        updates the execution status to 'inprogress' upon initialization.
+        The client falls back to environment variables if values are not explicitly provided.
+        Environment variables are read once when :mod:`swimlib.asdb` is imported.
+        No API calls are made here; use :meth:`start` to mark the execution as 'inprogress'.
 
         :param base_url: Base URL for ASDB API. If None, reads from ASDB_BASE_URL environment variable.
         :type base_url: str | None
@@ -123,7 +291,6 @@ class ASDBClient:
         :param mode: Operation mode - 'remote' for production API calls or 'local' for dry-run logging.
             If None, reads from ASDB_MODE environment variable (defaults to 'remote').
         :type mode: str | None
-        :raises SystemExit: If automatic execution status update fails during initialization.
 
         Example:
             Initialize with explicit parameters::
@@ -140,30 +307,115 @@ class ASDBClient:
                 # Set environment: ASDB_BASE_URL, ASDB_TOKEN, ASDB_MODE
                 client = ASDBClient()
 
-        .. note::
-            The automatic status update on initialization may not be desirable in all use cases.
-            Consider refactoring to make this behavior explicit rather than implicit.
-
         .. versionadded:: 0.1.0
         """
         self.device = device or {}
-        self.base_url = base_url or os.getenv("ASDB_BASE_URL")
-        self.api_token = api_token or os.getenv("ASDB_TOKEN")
-        self.mode = (mode or os.getenv("ASDB_MODE", "remote")).lower()
+        self.base_url = base_url or _DEFAULT_BASE_URL
+        self._url_prefix = (self.base_url or "").rstrip("/") + "/"
+        self.api_token = api_token or _DEFAULT_TOKEN
+        self.mode = mode.lower() if mode else _DEFAULT_MODE
+        self._local = self.mode == "local"
+        self._auth = f"Token {self.api_token}"
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
-            "Authorization": f"Token {self.api_token}",
+            "Authorization": self._auth,
         }
+        self._warned_no_exec_id = False
+        self._log_buf: list[dict] = []
+        self._log_buf_max = _DEFAULT_LOG_BATCH
+        # cleared the first time the server answers 404 for the finalize endpoint
+        self._finalize_supported = True
+        # url -> (etag, last 200 response, fresh-until epoch seconds) for conditional GETs
+        self._etag_cache: Dict[str, Tuple[Optional[str], requests.Response, float]] = {}
+        _live_clients.add(self)
+
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.verify = False
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
+    @property
+    def device(self) -> Dict[str, Any]:
+        """Device context dictionary containing execution metadata.
+
+        Assigning a new dictionary also refreshes the cached execution_log_id, device_name,
+        execution_type and append_log endpoint, so rebind the whole context rather than
+        mutating those keys in place.
+        """
+        return self._device
+
+    @device.setter
+    def device(self, device: Dict[str, Any] | None) -> None:
+        self._device = device = device or {}
+        self._exec_id = device.get("execution_log_id")
+        self._device_name = device.get("device_name")
+        self._execution_type = str(device.get("execution_type", "")).lower()
+        self._append_endpoint = _EP_EXEC_APPEND.format(self._exec_id) if self._exec_id else None
+
+    @classmethod
+    def from_env(cls, device: Dict[str, Any] | None = None, *, autostart: bool = False) -> "ASDBClient":
+        """Create a client configured from the ``ASDB_*`` environment variables.
+
+        :param device: Device context dictionary containing execution metadata
+        :type device: Dict[str, Any] | None
+        :param autostart: Call :meth:`start` on the new client before returning it
+        :type autostart: bool
+        :return: Configured client
+        :rtype: ASDBClient
+
+        Example:
+            Create clients for many devices and mark them in progress concurrently::
+
+                from concurrent.futures import ThreadPoolExecutor
+
+                clients = [ASDBClient.from_env(d) for d in devices]
+                with ThreadPoolExecutor() as ex:
+                    list(ex.map(ASDBClient.start, clients))
+
+        .. versionadded:: 0.1.0
+        """
+        client = cls(device=device)
+        if autostart:
+            client.start()
+        return client
+
+    def start(self) -> Optional[requests.Response]:
+        """Mark the device execution as 'inprogress' in ASDB.
+
+        Construction never touches the network; callers opt in to the initial status update
+        by calling this method once the device context is bound.
+
+        :return: Response object from the API request, or None if no execution_log_id or in local mode
+        :rtype: requests.Response | None
+        :raises ASDBExecutionFailed: If the status update fails (via :meth:`fail_device_execution`)
+
+        .. versionadded:: 0.1.0
+        """
+        exec_id = self._exec_id
+        if not exec_id:
+            return None
         try:
-            exec_id = self.device.get("execution_log_id")
-            if exec_id:
-                self.update_execution_log_status(exec_id, "inprogress")
+            return self.update_execution_log_status(exec_id, "inprogress")
         except Exception as exc:
-            self.fail_device_execution(f"Error: Failed to initialize ASDB client: {exc}")
+            self.fail_device_execution(f"Error: Failed to start ASDB execution: {exc}")
+
+    def close(self) -> None:
+        """Close the client's HTTP session and release its pooled connections.
 
-    def _make_request(self, method: str, endpoint: str, payload: Dict | None = None) -> Optional[requests.Response]:
+        .. versionadded:: 0.1.0
+        """
+        self._session.close()
+
+    def _make_request(
+        self, method: str, endpoint: str, payload: Dict | List | None = None
+    ) -> Optional[requests.Response]:
         """Make HTTP request to ASDB API with automatic mode handling.
 
         This internal method handles all HTTP communication with the ASDB API. In 'remote'
@@ -175,7 +427,7 @@ class ASDBClient:
         :param endpoint: API endpoint path relative to base_url (leading slash optional)
         :type endpoint: str
         :param payload: Request payload data to send as JSON body
-        :type payload: Dict[str, Any] | None
+        :type payload: Dict[str, Any] | List[Dict[str, Any]] | None
         :return: Response object from requests library in remote mode, None in local mode
         :rtype: requests.Response | None
 
@@ -192,17 +444,69 @@ class ASDBClient:
             SSL verification is disabled (``verify=False``). This should be configurable
             in production environments that require certificate validation.
 
+            Requests go through the client's persistent ``requests.Session``, so repeated
+            calls reuse the same keep-alive connection instead of a new TLS handshake each.
+
+            Payloads are serialized to JSON bytes up front, with ``orjson`` when it is
+            installed (``swimlib[fast]``) and the stdlib ``json`` module otherwise. The
+            session already sends ``Content-Type: application/json``.
+
+            Every request uses a (3s connect, 10s read) timeout, and the session retries
+            502/503/504 responses up to three times with exponential backoff.
+
+            GET requests are revalidated with ``ETag``/``If-None-Match`` and honour
+            ``Cache-Control: max-age`` (see :meth:`_conditional_get`).
+
         .. warning::
             This is an internal method. Use the public API methods like
             ``update_execution_log_status()`` instead.
 
         .. versionadded:: 0.1.0
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        if self.mode == "local":
-            log.info(f"[ASDB local] {method} {url} payload={payload}")
+        if self._local:
+            if log.isEnabledFor(logging.INFO):
+                log.info("[ASDB local] %s /%s payload=%s", method, endpoint.lstrip("/"), payload)
             return None
-        return requests.request(method=method, url=url, json=payload, headers=self.headers, verify=False)
+        url = self._url_prefix + endpoint.lstrip("/")
+        if method == "GET":
+            return self._conditional_get(url)
+        data = _encode(payload) if payload is not None else None
+        return self._session.request(method=method, url=url, data=data, timeout=_REQUEST_TIMEOUT)
+
+    def _conditional_get(self, url: str) -> requests.Response:
+        """Issue a GET that revalidates the last response for ``url`` with its ETag.
+
+        A cached response still within its ``Cache-Control: max-age`` is returned without a
+        request. Otherwise ``If-None-Match`` is sent and a ``304 Not Modified`` answer returns
+        the cached response.
+
+        :param url: Absolute request URL
+        :type url: str
+        :return: Fresh or cached response
+        :rtype: requests.Response
+
+        .. versionadded:: 0.1.0
+        """
+        cached = self._etag_cache.get(url)
+        headers = None
+        if cached is not None:
+            etag, cached_response, fresh_until = cached
+            if _time() < fresh_until:
+                return cached_response
+            if etag:
+                headers = {"If-None-Match": etag}
+
+        response = self._session.request(method="GET", url=url, headers=headers, timeout=_REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached is not None:
+            fresh_until = _time() + _max_age(response.headers.get("Cache-Control"))
+            self._etag_cache[url] = (cached[0], cached[1], fresh_until)
+            return cached[1]
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            max_age = _max_age(response.headers.get("Cache-Control"))
+            if etag or max_age:
+                self._etag_cache[url] = (etag, response, _time() + max_age)
+        return response
 
     def update_execution_log_status(self, execution_log_id: str, status: str) -> Optional[requests.Response]:
         """Update the execution status of a specific execution log in ASDB.
@@ -228,22 +532,28 @@ class ASDBClient:
 
         .. versionadded:: 0.1.0
         """
-        endpoint = f"swimv2/execution_log/{execution_log_id}/"
+        endpoint = _EP_EXEC_STATUS.format(execution_log_id)
         payload = {"execution_status": status}
         return self._make_request("PATCH", endpoint, payload)
 
     def send_log(self, message: str, log_level: str = "info") -> Optional[requests.Response]:
         """Append a log entry to the execution log using the device context.
 
-        This method sends a timestamped log entry to ASDB. It uses the execution_log_id
+        This method buffers a timestamped log entry for ASDB. It uses the execution_log_id
         from the device context dictionary. If no execution_log_id is available, the
         method logs a warning and returns None without making an API call.
 
+        Entries are held in memory and posted together in a single ``append_log`` request
+        once the buffer reaches ``SWIMLIB_LOG_BATCH`` entries, or when the execution is
+        finalized via :meth:`fail_device_execution` / :meth:`pass_device_execution`.
+        Call :meth:`flush_logs` to send them earlier; anything still buffered when the
+        interpreter exits is flushed by an ``atexit`` hook.
+
         :param message: Log message text to send to ASDB
         :type message: str
         :param log_level: Severity level of the log entry (info, warning, error, debug)
         :type log_level: str
-        :return: Response object from the API request, or None if no execution_log_id or in local mode
+        :return: Response object if this call triggered a flush, otherwise None
         :rtype: requests.Response | None
 
         Example:
@@ -256,17 +566,50 @@ class ASDBClient:
 
         .. warning::
             Requires device context with execution_log_id to be set during initialization.
-            Will log a warning and return None if execution_log_id is not available.
+            Returns None if execution_log_id is not available; a warning is logged on the
+            first such call only.
 
         .. versionadded:: 0.1.0
         """
-        exec_id = self.device.get("execution_log_id")
-        if not exec_id:
-            log.warning("ASDBClient.send_log called without device or execution_log_id")
+        if not self._exec_id:
+            if not self._warned_no_exec_id:
+                self._warned_no_exec_id = True
+                log.warning("ASDBClient.send_log called without device or execution_log_id")
             return None
-        endpoint = f"swimv2/execution_log/{exec_id}/append_log/"
-        payload = [{"time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "message": message, "log_level": log_level}]
-        return self._make_request("POST", endpoint, payload)
+        self._log_buf.append({"time": _now_ts(), "message": message, "log_level": log_level})
+        if len(self._log_buf) >= self._log_buf_max:
+            return self.flush_logs()
+        return None
+
+    def flush_logs(self) -> Optional[requests.Response]:
+        """Post all buffered log entries to ASDB in one ``append_log`` request.
+
+        Called automatically when the buffer fills, when the execution is finalized, and for
+        every live client at interpreter exit.
+
+        :return: Response object from the API request, or None if nothing was buffered or in local mode
+        :rtype: requests.Response | None
+
+        .. versionadded:: 0.1.0
+        """
+        if not self._append_endpoint or not self._log_buf:
+            return None
+        payload, self._log_buf = self._log_buf, []
+        return self._make_request("POST", self._append_endpoint, payload)
+
+    def _fanout(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """Run independent API calls concurrently on the shared session.
+
+        :param calls: Zero-argument callables, typically bound API methods or lambdas
+        :type calls: List[Callable[[], Any]]
+        :return: Results in the same order as ``calls``
+        :rtype: List[Any]
+        :raises Exception: The first exception raised by any call, after all calls finish
+
+        .. versionadded:: 0.1.0
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+            return list(ex.map(lambda call: call(), calls))
 
     def pre_validation_status(self, conn_status: str) -> Optional[requests.Response]:
         """Update device connection status in ASDB.
@@ -294,11 +637,11 @@ class ASDBClient:
 
         .. versionadded:: 0.1.0
         """
-        device_name = self.device.get("device_name")
+        device_name = self._device_name
         if not device_name:
             log.warning("ASDBClient.pre_validation_status called without device.device_name")
             return None
-        endpoint = f"swimv2/devices/{device_name}/"
+        endpoint = _EP_DEVICE.format(device_name)
         payload = {"conn_status": conn_status}
         return self._make_request("PATCH", endpoint, payload)
 
@@ -336,21 +679,79 @@ class ASDBClient:
 
         .. versionadded:: 0.1.0
         """
-        etype = self.device.get("execution_type")
-        if etype == "dry_run":
+        payload = self._history_payload(status)
+        if payload is None:
             return None
+        return self._make_request("POST", _EP_DEVICE_HISTORY, payload)
+
+    def _history_payload(self, status: str) -> Optional[Dict[str, Any]]:
+        """Build the device history record body, or None for dry_run executions.
 
-        target_version = self.device.get("target_version")
-        metadata = self.build_history_metadata(target_version, status)
+        :param status: History record status (e.g., 'completed', 'failed')
+        :type status: str
+        :return: Request body for the device history endpoint
+        :rtype: Dict[str, Any] | None
 
-        endpoint = "swimv2/device_history/"
-        payload = {
-            "request_id_input": self.device.get("execution_id"),
-            "device_input": self.device.get("device_name"),
-            "stage": etype,
-            "metadata": metadata,
+        .. versionadded:: 0.1.0
+        """
+        if self._execution_type == "dry_run":
+            return None
+        device = self._device
+        return {
+            "request_id_input": device.get("execution_id"),
+            "device_input": self._device_name,
+            "stage": device.get("execution_type"),
+            "metadata": self.build_history_metadata(device.get("target_version"), status),
         }
-        return self._make_request("POST", endpoint, payload)
+
+    def _finalize(
+        self,
+        exec_log_id: Optional[str],
+        status: str,
+        message: str,
+        log_level: str,
+        history_status: str,
+    ) -> None:
+        """Send the final log entries, execution status and device history to ASDB.
+
+        All three go in one POST to the execution log's ``finalize/`` endpoint. If the server
+        answers with anything other than 2xx, or there is no execution_log_id, the separate
+        append_log, status and history calls are sent concurrently instead. A 404, 405 or 501
+        (endpoint not available) also disables ``finalize/`` for the rest of the run.
+
+        :param exec_log_id: Execution log identifier from the device context
+        :type exec_log_id: str | None
+        :param status: Final execution status (e.g., 'failed', 'completed')
+        :type status: str
+        :param message: Final log message
+        :type message: str
+        :param log_level: Severity of the final log message
+        :type log_level: str
+        :param history_status: Status recorded on the device history entry
+        :type history_status: str
+
+        .. versionadded:: 0.1.0
+        """
+        if exec_log_id and self._finalize_supported:
+            entries = self._log_buf + [{"time": _now_ts(), "message": message, "log_level": log_level}]
+            payload = {
+                "status": status,
+                "log": entries,
+                "history": self._history_payload(history_status),
+            }
+            response = self._make_request("POST", _EP_EXEC_FINALIZE.format(exec_log_id), payload)
+            if response is None or response.ok:
+                self._log_buf = []
+                return
+            if response.status_code in _FINALIZE_MISSING_CODES:
+                self._finalize_supported = False
+
+        self.send_log(message, log_level=log_level)
+        self._fanout([
+            self.flush_logs,
+            lambda: self.update_execution_log_status(exec_log_id, status) if exec_log_id else None,
+            lambda: self.send_device_history(history_status),
+        ])
 
     def build_history_metadata(self, target_version: str | None, status: str) -> Dict[str, Any]:
         """Build standardized metadata dictionary for device history records.
@@ -384,41 +785,39 @@ class ASDBClient:
 
             The current_version defaults to "17.X" and should be made configurable.
 
+            Constant fields come from the module-level ``_HISTORY_TEMPLATE``; each call
+            returns a fresh copy, so callers may mutate the result.
+
         .. seealso::
             - :meth:`send_device_history` which uses this method to build metadata
 
         .. versionadded:: 0.1.0
         """
         tv = target_version or ""
-        return {
-            "image_name": f"BIGIP-{tv}.iso",
-            "version": tv,
-            "volume": "HD1.1",
-            "upload_status": status,
-            "cr_image_copy": "CR12345678",
-            "source_location": self.device.get("local_folder"),
-            "destination_location": self.device.get("remote_folder"),
-            "cr_image_stage": "CR12345",
-            "current_version": "17.X",
-            "current_volume": "HD1.1",
-            "target_version": tv,
-            "target_volume": "HD1.2",
-            "checksum_status": True,
-        }
-
-    def resolve_execution(self, message: str) -> None:
+        md = _HISTORY_TEMPLATE.copy()
+        md["image_name"] = f"BIGIP-{tv}.iso"
+        md["version"] = tv
+        md["upload_status"] = status
+        md["source_location"] = self.device.get("local_folder")
+        md["destination_location"] = self.device.get("remote_folder")
+        md["target_version"] = tv
+        return md
+
+    def resolve_execution(self, message: str) -> NoReturn:
         """Resolve execution outcome based on execution type - pass for dry_run, fail otherwise.
 
         This method provides conditional execution resolution: for 'dry_run' execution types,
-        it calls pass_device_execution() which exits with code 0. For all other execution types,
-        it calls fail_device_execution() which exits with code 1.
+        it calls pass_device_execution() which raises ASDBExecutionSucceeded (exit code 0). For all
+        other execution types, it calls fail_device_execution() which raises ASDBExecutionFailed
+        (exit code 1).
 
         This pattern allows validation workflows to complete successfully while treating
         production workflow errors as failures.
 
         :param message: Message to log and send to ASDB explaining the resolution reason
         :type message: str
-        :raises SystemExit: Always raises SystemExit (code 0 for dry_run, code 1 otherwise)
+        :raises ASDBExecutionSucceeded: For dry_run executions (exit code 0)
+        :raises ASDBExecutionFailed: For all other execution types (exit code 1)
 
         Example:
             Handle validation errors differently based on execution type::
@@ -429,9 +828,8 @@ class ASDBClient:
                     # Exits with code 0 for dry_run, code 1 for production
                     client.resolve_execution(f"Validation failed: {e}")
 
-        .. warning::
-            This method always calls sys.exit() and never returns. Consider refactoring
-            to raise exceptions instead of terminating the process.
+        .. note::
+            This method never returns normally.
 
         .. seealso::
             - :meth:`pass_device_execution` for successful completion handling
@@ -439,37 +837,39 @@ class ASDBClient:
 
         .. versionadded:: 0.1.0
         """
-        exec_type = str(self.device.get("execution_type", "")).lower()
-        if exec_type == "dry_run":
+        if self._execution_type == "dry_run":
             self.pass_device_execution(message)
         else:
             self.fail_device_execution(message)
 
-    def fail_device_execution(self, message: str) -> None:
+    def fail_device_execution(self, message: str) -> NoReturn:
         """Mark device execution as failed, update ASDB, and terminate process with error code.
 
         This method performs a complete failure workflow:
         1. Logs the error message locally
-        2. Sends the error log to ASDB
+        2. Sends the error log, together with any buffered log entries, to ASDB
         3. Updates execution log status to 'failed'
         4. Creates a failed device history record
-        5. Exits the process with code 1
+        5. Raises :class:`ASDBExecutionFailed` (exit code 1)
+
+        Steps 2-4 are sent as one request to the ``finalize/`` endpoint, falling back to
+        three concurrent requests when the server does not provide it (see :meth:`_finalize`).
+        The session is closed before the exception is raised.
 
         :param message: Error message explaining the failure reason
         :type message: str
-        :raises SystemExit: Always exits with code 1 after updating ASDB
+        :raises ASDBExecutionFailed: Always, after updating ASDB
 
         Example:
             Handle critical failure::
 
                 if not device_reachable:
                     client.fail_device_execution("Device unreachable: connection timeout")
-                # Process terminates here - code below never executes
+                # Raises ASDBExecutionFailed - code below never executes
 
-        .. warning::
-            This method always calls sys.exit(1) and never returns. This violates the
-            library design principle of exception-based error handling. Should be refactored
-            to raise ASDBError exceptions instead, letting the caller decide whether to exit.
+        .. note::
+            ``ASDBExecutionFailed`` subclasses ``SystemExit``, so the process exits with
+            code 1 unless the caller catches it.
 
         .. seealso::
             - :meth:`pass_device_execution` for successful completion
@@ -478,33 +878,34 @@ class ASDBClient:
         .. versionadded:: 0.1.0
         """
         log.error(message)
-        self.send_log(message, log_level="error")
-        exec_log_id = self.device.get("execution_log_id")
-        if exec_log_id:
-            self.update_execution_log_status(exec_log_id, "failed")
-        self.send_device_history("failed")
-        sys.exit(1)
-
-    def pass_device_execution(self, message: str, status: str = "completed") -> None:
+        self._finalize(self._exec_id, "failed", message, "error", "failed")
+        self.close()
+        raise ASDBExecutionFailed(message)
+
+    def pass_device_execution(self, message: str, status: str = "completed") -> NoReturn:
         """Mark device execution as completed, update ASDB, and terminate process successfully.
 
         This method performs a complete success workflow:
-        1. Sends the success message to ASDB as an info-level log
+        1. Sends the success message, together with any buffered log entries, to ASDB
         2. Updates execution log status (defaults to 'completed')
         3. Creates a device history record with the specified status
-        4. Exits the process with code 0
+        4. Raises :class:`ASDBExecutionSucceeded` (exit code 0)
+
+        Steps 1-3 are sent as one request to the ``finalize/`` endpoint, falling back to
+        three concurrent requests when the server does not provide it (see :meth:`_finalize`).
+        The session is closed before the exception is raised.
 
         :param message: Success message explaining the completion outcome
         :type message: str
         :param status: Execution status to set (defaults to 'completed')
         :type status: str
-        :raises SystemExit: Always exits with code 0 after updating ASDB
+        :raises ASDBExecutionSucceeded: Always, after updating ASDB
 
         Example:
             Mark successful completion::
 
                 client.pass_device_execution("Device upgrade completed successfully")
-                # Process terminates here - code below never executes
+                # Raises ASDBExecutionSucceeded - code below never executes
 
             Mark completion with custom status::
 
@@ -513,10 +914,9 @@ class ASDBClient:
                     status="validated"
                 )
 
-        .. warning::
-            This method always calls sys.exit(0) and never returns. This violates the
-            library design principle of exception-based error handling. Should be refactored
-            to return normally instead, letting the caller decide whether to exit.
+        .. note::
+            ``ASDBExecutionSucceeded`` subclasses ``SystemExit``, so the process exits with
+            code 0 unless the caller catches it.
 
         .. seealso::
             - :meth:`fail_device_execution` for failure handling
@@ -524,9 +924,6 @@ class ASDBClient:
 
         .. versionadded:: 0.1.0
         """
-        self.send_log(message, log_level="info")
-        exec_log_id = self.device.get("execution_log_id")
-        if exec_log_id:
-            self.update_execution_log_status(exec_log_id, status)
-        self.send_device_history(status)
-        sys.exit(0)
+        self._finalize(self._exec_id, status, message, "info", status)
+        self.close()
+        raise ASDBExecutionSucceeded(message)
@@ -5,9 +5,23 @@ via SFTP with MD5 checksum validation to ensure file integrity.
 
 The module implements intelligent transfer logic that skips files already present on the
 remote system with valid checksums, optimizing transfer time for large image files.
+Remote checksums are cached per device, path, size and mtime, and local images are verified
+before they are sent, so the device only has to hash a file when checking an existing copy.
+Both caches are persisted to ``SWIMLIB_HASH_CACHE`` (``~/.cache/swimlib/hashes.json`` by
+default) so later runs reuse them.
+
+Classes:
+    ImageCopyError: Raised when a local image does not match its expected checksum.
 
 Functions:
+    open_sftp: Open an SFTP session tuned for large image transfers.
+    compute_local_hash: Calculate the md5/sha256/blake3 checksum of a local file.
+    compute_local_md5: Calculate MD5 checksum of a local file.
+    compute_local_sha256: Calculate SHA256 checksum of a local file.
+    compute_remote_hash: Calculate the md5/sha256/blake3 checksum of a file on the remote device.
     compute_remote_md5: Calculate MD5 checksum of a file on the remote device.
+    compute_remote_hash_batch: Checksum several remote files with one command.
+    wants_compression: Decide whether SSH compression is worth enabling for the artifacts.
     sftp_copy_artifacts: Transfer multiple software artifacts via SFTP with validation.
 
 Example:
@@ -34,11 +48,284 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import List, Dict
+import hashlib
+import json
+import os
+import shlex
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
 import paramiko
 
+try:
+    import blake3
+except ImportError:  # optional dependency: pip install swimlib[fast]
+    blake3 = None
+
+# SSH channel tuning applied before the SFTP session is opened
+_SFTP_WINDOW_SIZE = 2**27
+_SFTP_MAX_PACKET_SIZE = 2**19
+# bytes read from the local image per SFTP write
+_SFTP_CHUNK_SIZE = 2**20
+# payload per SFTP WRITE request; OpenSSH's sftp-server caps messages at 256 KiB, so use the
+# 255 KiB it advertises as its write limit instead of paramiko's protocol-minimum 32 KiB
+_SFTP_REQUEST_SIZE = 255 * 1024
+# artifacts transferred at once, each on its own SFTP channel over the shared transport
+_MAX_PARALLEL_TRANSFERS = 4
+
+# remote command printing "<digest>  <path>" for each supported artifact hash_algo
+_REMOTE_HASH_COMMANDS = {"md5": "md5sum", "sha256": "sha256sum", "blake3": "b3sum"}
+
+# extended attribute recording "<digest> <st_size> <st_mtime>" on each uploaded image
+_XATTR_PREFIX = "user.swimlib."
+
+# SFTP session kept open per SSH client for repeated sftp_copy_artifacts calls
+_shared_sessions: "weakref.WeakKeyDictionary[paramiko.SSHClient, paramiko.SFTPClient]" = weakref.WeakKeyDictionary()
+
+# artifacts already compressed on disk; zlib on the SSH transport only costs CPU for these
+_PRECOMPRESSED_SUFFIXES = (".iso", ".zip")
+
+# remote digests, keyed by (peer address, remote path, st_size, st_mtime, algo)
+_digest_cache: Dict[Tuple, str] = {}
+# local digests, keyed by (real path, st_size, st_mtime_ns, algo)
+_local_digest_cache: Dict[Tuple, str] = {}
+
+# on-disk copy of both digest caches so re-runs skip rehashing unchanged images; "" disables
+_HASH_CACHE_PATH = os.getenv(
+    "SWIMLIB_HASH_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "swimlib", "hashes.json")
+)
+# newest entries kept per cache when writing the file
+_HASH_CACHE_MAX_ENTRIES = 1024
+_hash_cache_lock = threading.Lock()
+_hash_cache_loaded = False
+
+
+class ImageCopyError(Exception):
+    """Custom exception raised when a local image does not match its expected checksum.
+
+    This is an explicit exception rather than an ``assert`` so integrity validation still
+    runs under ``python -O``.
+
+    Example:
+        Handle a corrupt local image::
+
+            from swimlib.f5.actions.image_copy import sftp_copy_artifacts, ImageCopyError
+
+            try:
+                sftp_copy_artifacts(ssh_client, artifacts, "/shared/images")
+            except ImageCopyError as e:
+                print(f"Copy aborted: {e}")
+
+    .. versionadded:: 0.1.0
+    """
+    pass
+
+
+def _digest_cache_key(
+    ssh_client: paramiko.SSHClient, remote_path: str, attrs: paramiko.SFTPAttributes, algo: str
+) -> Tuple:
+    peer = ssh_client.get_transport().getpeername()
+    return (peer, remote_path, attrs.st_size, attrs.st_mtime, algo)
+
+
+def _load_hash_cache() -> None:
+    """Merge the on-disk digest caches into memory, once per process."""
+    global _hash_cache_loaded
+    if _hash_cache_loaded:
+        return
+    with _hash_cache_lock:
+        if _hash_cache_loaded:
+            return
+        _hash_cache_loaded = True
+        if not _HASH_CACHE_PATH:
+            return
+        try:
+            with open(_HASH_CACHE_PATH) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for peer, *key, digest in data.get("remote", []):
+            peer = tuple(peer) if isinstance(peer, list) else peer
+            _digest_cache.setdefault((peer, *key), digest)
+        for *key, digest in data.get("local", []):
+            _local_digest_cache.setdefault(tuple(key), digest)
+
+
+def _save_hash_cache() -> None:
+    """Write the newest digest cache entries to disk, replacing the file atomically."""
+    if not _HASH_CACHE_PATH:
+        return
+    with _hash_cache_lock:
+        data = {
+            "remote": [[*k, v] for k, v in list(_digest_cache.items())[-_HASH_CACHE_MAX_ENTRIES:]],
+            "local": [[*k, v] for k, v in list(_local_digest_cache.items())[-_HASH_CACHE_MAX_ENTRIES:]],
+        }
+        tmp_path = f"{_HASH_CACHE_PATH}.{os.getpid()}.tmp"
+        try:
+            directory = os.path.dirname(_HASH_CACHE_PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, _HASH_CACHE_PATH)
+        except OSError:
+            pass  # an unwritable cache only costs a rehash on the next run
+
+
+def _put_pipelined(
+    sftp: paramiko.SFTPClient,
+    local_path: str,
+    remote_path: str,
+    hasher: Optional[Any] = None,
+    mode: str = "wb",
+) -> paramiko.SFTPAttributes:
+    """Upload ``local_path`` with pipelined 1 MiB writes and confirm the remote size.
+
+    When ``hasher`` is given, every chunk sent is also fed to it, so the local digest is
+    computed in the same read pass as the upload. The size check reuses the open handle
+    (one fstat) instead of the extra path ``stat`` that ``sftp.put(confirm=True)`` issues,
+    and its attributes key the digest cache. Pass ``mode="r+b"`` to write into a file
+    already preallocated at the right size without truncating it.
+    """
+    with open(local_path, "rb") as src, sftp.file(remote_path, mode) as dst:
+        dst.MAX_REQUEST_SIZE = _SFTP_REQUEST_SIZE
+        dst.set_pipelined(True)
+        while chunk := src.read(_SFTP_CHUNK_SIZE):
+            if hasher is not None:
+                hasher.update(chunk)
+            dst.write(chunk)
+        dst.flush()
+        attrs = dst.stat()
+        size = os.fstat(src.fileno()).st_size
+    if attrs.st_size != size:
+        raise IOError(f"size mismatch in put!  {attrs.st_size} != {size}")
+    return attrs
+
+
+def _local_digest_key(local_path: str, algo: str) -> Tuple:
+    st = os.stat(local_path)
+    return (os.path.realpath(local_path), st.st_size, st.st_mtime_ns, algo)
+
+
+def _new_hasher(algo: str) -> Any:
+    """Return an incremental hash object for ``algo``, as used by :func:`compute_local_hash`."""
+    if algo == "blake3":
+        if blake3 is None:
+            raise ImportError("blake3 hashing requires the blake3 package (pip install swimlib[fast])")
+        return blake3.blake3()
+    return hashlib.new(algo)
+
+
+def compute_local_hash(local_path: str, algo: str = "md5") -> str:
+    """Compute the checksum of a local file with the given algorithm.
+
+    ``blake3`` uses the optional :mod:`blake3` package, which memory-maps the file and
+    hashes it on all cores with SIMD. Other algorithms stream the file through
+    :func:`hashlib.file_digest`. Memory use stays bounded regardless of image size.
+    Digests are cached by path, size and mtime, across runs when ``SWIMLIB_HASH_CACHE``
+    is enabled.
+
+    :param local_path: Path to the local file
+    :type local_path: str
+    :param algo: ``"md5"``, ``"sha256"``, ``"blake3"`` or any :mod:`hashlib` algorithm name
+    :type algo: str
+    :return: Hexadecimal digest string
+    :rtype: str
+    :raises FileNotFoundError: If the local file does not exist
+    :raises ImportError: If ``algo`` is ``"blake3"`` and the blake3 package is not installed
+
+    .. versionadded:: 0.1.0
+    """
+    if algo == "blake3" and blake3 is None:
+        raise ImportError("blake3 hashing requires the blake3 package (pip install swimlib[fast])")
+    _load_hash_cache()
+    key = _local_digest_key(local_path, algo)
+    if key in _local_digest_cache:
+        return _local_digest_cache[key]
+    if algo == "blake3":
+        digest = blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(local_path).hexdigest()
+    else:
+        with open(local_path, "rb") as f:
+            digest = hashlib.file_digest(f, algo).hexdigest()
+    _local_digest_cache[key] = digest
+    return digest
+
+
+def compute_local_md5(local_path: str) -> str:
+    """Compute MD5 checksum of a local file, streaming it in chunks.
+
+    Memory use stays bounded by the read chunk size regardless of image size.
+
+    :param local_path: Path to the local file
+    :type local_path: str
+    :return: 32-character hexadecimal MD5 checksum string
+    :rtype: str
+    :raises FileNotFoundError: If the local file does not exist
+
+    .. versionadded:: 0.1.0
+    """
+    return compute_local_hash(local_path, "md5")
+
+
+def compute_local_sha256(local_path: str) -> str:
+    """Compute SHA256 checksum of a local file.
+
+    Hashing runs in :func:`hashlib.file_digest`'s C loop on OpenSSL's SHA-256, which uses the
+    SHA-NI or ARMv8 crypto instructions where the CPU has them.
+
+    :param local_path: Path to the local file
+    :type local_path: str
+    :return: 64-character hexadecimal SHA256 checksum string
+    :rtype: str
+    :raises FileNotFoundError: If the local file does not exist
+
+    .. versionadded:: 0.1.0
+    """
+    return compute_local_hash(local_path, "sha256")
+
+
+def compute_remote_hash(
+    ssh_client: paramiko.SSHClient,
+    remote_path: str,
+    algo: str = "md5",
+    attrs: Optional[paramiko.SFTPAttributes] = None,
+) -> str:
+    """Compute the checksum of a file on the remote device with the given algorithm.
+
+    :param ssh_client: Connected paramiko SSHClient instance
+    :type ssh_client: paramiko.SSHClient
+    :param remote_path: Absolute path to the file on the remote device
+    :type remote_path: str
+    :param algo: ``"md5"`` (``md5sum``), ``"sha256"`` (``sha256sum``) or ``"blake3"`` (``b3sum``)
+    :type algo: str
+    :param attrs: ``sftp.stat()`` result for ``remote_path``. When given, the checksum is
+        cached by device, path, size, mtime and algorithm, and reused while those are unchanged.
+    :type attrs: paramiko.SFTPAttributes | None
+    :return: Hexadecimal digest string, or ``""`` if the device produced no output (for
+        example because the hash command is not installed)
+    :rtype: str
 
-def compute_remote_md5(ssh_client: paramiko.SSHClient, remote_path: str) -> str:
+    .. versionadded:: 0.1.0
+    """
+    _load_hash_cache()
+    key = _digest_cache_key(ssh_client, remote_path, attrs, algo) if attrs is not None else None
+    if key is not None and key in _digest_cache:
+        return _digest_cache[key]
+    stdin, stdout, stderr = ssh_client.exec_command(f"{_REMOTE_HASH_COMMANDS[algo]} {remote_path}")
+    fields = stdout.read().decode().strip().split()
+    digest = fields[0] if fields else ""
+    if key is not None and digest:
+        _digest_cache[key] = digest
+    return digest
+
+
+def compute_remote_md5(
+    ssh_client: paramiko.SSHClient,
+    remote_path: str,
+    attrs: Optional[paramiko.SFTPAttributes] = None,
+) -> str:
     """Compute MD5 checksum of a file on the remote F5 BIG-IP device.
 
     Executes the ``md5sum`` command on the remote device and parses the output to extract
@@ -48,6 +335,9 @@ def compute_remote_md5(ssh_client: paramiko.SSHClient, remote_path: str) -> str:
     :type ssh_client: paramiko.SSHClient
     :param remote_path: Absolute path to the file on the remote device
     :type remote_path: str
+    :param attrs: ``sftp.stat()`` result for ``remote_path``. When given, the checksum is
+        cached by device, path, size and mtime, and reused while those are unchanged.
+    :type attrs: paramiko.SFTPAttributes | None
     :return: 32-character hexadecimal MD5 checksum string
     :rtype: str
 
@@ -67,33 +357,271 @@ def compute_remote_md5(ssh_client: paramiko.SSHClient, remote_path: str) -> str:
 
     .. versionadded:: 0.1.0
     """
-    stdin, stdout, stderr = ssh_client.exec_command(f"md5sum {remote_path}")
-    return stdout.read().decode().strip().split()[0]
+    return compute_remote_hash(ssh_client, remote_path, "md5", attrs)
+
+
+def compute_remote_hash_batch(
+    ssh_client: paramiko.SSHClient,
+    remote_paths: List[str],
+    algo: str = "md5",
+    attrs: Optional[List[paramiko.SFTPAttributes]] = None,
+) -> Dict[str, str]:
+    """Compute the checksums of several remote files with a single hash command.
+
+    One ``exec_command`` hashes every uncached path, instead of one channel round trip
+    per file.
+
+    :param ssh_client: Connected paramiko SSHClient instance
+    :type ssh_client: paramiko.SSHClient
+    :param remote_paths: Absolute paths of the files on the remote device
+    :type remote_paths: List[str]
+    :param algo: ``"md5"``, ``"sha256"`` or ``"blake3"``, as for :func:`compute_remote_hash`
+    :type algo: str
+    :param attrs: ``sftp.stat()`` results matching ``remote_paths`` one to one. When given,
+        checksums are cached as in :func:`compute_remote_hash`.
+    :type attrs: List[paramiko.SFTPAttributes] | None
+    :return: Mapping of remote path to hexadecimal digest. Paths the device produced no
+        digest for (missing file or hash command) are left out.
+    :rtype: Dict[str, str]
 
+    .. versionadded:: 0.1.0
+    """
+    _load_hash_cache()
+    digests: Dict[str, str] = {}
+    keys: Dict[str, Optional[Tuple]] = {}
+    for index, remote_path in enumerate(remote_paths):
+        if attrs is None:
+            keys[remote_path] = None
+            continue
+        key = _digest_cache_key(ssh_client, remote_path, attrs[index], algo)
+        if key in _digest_cache:
+            digests[remote_path] = _digest_cache[key]
+        else:
+            keys[remote_path] = key
+    if not keys:
+        return digests
+
+    paths = " ".join(shlex.quote(path) for path in keys)
+    stdin, stdout, stderr = ssh_client.exec_command(f"{_REMOTE_HASH_COMMANDS[algo]} {paths}")
+    for line in stdout.read().decode().splitlines():
+        fields = line.split(maxsplit=1)
+        if len(fields) != 2 or fields[1] not in keys:
+            continue
+        digest = fields[0]
+        digests[fields[1]] = digest
+        cache_key = keys[fields[1]]
+        if cache_key is not None:
+            _digest_cache[cache_key] = digest
+    return digests
+
+
+def _artifact_hash_algo(artifact: Dict) -> str:
+    """Return the artifact's ``hash_algo``, else the fastest digest it carries: blake3 (when
+    the package is installed), then sha256, then md5."""
+    if "hash_algo" in artifact:
+        return artifact["hash_algo"]
+    if "blake3" in artifact and blake3 is not None:
+        return "blake3"
+    return "sha256" if "sha256" in artifact else "md5"
+
+
+def _expected_size(artifact: Dict) -> Optional[int]:
+    """Return the artifact's ``size``, or the local image's size when present, else None."""
+    if "size" in artifact:
+        return artifact["size"]
+    try:
+        return os.path.getsize(artifact["local_path"])
+    except OSError:
+        return None
+
+
+def _read_xattr_digests(
+    ssh_client: paramiko.SSHClient, remote_paths: List[str], attrs: List[paramiko.SFTPAttributes], algo: str
+) -> None:
+    """Seed the digest cache from the xattrs written at upload time, with one ``getfattr``.
+
+    A digest is only trusted while the file's size and mtime still match those recorded
+    next to it. Paths already cached are not queried; a device without ``getfattr`` (or a
+    filesystem without user xattrs) yields no output and the caller hashes as usual.
+    """
+    _load_hash_cache()
+    keys = {}
+    for remote_path, file_attrs in zip(remote_paths, attrs):
+        key = _digest_cache_key(ssh_client, remote_path, file_attrs, algo)
+        if key not in _digest_cache:
+            keys[remote_path] = (key, f"{file_attrs.st_size} {file_attrs.st_mtime}")
+    if not keys:
+        return
+
+    name = f"{_XATTR_PREFIX}{algo}"
+    paths = " ".join(shlex.quote(path) for path in keys)
+    stdin, stdout, stderr = ssh_client.exec_command(f"getfattr --absolute-names -n {name} {paths}")
+    current = None
+    for line in stdout.read().decode().splitlines():
+        if line.startswith("# file: "):
+            current = line[len("# file: "):]
+        elif current in keys and line.startswith(f"{name}="):
+            digest, _, stamp = line[len(name) + 1:].strip('"').partition(" ")
+            key, expected_stamp = keys[current]
+            if digest and stamp == expected_stamp:
+                _digest_cache[key] = digest
+
+
+def _write_xattr_digest(
+    ssh_client: paramiko.SSHClient, remote_path: str, attrs: paramiko.SFTPAttributes, algo: str, digest: str
+) -> None:
+    """Record ``digest`` with the file's size and mtime as an xattr, ignoring failures."""
+    value = shlex.quote(f"{digest} {attrs.st_size} {attrs.st_mtime}")
+    cmd = f"setfattr -n {_XATTR_PREFIX}{algo} -v {value} {shlex.quote(remote_path)}"
+    stdin, stdout, stderr = ssh_client.exec_command(cmd)
+    stdout.channel.recv_exit_status()
+
+
+def _artifacts_to_copy(ssh_client: paramiko.SSHClient, sftp: paramiko.SFTPClient, artifacts: List[Dict]) -> List[Dict]:
+    """Return the artifacts without a valid remote copy, hashing existing files in batches.
+
+    Existing files whose size differs from the expected one are queued without hashing.
+    The others are first looked up in the xattrs left by earlier uploads, then the rest
+    are hashed with one command per ``hash_algo``. Paths the device could not hash that way
+    (command missing) are re-checked with one batched ``md5sum`` when the artifact also
+    carries an md5.
+    """
+    existing = {}
+    pending = []
+    for artifact in artifacts:
+        try:
+            attrs = sftp.stat(artifact["remote_path"])
+        except FileNotFoundError:
+            pending.append(artifact)
+            continue
+        # a remote copy of the wrong size cannot match; don't make the device hash it
+        size = _expected_size(artifact)
+        if size is not None and attrs.st_size != size:
+            pending.append(artifact)
+        else:
+            existing[artifact["remote_path"]] = (artifact, attrs)
+
+    unresolved = {}
+    for algo in dict.fromkeys(_artifact_hash_algo(a) for a, _ in existing.values()):
+        group = {p: e for p, e in existing.items() if _artifact_hash_algo(e[0]) == algo}
+        _read_xattr_digests(ssh_client, list(group), [e[1] for e in group.values()], algo)
+        digests = compute_remote_hash_batch(ssh_client, list(group), algo, [e[1] for e in group.values()])
+        for remote_path, (artifact, attrs) in group.items():
+            if remote_path in digests:
+                if digests[remote_path] != artifact[algo]:
+                    pending.append(artifact)
+            elif algo != "md5" and "md5" in artifact:
+                unresolved[remote_path] = (artifact, attrs)
+            else:
+                pending.append(artifact)
+
+    # hash command missing on the device; use md5sum for artifacts that also carry an md5
+    if unresolved:
+        digests = compute_remote_hash_batch(ssh_client, list(unresolved), "md5", [e[1] for e in unresolved.values()])
+        pending.extend(a for p, (a, _) in unresolved.items() if digests.get(p) != a["md5"])
+
+    # keep the caller's artifact order
+    pending_ids = {id(a) for a in pending}
+    return [a for a in artifacts if id(a) in pending_ids]
+
+
+def wants_compression(artifacts: List[Dict]) -> bool:
+    """Return True if any artifact would benefit from SSH transport compression.
+
+    ISO and zip images are already compressed, so zlib is only worth its CPU cost when
+    some artifact is not one of those.
+
+    :param artifacts: Artifact dictionaries containing 'remote_path'
+    :type artifacts: List[Dict[str, str]]
+    :return: Whether to request compression when connecting
+    :rtype: bool
 
-def sftp_copy_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], remote_folder: str) -> None:
+    .. versionadded:: 0.1.0
+    """
+    return any(not a["remote_path"].lower().endswith(_PRECOMPRESSED_SUFFIXES) for a in artifacts)
+
+
+def open_sftp(ssh_client: paramiko.SSHClient) -> paramiko.SFTPClient:
+    """Open an SFTP session with a large channel window and packet size for image transfers.
+
+    The tuning must be applied before the SFTP channel is opened, so use this instead of
+    ``ssh_client.open_sftp()`` when the session will carry multi-GB images.
+
+    :param ssh_client: Connected paramiko SSHClient instance
+    :type ssh_client: paramiko.SSHClient
+    :return: Open SFTP client; the caller is responsible for closing it
+    :rtype: paramiko.SFTPClient
+
+    .. versionadded:: 0.1.0
+    """
+    transport = ssh_client.get_transport()
+    transport.default_window_size = _SFTP_WINDOW_SIZE
+    transport.default_max_packet_size = _SFTP_MAX_PACKET_SIZE
+    return ssh_client.open_sftp()
+
+
+def _shared_sftp(ssh_client: paramiko.SSHClient) -> paramiko.SFTPClient:
+    """Return the SFTP session cached for ``ssh_client``, opening one if needed.
+
+    The session lives as long as the SSH connection; closing the client closes it.
+    """
+    sftp = _shared_sessions.get(ssh_client)
+    if sftp is None or sftp.get_channel().closed:
+        sftp = _shared_sessions[ssh_client] = open_sftp(ssh_client)
+    return sftp
+
+
+def sftp_copy_artifacts(
+    ssh_client: paramiko.SSHClient,
+    artifacts: List[Dict],
+    remote_folder: str,
+    sftp: Optional[paramiko.SFTPClient] = None,
+    max_workers: int = _MAX_PARALLEL_TRANSFERS,
+) -> None:
     """Copy software artifacts to remote device via SFTP with MD5 checksum validation.
 
     This function transfers multiple software artifacts (ISO files, qcow2 archives) to a
     remote F5 BIG-IP device using SFTP. It implements intelligent skip logic: if a file
     already exists on the remote system with a matching MD5 checksum, the transfer is skipped.
 
-    For each artifact, the function:
-    1. Checks if the file already exists remotely
-    2. If it exists, verifies the MD5 checksum
-    3. Skips transfer if checksum matches, otherwise proceeds
-    4. Transfers the file via SFTP
-    5. Validates the transferred file's checksum
-    6. Raises AssertionError if validation fails
+    The function:
+    1. Checks which artifacts already exist remotely
+    2. Hashes the existing ones of the expected size with one command per checksum algorithm
+    3. Skips artifacts whose checksum matches; the rest are transferred
+    4. Validates the checksum of the local source, raising ImageCopyError if it does not
+       match. A digest cached from an earlier run is checked before sending anything;
+       otherwise the image is hashed as it is uploaded and the remote copy is removed
+       on mismatch
+    5. Preallocates the remote file with ``fallocate`` where supported, so the image is laid
+       out contiguously for the install that reads it, then transfers it via SFTP with
+       pipelined writes and confirms the remote size
+    6. Records the checksum in a ``user.swimlib.<algo>`` xattr on the remote file, so a later
+       check from any host can skip rehashing it
 
     :param ssh_client: Connected paramiko SSHClient instance for SFTP operations
     :type ssh_client: paramiko.SSHClient
-    :param artifacts: List of artifact dictionaries, each containing 'local_path', 'remote_path', and 'md5' keys
+    :param artifacts: List of artifact dictionaries, each containing 'local_path', 'remote_path', and 'md5' keys.
+        An optional 'hash_algo' ('md5', 'sha256' or 'blake3') selects the checksum, read from
+        the key of the same name; when the device lacks the matching command the 'md5' is used.
+        Without 'hash_algo', a 'blake3' value is preferred when the blake3 package is installed,
+        then 'sha256' over 'md5', since SHA-256 is faster than MD5 on CPUs with SHA extensions.
+        An optional 'size' (bytes, defaulting to the size of 'local_path') lets remote copies
+        of the wrong size be replaced without hashing them first.
     :type artifacts: List[Dict[str, str]]
     :param remote_folder: Remote folder path (for reference, not currently used in path construction)
     :type remote_folder: str
-    :raises AssertionError: If post-transfer MD5 checksum does not match expected value
+    :param sftp: Already open SFTP session to reuse (see :func:`open_sftp`). It is left open
+        and artifacts are copied over it one at a time. When omitted, a session cached on
+        ``ssh_client`` probes for existing copies (and carries a lone transfer); it stays open
+        for later calls and closes with the SSH connection. Concurrent transfers each get
+        their own session, opened and closed around the transfer, up to ``max_workers`` at once.
+    :type sftp: paramiko.SFTPClient | None
+    :param max_workers: Upper bound on concurrent transfers when ``sftp`` is omitted (default: 4).
+        The first transfer error is re-raised once the running transfers have finished.
+    :type max_workers: int
+    :raises ImageCopyError: If the local artifact's checksum does not match the expected value
     :raises FileNotFoundError: If local artifact file does not exist
+    :raises IOError: If the remote file size does not match the local file after transfer
 
     Example:
         Transfer multiple artifacts with validation::
@@ -115,7 +643,10 @@ def sftp_copy_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], r
 
     Note:
         Large ISO files (several GB) may take significant time to transfer. The skip
-        logic prevents redundant transfers in retry scenarios.
+        logic prevents redundant transfers in retry scenarios, and checksums are persisted
+        to ``SWIMLIB_HASH_CACHE`` so a re-run only stats unchanged images. Without a shared ``sftp``,
+        transfers run on worker threads, each on its own channel of the same SSH transport,
+        so an ISO, a hotfix and a qcow2 archive overlap instead of queueing.
 
     See Also:
         - :func:`compute_remote_md5` for checksum calculation
@@ -123,24 +654,64 @@ def sftp_copy_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], r
 
     .. versionadded:: 0.1.0
     """
-    sftp = ssh_client.open_sftp()
-
-    for artifact in artifacts:
-        local_path = artifact["local_path"]
-        remote_path = artifact["remote_path"]
-        expected_md5 = artifact["md5"]
-
-        # Skip if file exists with valid checksum
-        try:
-            sftp.stat(remote_path)
-            if compute_remote_md5(ssh_client, remote_path) == expected_md5:
-                continue
-        except FileNotFoundError:
-            pass
-
-        # Transfer and validate
-        sftp.put(local_path, remote_path)
-        remote_md5 = compute_remote_md5(ssh_client, remote_path)
-        assert remote_md5 == expected_md5, f"MD5 mismatch: {remote_path}"
-
-    sftp.close()
+    shared = sftp is None
+    if shared:
+        sftp = _shared_sftp(ssh_client)
+    try:
+        pending = _artifacts_to_copy(ssh_client, sftp, artifacts)
+        workers = min(max_workers, len(pending))
+        if not shared or workers <= 1:
+            for artifact in pending:
+                _transfer_artifact(ssh_client, sftp, artifact)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda artifact: _transfer_on_own_session(ssh_client, artifact), pending))
+    finally:
+        _save_hash_cache()
+
+
+def _preallocate(ssh_client: paramiko.SSHClient, remote_path: str, size: int) -> bool:
+    """Reserve ``size`` bytes of contiguous extents for ``remote_path`` with ``fallocate``.
+
+    Any existing file is emptied first so no stale tail survives. Returns False when the
+    device or filesystem cannot preallocate, in which case the upload truncates as usual.
+    """
+    path = shlex.quote(remote_path)
+    stdin, stdout, stderr = ssh_client.exec_command(f": > {path} && fallocate -l {size} {path}")
+    return stdout.channel.recv_exit_status() == 0
+
+
+def _transfer_artifact(ssh_client: paramiko.SSHClient, sftp: paramiko.SFTPClient, artifact: Dict) -> None:
+    """Verify the local image and upload it over ``sftp``."""
+    local_path = artifact["local_path"]
+    remote_path = artifact["remote_path"]
+    algo = _artifact_hash_algo(artifact)
+    expected = artifact[algo]
+
+    _load_hash_cache()
+    local_key = _local_digest_key(local_path, algo)
+    cached = _local_digest_cache.get(local_key)
+    # Already hashed: validate the source before spending a multi-GB transfer on it
+    if cached is not None and cached != expected:
+        raise ImageCopyError(f"{algo.upper()} mismatch: {local_path}: got {cached} expected {expected}")
+
+    # Otherwise hash while uploading, so the image is read once; a corrupt image is not kept
+    hasher = _new_hasher(algo) if cached is None else None
+    mode = "r+b" if _preallocate(ssh_client, remote_path, local_key[1]) else "wb"
+    attrs = _put_pipelined(sftp, local_path, remote_path, hasher, mode)
+    if hasher is not None:
+        digest = _local_digest_cache[local_key] = hasher.hexdigest()
+        if digest != expected:
+            sftp.remove(remote_path)
+            raise ImageCopyError(f"{algo.upper()} mismatch: {local_path}: got {digest} expected {expected}")
+    _digest_cache[_digest_cache_key(ssh_client, remote_path, attrs, algo)] = expected
+    _write_xattr_digest(ssh_client, remote_path, attrs, algo, expected)
+
+
+def _transfer_on_own_session(ssh_client: paramiko.SSHClient, artifact: Dict) -> None:
+    """Upload one artifact over a dedicated SFTP session, closing it afterwards."""
+    sftp = open_sftp(ssh_client)
+    try:
+        _transfer_artifact(ssh_client, sftp, artifact)
+    finally:
+        sftp.close()
@@ -8,9 +8,13 @@ Software staging is the process of installing new software to an inactive volume
 rebooting the device. The device continues running on its current volume while the new
 software is prepared on an alternate volume.
 
+Classes:
+    ImageStageError: Raised when a software install command fails.
+
 Functions:
     get_current_version: Retrieve the currently running software version.
     get_target_volume: Determine which volume to use for software installation.
+    get_version_and_target_volume: Fetch both of the above in one SSH round trip.
     stage_artifacts: Install software artifacts to the target volume.
 
 Example:
@@ -32,9 +36,35 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import List, Dict
+import shlex
+from typing import List, Dict, Tuple
 import paramiko
 
+_CMD_SHOW_VERSION = "tmsh show sys version"
+_CMD_SHOW_SOFTWARE_STATUS = "tmsh show sys software status"
+# both queries in one tmsh process; tmsh startup dominates the cost of each show command
+_CMD_SHOW_VERSION_AND_SOFTWARE_STATUS = 'tmsh -c "show sys version; show sys software status"'
+# prefixes the "<exit status> <image path>" line each backgrounded install prints
+_INSTALL_STATUS_MARKER = "SWIMLIB_INSTALL_RC"
+
+
+class ImageStageError(Exception):
+    """Custom exception raised when a ``tmsh install`` command exits non-zero.
+
+    Example:
+        Handle a failed install::
+
+            from swimlib.f5.actions.image_stage import stage_artifacts, ImageStageError
+
+            try:
+                stage_artifacts(ssh_client, artifacts, "21.0.0")
+            except ImageStageError as e:
+                print(f"Staging failed: {e}")
+
+    .. versionadded:: 0.1.0
+    """
+    pass
+
 
 def get_current_version(ssh_client: paramiko.SSHClient) -> str:
     """Retrieve the currently running software version from an F5 BIG-IP device.
@@ -59,13 +89,13 @@ def get_current_version(ssh_client: paramiko.SSHClient) -> str:
                 print("Already on target version, skipping upgrade")
 
     Note:
-        The parsing logic extracts the second field from the "Product" line using awk.
+        The output is parsed locally: the second field of the "Version" line. No shell
+        pipeline runs on the device.
 
     .. versionadded:: 0.1.0
     """
-    cmd = "tmsh show sys version | grep Product | awk '{print $2}'"
-    stdin, stdout, stderr = ssh_client.exec_command(cmd)
-    return stdout.read().decode().strip()
+    stdin, stdout, stderr = ssh_client.exec_command(_CMD_SHOW_VERSION)
+    return _parse_version(stdout.read().decode())
 
 
 def get_target_volume(ssh_client: paramiko.SSHClient) -> str:
@@ -89,24 +119,60 @@ def get_target_volume(ssh_client: paramiko.SSHClient) -> str:
             print(f"Installing to volume: {target_vol}")
 
     Note:
-        The query uses ``tmsh show sys software status`` and filters for volumes marked
-        as inactive (not marked "yes" in the status output).
+        The query uses ``tmsh show sys software status`` and picks the first ``HD`` volume
+        not marked active ("yes") in the status output. Parsing happens locally.
+
+    .. versionadded:: 0.1.0
+    """
+    stdin, stdout, stderr = ssh_client.exec_command(_CMD_SHOW_SOFTWARE_STATUS)
+    return _parse_target_volume(stdout.read().decode())
+
+
+def get_version_and_target_volume(ssh_client: paramiko.SSHClient) -> Tuple[str, str]:
+    """Retrieve the running version and the target volume in one SSH round trip.
+
+    Both queries run as sub-commands of a single ``tmsh -c`` invocation, so the device
+    starts one tmsh process over one SSH channel. The version and software status
+    tables are told apart by their row labels when parsed locally.
+
+    :param ssh_client: Connected paramiko SSHClient instance
+    :type ssh_client: paramiko.SSHClient
+    :return: ``(current_version, target_volume)``, e.g. ``("17.1.1", "HD1.2")``
+    :rtype: Tuple[str, str]
 
     .. versionadded:: 0.1.0
     """
-    cmd = "tmsh show sys software status | grep -v yes | grep HD | head -1 | awk '{print $1}'"
-    stdin, stdout, stderr = ssh_client.exec_command(cmd)
-    return stdout.read().decode().strip()
+    stdin, stdout, stderr = ssh_client.exec_command(_CMD_SHOW_VERSION_AND_SOFTWARE_STATUS)
+    out = stdout.read().decode()
+    return _parse_version(out), _parse_target_volume(out)
 
 
-def stage_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], target_version: str) -> None:
+def _parse_version(output: str) -> str:
+    """Return the second field of the ``Version`` line of ``tmsh show sys version``."""
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) > 1 and fields[0] == "Version":
+            return fields[1]
+    return ""
+
+
+def _parse_target_volume(output: str) -> str:
+    """Return the first ``HD`` volume not marked active in ``tmsh show sys software status``."""
+    for line in output.splitlines():
+        fields = line.split()
+        if fields and fields[0].startswith("HD") and "yes" not in fields:
+            return fields[0]
+    return ""
+
+
+def stage_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], target_version: str) -> str:
     """Install software artifacts to the target volume on an F5 BIG-IP device.
 
     This function performs the software staging process by:
-    1. Checking if the device is already running the target version (skip if true)
-    2. Determining the target (inactive) volume
-    3. Installing each artifact to the target volume using TMSH commands
-    4. Waiting for each installation to complete before proceeding
+    1. Querying the running version and the target (inactive) volume in one round trip
+    2. Skipping the install if the device is already running the target version
+    3. Starting the TMSH install for every artifact as a background job of one remote shell
+    4. Waiting for all installations to complete and checking each reported exit status
 
     The installation does not reboot the device. The device continues running on its
     current volume. A separate reboot operation is required to activate the new software.
@@ -117,6 +183,10 @@ def stage_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], targe
     :type artifacts: List[Dict[str, str]]
     :param target_version: Target software version string (e.g., "21.0.0")
     :type target_version: str
+    :return: The target (inactive) volume found by the staging query, e.g. ``"HD1.2"``, so
+        the reboot step can reuse it without querying the device again
+    :rtype: str
+    :raises ImageStageError: If any install command exits with a non-zero status
 
     Example:
         Stage multiple artifacts on inactive volume::
@@ -130,9 +200,10 @@ def stage_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], targe
             print("Software staged - reboot required to activate")
 
     Note:
-        Installation operations can take several minutes per artifact. The function
-        waits for each install command to complete (channel.recv_exit_status()) before
-        proceeding to the next artifact.
+        Installation operations can take several minutes per artifact. All install
+        commands run concurrently from a single ``exec_command``, so the whole stage costs
+        two SSH channels (query and installs) and takes as long as the slowest install
+        rather than the sum.
 
     Warning:
         If the device is already running the target version, this function returns
@@ -140,19 +211,49 @@ def stage_artifacts(ssh_client: paramiko.SSHClient, artifacts: List[Dict], targe
         but may skip necessary reinstallations in some scenarios.
 
     See Also:
-        - :func:`get_current_version` for version checking
-        - :func:`get_target_volume` for volume selection
+        - :func:`get_version_and_target_volume` for version checking and volume selection
         - :func:`swimlib.f5.actions.image_upgrade.upgrade_to_volume` for reboot operation
 
     .. versionadded:: 0.1.0
     """
-    # Skip if already on target version
-    if get_current_version(ssh_client) == target_version:
-        return
+    # Version and volume share one channel; skip if already on target version
+    current_version, target_volume = get_version_and_target_volume(ssh_client)
+    if current_version == target_version or not artifacts:
+        return target_volume
 
-    target_volume = get_target_volume(ssh_client)
+    # One shell runs every install in the background and reports each exit status
+    stdin, stdout, stderr = ssh_client.exec_command(_install_script(artifacts, target_volume))
+    statuses = _parse_install_statuses(stdout.read().decode())
 
+    failed = []
+    for artifact in artifacts:
+        status = statuses.get(artifact["remote_path"], "unknown")
+        if status != "0":
+            failed.append(f"{artifact['remote_path']} (exit {status})")
+    if failed:
+        raise ImageStageError(f"Install failed on {target_volume}: {', '.join(failed)}")
+    return target_volume
+
+
+def _install_script(artifacts: List[Dict], target_volume: str) -> str:
+    """Compose one shell command that runs all installs concurrently and waits for them."""
+    volume = shlex.quote(target_volume)
+    jobs = []
     for artifact in artifacts:
-        cmd = f"tmsh install sys software image {artifact['remote_path']} volume {target_volume}"
-        stdin, stdout, stderr = ssh_client.exec_command(cmd)
-        stdout.channel.recv_exit_status()  # Wait for completion
+        image = shlex.quote(artifact["remote_path"])
+        jobs.append(
+            f"(tmsh install sys software image {image} volume {volume}; "
+            f"echo {_INSTALL_STATUS_MARKER} $? {image}) &"
+        )
+    return " ".join(jobs) + " wait"
+
+
+def _parse_install_statuses(output: str) -> Dict[str, str]:
+    """Map each image path to the exit status its install reported."""
+    statuses = {}
+    for line in output.splitlines():
+        marker, _, rest = line.partition(" ")
+        if marker == _INSTALL_STATUS_MARKER:
+            status, _, remote_path = rest.partition(" ")
+            statuses[remote_path] = status
+    return statuses
@@ -2,9 +2,9 @@
 
 import os
 import logging
+import functools
 from swimlib.software_matrix import software_matrix
 
-logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 
 
@@ -13,6 +13,22 @@ class SoftwareLookupException(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def _folder_entries(folder: str) -> frozenset:
+    """List a local image folder once per process; one directory read covers every image in it."""
+    try:
+        with os.scandir(folder) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _artifact_exists(path: str) -> bool:
+    """Check a local image against the cached listing of its folder."""
+    folder, name = os.path.split(path)
+    return name in _folder_entries(folder or os.curdir)
+
+
 # Based on device model, determine target softwre version and validate filepath/file exists.
 
 def get_target_software(device_model):
@@ -33,9 +49,13 @@ def get_target_software(device_model):
 
     config = software_matrix[device_model]
 
-    for artifact in config["artifacts"]:
-        if not os.path.exists(artifact["local_path"]):
-            raise SoftwareLookupException(f"Missing required image: {artifact['local_path']}")
+    missing = [a["local_path"] for a in config["artifacts"] if not _artifact_exists(a["local_path"])]
+    if missing:
+        # a cached listing may predate a restored image; read the folders again before failing
+        _folder_entries.cache_clear()
+        missing = [path for path in missing if not _artifact_exists(path)]
+    if missing:
+        raise SoftwareLookupException(f"Missing required image: {', '.join(missing)}")
 
     return config
  
\ No newline at end of file
@@ -1,20 +1,40 @@
 """Software Upgrade Runner: Pre-validation Workflow"""
 import os
+import copy
 import json
+import logging
+import contextlib
+import functools
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional
 
 import paramiko
-from swimlib.asdb import ASDBClient
+from swimlib.asdb import ASDBClient, ASDBExecutionResolved
 from swimlib.f5.preval import get_target_software
 from swimlib.ssh_connect import SSHConnection, SSHAuthError, validate_remote_storage
-from swimlib.f5.actions.image_copy import sftp_copy_artifacts
+from swimlib.f5.actions.image_copy import sftp_copy_artifacts, wants_compression
 from swimlib.f5.actions.image_stage import stage_artifacts, get_target_volume
 from swimlib.f5.actions.image_upgrade import upgrade_to_volume
 
 
+log = logging.getLogger(__name__)
+
 asdb = ASDBClient()
 
+# keepalive interval that holds the single per-device SSH session open during long installs
+SSH_KEEPALIVE_SECONDS = 30
+
+# rekey after 64 GiB / 2**32 packets rather than paramiko's 512 MiB, so multi-GB image
+# transfers are not stalled by repeated key exchanges; 64 GiB matches OpenSSH's default
+# RekeyLimit for 128-bit block ciphers
+SSH_REKEY_BYTES = 2**36
+SSH_REKEY_PACKETS = 2**32
+
+# upper bound on devices upgraded concurrently when SWIMLIB_DEVICE_JSON holds a list
+MAX_PARALLEL_DEVICES = int(os.getenv("SWIMLIB_MAX_PARALLEL_DEVICES", "8"))
+
 
 class PreValStatus(str, Enum):
     """Pre validation status values that map to icons."""
@@ -25,97 +45,184 @@ class PreValStatus(str, Enum):
     DISK_FULL = "disk_full"
 
 
-def validate_target_software(device: Dict) -> None:
+@functools.lru_cache(maxsize=64)
+def _cached_target_software(device_model: str) -> Mapping:
+    """Resolve target software once per device model; lookup failures are not cached."""
+    return MappingProxyType(get_target_software(device_model))
+
+
+def validate_target_software(device: Dict, *, client: Optional[ASDBClient] = None) -> None:
     """Validate and retrieve target software configuration for a device model."""
+    client = client or asdb
     try:
         device_model = device.get("device_type_model")
-        artifacts = get_target_software(device_model)
-        device.update(artifacts)
+        artifacts = _cached_target_software(device_model)
+        device.update(copy.deepcopy(dict(artifacts)))
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.IMAGE_MISSING)
-        asdb.resolve_execution(f"error: Software lookup failed: {e}")
-
-def validate_remote_connection(device: Dict, username: str, password: str) -> paramiko.SSHClient:
-    """Establish and return an SSH connection to the remote device."""
+        client.pre_validation_status(PreValStatus.IMAGE_MISSING)
+        client.resolve_execution(f"error: Software lookup failed: {e}")
+
+def validate_remote_connection(
+    device: Dict, username: str, password: str, *, client: Optional[ASDBClient] = None
+) -> paramiko.SSHClient:
+    """Establish and return an open SSH connection to the remote device.
+
+    The connection stays open so every later phase reuses the same SSH transport; the
+    caller is responsible for closing it. Compression is negotiated up front when an
+    artifact is not already compressed, since paramiko only applies it at key exchange.
+    """
+    client = client or asdb
     try:
         ip = device.get("device_address")
-        with SSHConnection(ip, username, password) as ssh_client:
-            return ssh_client
+        compress = wants_compression(device.get("artifacts", []))
+        with contextlib.ExitStack() as stack:
+            ssh_client = stack.enter_context(SSHConnection(ip, username, password, compress=compress))
+            transport = ssh_client.get_transport()
+            transport.set_keepalive(SSH_KEEPALIVE_SECONDS)
+            transport.packetizer.REKEY_BYTES = SSH_REKEY_BYTES
+            transport.packetizer.REKEY_PACKETS = SSH_REKEY_PACKETS
+            # tuned and ready: hand ownership to the caller instead of closing on exit
+            stack.pop_all()
+        return ssh_client
     except SSHAuthError as e:
-        asdb.pre_validation_status(device, PreValStatus.FAILAUTH)
-        asdb.resolve_execution(f"error: SSH authentication failed: {e}")
+        client.pre_validation_status(PreValStatus.FAILAUTH)
+        client.resolve_execution(f"error: SSH authentication failed: {e}")
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.FAIL)
-        asdb.resolve_execution(f"error: SSH connection failed: {e}")
+        client.pre_validation_status(PreValStatus.FAIL)
+        client.resolve_execution(f"error: SSH connection failed: {e}")
 
-def check_remote_storage(ssh_client: paramiko.SSHClient, device: Dict) -> None:
+def check_remote_storage(
+    ssh_client: paramiko.SSHClient, device: Dict, *, client: Optional[ASDBClient] = None
+) -> None:
     """Validate remote storage conditions on the device."""
+    client = client or asdb
     try:
         folder_path = device.get("remote_folder", "/shared/images")
         validate_remote_storage(ssh_client, folder_path, min_gb=5)
 
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.DISK_FULL)
-        asdb.resolve_execution(f"error: Remote storage validation failed: {e}")
+        client.pre_validation_status(PreValStatus.DISK_FULL)
+        client.resolve_execution(f"error: Remote storage validation failed: {e}")
 
-def run_image_copy(ssh_client: paramiko.SSHClient, device: Dict) -> None:
+def run_image_copy(ssh_client: paramiko.SSHClient, device: Dict, *, client: Optional[ASDBClient] = None) -> None:
     """Run the image copy process to transfer software artifacts to the device."""
+    client = client or asdb
     artifacts = device.get("artifacts", [])
     remote_folder = device.get("remote_folder", "/shared/images")
 
     try:
         sftp_copy_artifacts(ssh_client, artifacts, remote_folder)
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.FAIL)
-        asdb.resolve_execution(f"error: Image copy failed: {e}")
+        client.pre_validation_status(PreValStatus.FAIL)
+        client.resolve_execution(f"error: Image copy failed: {e}")
 
-def run_image_stage(ssh_client: paramiko.SSHClient, device: Dict) -> None:
+def run_image_stage(ssh_client: paramiko.SSHClient, device: Dict, *, client: Optional[ASDBClient] = None) -> None:
     """Run the image staging process to install software artifacts on the device."""
+    client = client or asdb
     artifacts = device.get("artifacts", [])
     target_version = device.get("target_version")
 
     try:
-        stage_artifacts(ssh_client, artifacts, target_version)
+        # remembered so the upgrade step can reboot without re-querying the volume
+        device["target_volume"] = stage_artifacts(ssh_client, artifacts, target_version)
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.FAIL)
-        asdb.resolve_execution(f"error: Image staging failed: {e}")
+        client.pre_validation_status(PreValStatus.FAIL)
+        client.resolve_execution(f"error: Image staging failed: {e}")
 
-def run_image_upgrade(ssh_client: paramiko.SSHClient, device: Dict) -> None:
+def run_image_upgrade(ssh_client: paramiko.SSHClient, device: Dict, *, client: Optional[ASDBClient] = None) -> None:
     """Run the image upgrade process to reboot device to target volume."""
+    client = client or asdb
     try:
-        target_volume = get_target_volume(ssh_client)
+        target_volume = device.get("target_volume") or get_target_volume(ssh_client)
         upgrade_to_volume(ssh_client, target_volume)
     except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.FAIL)
-        asdb.resolve_execution(f"error: Image upgrade failed: {e}")
+        client.pre_validation_status(PreValStatus.FAIL)
+        client.resolve_execution(f"error: Image upgrade failed: {e}")
+
+def run_device(device: Dict, username: str, password: str, client: Optional[ASDBClient] = None) -> int:
+    """Run the full workflow for one device and return its exit code.
+
+    A dedicated ASDB client is created for the device unless one is given, so several
+    devices can run side by side on worker threads.
+    """
+    client = client or ASDBClient(device=device)
+    client.device = device
+    execution_type = device.get("execution_type", "dry_run")
+    ssh_client = None
+
+    try:
+        client.start()
+
+        # Always run pre-validation checks
+        validate_target_software(device, client=client)
+        ssh_client = validate_remote_connection(device, username, password, client=client)
+        check_remote_storage(ssh_client, device, client=client)
+
+        # Stop here if dry_run
+        if execution_type == "dry_run":
+            return 0
+
+        # Run image copy for image_copy, image_stage, or image_upgrade
+        if execution_type in ("image_copy", "image_stage", "image_upgrade"):
+            run_image_copy(ssh_client, device, client=client)
+
+        # Run image stage for image_stage or image_upgrade
+        if execution_type in ("image_stage", "image_upgrade"):
+            run_image_stage(ssh_client, device, client=client)
+
+        # Run image upgrade only for image_upgrade
+        if execution_type == "image_upgrade":
+            run_image_upgrade(ssh_client, device, client=client)
+        return 0
+    except ASDBExecutionResolved as exc:
+        return exc.exit_code
+    finally:
+        if ssh_client is not None:
+            ssh_client.close()
+        client.close()
+
+def run_devices(devices: List[Dict], username: str, password: str) -> int:
+    """Run the workflow for many devices concurrently and return the worst exit code.
+
+    Each device spends nearly all of its time blocked on SSH/SFTP and ASDB I/O, so
+    devices are driven from a thread pool capped at ``MAX_PARALLEL_DEVICES``. A device
+    whose workflow raises an unexpected exception is logged and counted as exit code 1.
+    """
+    if not devices:
+        return 0
+
+    def run_one(device: Dict) -> int:
+        # an unexpected error on one device must not discard the other devices' results
+        try:
+            return run_device(device, username, password)
+        except Exception:
+            log.exception("Workflow failed for %s", device.get("device_name"))
+            return 1
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DEVICES, len(devices))) as ex:
+        codes = list(ex.map(run_one, devices))
+    return max(codes)
+
 
 def main():
-    """Main workflow execution with execution_type control."""
+    """Main workflow execution with execution_type control.
+
+    ``SWIMLIB_DEVICE_JSON`` may hold a single device object or a list of devices; a list
+    is upgraded concurrently and the process exits non-zero if any device failed.
+    """
     device = json.loads(os.getenv("SWIMLIB_DEVICE_JSON", "{}"))
     username = os.getenv("SWIMLIB_SSH_USERNAME", "admin")
     password = os.getenv("SWIMLIB_SSH_PASSWORD", "admin")
-    execution_type = device.get("execution_type", "dry_run")
-
-    # Always run pre-validation checks
-    validate_target_software(device)
-    ssh_client = validate_remote_connection(device, username, password)
-    check_remote_storage(ssh_client, device)
 
-    # Stop here if dry_run
-    if execution_type == "dry_run":
+    if isinstance(device, list):
+        code = run_devices(device, username, password)
+        if code:
+            raise SystemExit(code)
         return
 
-    # Run image copy for image_copy, image_stage, or image_upgrade
-    if execution_type in ("image_copy", "image_stage", "image_upgrade"):
-        run_image_copy(ssh_client, device)
-
-    # Run image stage for image_stage or image_upgrade
-    if execution_type in ("image_stage", "image_upgrade"):
-        run_image_stage(ssh_client, device)
-
-    # Run image upgrade only for image_upgrade
-    if execution_type == "image_upgrade":
-        run_image_upgrade(ssh_client, device)
+    code = run_device(device, username, password, client=asdb)
+    if code:
+        raise SystemExit(code)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,181 @@
+"""Shared interactive CLI channel for NetScaler action modules.
+
+Every ``exec_command`` opens a fresh SSH channel, paying a round trip before the
+command even starts. This module keeps one ``invoke_shell`` channel per connection
+and reuses it for every CLI command the action modules issue.
+
+Classes:
+    NSShell: Long-lived NetScaler CLI channel with sentinel-delimited output.
+
+Functions:
+    get_shell: Return the shell cached for a connection, opening one if needed.
+    discard_shell: Close and forget the shell cached for a connection.
+    cli_error: Return the first CLI error line in command output.
+
+.. versionadded:: 0.1.0
+"""
+
+from __future__ import annotations
+
+import codecs
+import itertools
+import re
+import weakref
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import paramiko
+
+# printed through the CLI's ``shell`` escape after each command; the echoed input line
+# never matches because it does not start with the marker
+_SENTINEL = "__END_{index}__"
+_SENTINEL_RE = re.compile(r"^__END_(\d+)__\r?$", re.MULTILINE)
+_DEFAULT_TIMEOUT = 60
+# drain whatever the transport has buffered in one call
+_RECV_SIZE = 1 << 20
+
+_shells: "weakref.WeakKeyDictionary[paramiko.SSHClient, NSShell]" = weakref.WeakKeyDictionary()
+
+
+class NSShell:
+    """Long-lived interactive channel to the NetScaler CLI.
+
+    Commands are followed by a sentinel echo so their output can be split without
+    waiting on prompts. Sentinels are numbered for the life of the channel, so output
+    left over from an earlier call can never end a later one.
+
+    Args:
+        ssh_client (paramiko.SSHClient): Connected paramiko SSHClient instance
+
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(self, ssh_client: paramiko.SSHClient):
+        self.channel = ssh_client.invoke_shell()
+        self._counter = itertools.count()
+        self._buffer = ""
+        # multi-byte characters may straddle recv boundaries
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._drain_prompt()
+
+    @property
+    def closed(self) -> bool:
+        """bool: True once the underlying channel has been closed."""
+        return self.channel.closed
+
+    def _drain_prompt(self) -> None:
+        # discard the login banner and first prompt
+        self.batch([])
+
+    def batch(self, cmds: List[str], timeout: float = _DEFAULT_TIMEOUT) -> List[str]:
+        """Run several CLI commands in one write and return the output of each.
+
+        Args:
+            cmds (List[str]): NetScaler CLI commands, run in order
+            timeout (float): Seconds to wait for any output before giving up
+
+        Returns:
+            List[str]: Output of each command, in the order of ``cmds``
+
+        Raises:
+            RuntimeError: If the channel closes before the last command completes
+        """
+        steps: List[Tuple[Optional[str], int]] = [(cmd, next(self._counter)) for cmd in cmds] or [
+            (None, next(self._counter))
+        ]
+        script = "".join(
+            (f"{cmd}\n" if cmd else "") + f"shell echo {_SENTINEL.format(index=i)}\n" for cmd, i in steps
+        )
+        self.channel.settimeout(timeout)
+        self.channel.sendall(script.encode())
+
+        last = str(steps[-1][1])
+        scan_from = 0
+        while True:
+            match = next(
+                (m for m in _SENTINEL_RE.finditer(self._buffer, scan_from) if m.group(1) == last), None
+            )
+            if match:
+                break
+            # only the unfinished last line can still turn into the sentinel, so long
+            # install output is scanned once instead of on every chunk
+            scan_from = self._buffer.rfind("\n") + 1
+            chunk = self.channel.recv(_RECV_SIZE)
+            if not chunk:
+                raise RuntimeError("Channel closed before CLI commands completed")
+            self._buffer += self._decoder.decode(chunk)
+
+        output, self._buffer = self._buffer[:match.start()], self._buffer[match.end():]
+        return _SENTINEL_RE.split(output)[0:2 * len(cmds):2]
+
+    def run(self, cmd: str, timeout: float = _DEFAULT_TIMEOUT) -> str:
+        """Run one CLI command and return its output.
+
+        Args:
+            cmd (str): NetScaler CLI command
+            timeout (float): Seconds to wait for any output before giving up
+
+        Returns:
+            str: Command output
+
+        Raises:
+            RuntimeError: If the channel closes before the command completes
+        """
+        return self.batch([cmd], timeout)[0]
+
+    def close(self) -> None:
+        """Close the underlying channel."""
+        self.channel.close()
+
+
+def get_shell(ssh_client: Union[paramiko.SSHClient, NSShell]) -> NSShell:
+    """Return the shell cached for ``ssh_client``, opening one if needed.
+
+    The shell lives as long as the SSH connection. Passing an ``NSShell`` returns it
+    unchanged, so action functions accept either.
+
+    Args:
+        ssh_client (Union[paramiko.SSHClient, NSShell]): Connection or existing shell
+
+    Returns:
+        NSShell: Open shell for the connection
+
+    .. versionadded:: 0.1.0
+    """
+    if isinstance(ssh_client, NSShell):
+        return ssh_client
+    shell = _shells.get(ssh_client)
+    if shell is None or shell.closed:
+        shell = _shells[ssh_client] = NSShell(ssh_client)
+    return shell
+
+
+def discard_shell(ssh_client: paramiko.SSHClient) -> None:
+    """Close and forget the shell cached for ``ssh_client``, if any.
+
+    Args:
+        ssh_client (paramiko.SSHClient): Connection whose shell should be dropped
+
+    .. versionadded:: 0.1.0
+    """
+    shell = _shells.pop(ssh_client, None)
+    if shell is not None:
+        shell.close()
+
+
+def cli_error(output: str) -> Optional[str]:
+    """Return the first ``ERROR:`` line the CLI printed, or None if the command succeeded.
+
+    Args:
+        output (str): Output of one CLI command
+
+    Returns:
+        Optional[str]: Error message, or None
+
+    .. versionadded:: 0.1.0
+    """
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith("ERROR"):
+            return line
+    return None
@@ -41,8 +41,12 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import Dict, List, Optional, Tuple
-import paramiko
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import paramiko
 
 
 class HAStateError(Exception):
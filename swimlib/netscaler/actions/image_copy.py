@@ -37,8 +37,20 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import List, Dict, Optional
-import paramiko
+from __future__ import annotations
+
+import shlex
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+from swimlib.netscaler._shell import get_shell
+
+if TYPE_CHECKING:
+    import paramiko
+
+# Unix commands go through the CLI's ``shell`` escape
+_CMD_SHA256 = "shell sha256sum {paths}"
+# hashing multi-GB builds prints nothing until each file is done
+_SHA256_TIMEOUT = 600
 
 
 def compute_remote_sha256(ssh_client: paramiko.SSHClient, remote_path: str) -> str:
@@ -190,7 +202,9 @@ def validate_artifact_integrity(
     """Validate integrity of transferred artifacts using SHA256 checksums.
 
     Verifies that all artifacts on the remote device match their expected checksums.
-    This function should be called after transfers to ensure data integrity.
+    This function should be called after transfers to ensure data integrity. Every file
+    is hashed by a single ``shell sha256sum`` invocation on the shared CLI shell, and
+    checking stops at the first mismatch.
 
     Args:
         ssh_client (paramiko.SSHClient): Connected paramiko SSHClient instance
@@ -220,5 +234,22 @@ def validate_artifact_integrity(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement integrity validation
-    raise NotImplementedError("validate_artifact_integrity not yet implemented")
+    if not artifacts:
+        return True
+
+    paths = " ".join(shlex.quote(artifact["remote_path"]) for artifact in artifacts)
+    output = get_shell(ssh_client).run(_CMD_SHA256.format(paths=paths), timeout=_SHA256_TIMEOUT)
+    digests = {}
+    for line in output.splitlines():
+        fields = line.split(maxsplit=1)
+        if len(fields) == 2:
+            digests[fields[1]] = fields[0]
+
+    for artifact in artifacts:
+        remote_path = artifact["remote_path"]
+        actual = digests.get(remote_path)
+        if actual is None:
+            raise RuntimeError(f"Could not compute SHA256 of {remote_path}")
+        if actual != artifact["sha256"]:
+            raise ValueError(f"SHA256 mismatch on {remote_path}: got {actual} expected {artifact['sha256']}")
+    return True
@@ -42,8 +42,60 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import List, Dict, Optional
-import paramiko
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+from swimlib.netscaler._shell import NSShell, cli_error, get_shell
+
+if TYPE_CHECKING:
+    import paramiko
+
+_CMD_SHOW_VERSION = "show ns version"
+_CMD_SHOW_BOOTCONFIG = "show ns bootconfig"
+_CMD_SHOW_PARTITION_VERSION = "show ns version -partition {partition}"
+_CMD_INSTALL = "install ns build {package} -y -partition {partition}"
+_VERSION_RE = re.compile(r"NetScaler NS(\d+\.\d+):\s+Build\s+(\d+\.\d+)")
+_PARTITION_RE = re.compile(r"HDD Partition:\s*([01])\b")
+# per artifact; installs take 5-15 minutes depending on platform
+_INSTALL_TIMEOUT = 900
+# installs run concurrently, each on its own channel of the same connection
+_MAX_PARALLEL_INSTALLS = 4
+
+
+def _parse_version(output: str) -> str:
+    # "NetScaler NS14.1: Build 25.109.nc, Date: ..." -> "14.1-25.109"
+    match = _VERSION_RE.search(output)
+    if not match:
+        raise RuntimeError("Could not parse NetScaler version")
+    return f"{match.group(1)}-{match.group(2)}"
+
+
+def _parse_partition(output: str) -> int:
+    match = _PARTITION_RE.search(output)
+    if not match:
+        raise RuntimeError("Could not determine active partition")
+    return int(match.group(1))
+
+
+def _install_on_own_shell(ssh_client: paramiko.SSHClient, cmd: str) -> str:
+    shell = NSShell(ssh_client)
+    try:
+        return shell.run(cmd, timeout=_INSTALL_TIMEOUT)
+    finally:
+        shell.close()
+
+
+def _check_install_output(outputs: List[str], artifacts: List[Dict]) -> None:
+    failed = [
+        artifact["remote_path"]
+        for artifact, output in zip(artifacts, outputs)
+        if cli_error(output)
+    ]
+    if failed:
+        raise RuntimeError(f"Install failed: {', '.join(failed)}")
 
 
 def get_current_version(ssh_client: paramiko.SSHClient) -> str:
@@ -78,8 +130,7 @@ def get_current_version(ssh_client: paramiko.SSHClient) -> str:
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement version retrieval
-    raise NotImplementedError("get_current_version not yet implemented")
+    return _parse_version(get_shell(ssh_client).run(_CMD_SHOW_VERSION))
 
 
 def get_current_partition(ssh_client: paramiko.SSHClient) -> int:
@@ -110,8 +161,7 @@ def get_current_partition(ssh_client: paramiko.SSHClient) -> int:
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement partition detection
-    raise NotImplementedError("get_current_partition not yet implemented")
+    return _parse_partition(get_shell(ssh_client).run(_CMD_SHOW_BOOTCONFIG))
 
 
 def get_target_partition(ssh_client: paramiko.SSHClient) -> int:
@@ -146,8 +196,7 @@ def get_target_partition(ssh_client: paramiko.SSHClient) -> int:
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement target partition logic
-    raise NotImplementedError("get_target_partition not yet implemented")
+    return 1 - get_current_partition(ssh_client)
 
 
 def stage_to_partition(
@@ -165,11 +214,10 @@ def stage_to_partition(
     Installation Process:
         1. Verify current version to avoid redundant installs
         2. Determine target partition (or use provided partition number)
-        3. For each artifact:
-           a. Extract package to target partition
-           b. Wait for installation completion
-           c. Verify installation success
-        4. Software staged but not activated
+        3. Install every artifact to the target partition; with several artifacts
+           the installs run concurrently on separate channels of the connection
+        4. Verify the staged version on the target partition
+        5. Software staged but not activated
 
     Args:
         ssh_client (paramiko.SSHClient): Connected paramiko SSHClient instance
@@ -216,8 +264,31 @@ def stage_to_partition(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement software staging
-    raise NotImplementedError("stage_to_partition not yet implemented")
+    shell = get_shell(ssh_client)
+    # the version check comes first so an up-to-date device costs one round trip;
+    # bootconfig rides along only when the partition still has to be worked out
+    probes = [_CMD_SHOW_VERSION] if partition is not None else [_CMD_SHOW_VERSION, _CMD_SHOW_BOOTCONFIG]
+    outputs = shell.batch(probes)
+    if _parse_version(outputs[0]) == target_version:
+        raise ValueError(f"Already running {target_version}")
+    if partition is None:
+        partition = 1 - _parse_partition(outputs[1])
+
+    cmds = [_CMD_INSTALL.format(package=a["remote_path"], partition=partition) for a in artifacts]
+    verify_cmd = _CMD_SHOW_PARTITION_VERSION.format(partition=partition)
+    if len(cmds) > 1:
+        # wall time is the slowest install rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=min(len(cmds), _MAX_PARALLEL_INSTALLS)) as executor:
+            outputs = list(executor.map(lambda cmd: _install_on_own_shell(ssh_client, cmd), cmds))
+        staged_output = shell.run(verify_cmd)
+    else:
+        # a single install shares one write with the staged-version check
+        *outputs, staged_output = shell.batch(cmds + [verify_cmd], timeout=_INSTALL_TIMEOUT)
+    _check_install_output(outputs, artifacts)
+
+    staged = _parse_version(staged_output)
+    if staged != target_version:
+        raise RuntimeError(f"Partition {partition} has {staged} staged, expected {target_version}")
 
 
 def verify_staged_version(
@@ -263,5 +334,5 @@ def verify_staged_version(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement staged version verification
-    raise NotImplementedError("verify_staged_version not yet implemented")
+    output = get_shell(ssh_client).run(_CMD_SHOW_PARTITION_VERSION.format(partition=partition))
+    return _parse_version(output) == expected_version
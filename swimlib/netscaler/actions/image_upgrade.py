@@ -41,8 +41,68 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-from typing import Optional
-import paramiko
+from __future__ import annotations
+
+import socket
+from typing import List, Optional, TYPE_CHECKING
+
+from swimlib.netscaler._shell import _SENTINEL, _SENTINEL_RE, cli_error, discard_shell, get_shell
+from swimlib.netscaler.actions.image_stage import _CMD_SHOW_PARTITION_VERSION, _parse_version
+
+if TYPE_CHECKING:
+    import paramiko
+
+_CMD_SAVE_CONFIG = "save ns config"
+_CMD_STAT_SYSTEM = "stat system"
+_CMD_REBOOT = "reboot -p {partition}"
+_CMD_WARM_REBOOT = "reboot -w -p {partition}"
+# seconds to wait for the device to close the session after the reboot burst
+_REBOOT_TIMEOUT = 30
+
+
+def _check_partition(partition: int) -> None:
+    if partition not in (0, 1):
+        raise ValueError(f"Invalid partition: {partition}")
+
+
+def _send_reboot(ssh_client: paramiko.SSHClient, cmds: List[str]) -> None:
+    """Write ``cmds`` in one send on the shared shell, then drop the shell.
+
+    The reboot at the end of ``cmds`` kills the channel, so nothing waits between
+    commands; a sentinel after each earlier command lets its output be checked on its
+    own. Output is read until the device closes the channel. Because everything goes
+    out in one write, a failed ``save ns config`` cannot stop the reboot; it is only
+    reported afterwards.
+    """
+    shell = get_shell(ssh_client)
+    *before, reboot = cmds
+    script = "".join(
+        f"{cmd}\nshell echo {_SENTINEL.format(index=next(shell._counter))}\n" for cmd in before
+    )
+    chunks = []
+    timed_out = False
+    try:
+        shell.channel.settimeout(_REBOOT_TIMEOUT)
+        shell.channel.sendall(f"{script}{reboot}\n".encode())
+        while chunk := shell.channel.recv(65536):
+            chunks.append(chunk)
+    except socket.timeout:
+        timed_out = True
+    finally:
+        # a shell whose device is rebooting must never be handed out again
+        discard_shell(ssh_client)
+        shell.close()
+
+    outputs = _SENTINEL_RE.split(b"".join(chunks).decode(errors="replace"))[::2]
+    for cmd, output in zip(cmds, outputs):
+        error = cli_error(output)
+        if error:
+            label = "Reboot" if cmd == reboot else cmd
+            raise RuntimeError(f"{label} failed: {error}")
+    if timed_out:
+        raise RuntimeError(
+            f"Device did not close the session within {_REBOOT_TIMEOUT}s of the reboot"
+        )
 
 
 def save_config_before_upgrade(ssh_client: paramiko.SSHClient) -> None:
@@ -71,8 +131,9 @@ def save_config_before_upgrade(ssh_client: paramiko.SSHClient) -> None:
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement config save
-    raise NotImplementedError("save_config_before_upgrade not yet implemented")
+    error = cli_error(get_shell(ssh_client).run(_CMD_SAVE_CONFIG))
+    if error:
+        raise RuntimeError(f"save ns config failed: {error}")
 
 
 def verify_upgrade_readiness(
@@ -117,8 +178,17 @@ def verify_upgrade_readiness(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement readiness checks
-    raise NotImplementedError("verify_upgrade_readiness not yet implemented")
+    _check_partition(target_partition)
+
+    # both probes in one write on the shared shell
+    partition_output, health_output = get_shell(ssh_client).batch(
+        [_CMD_SHOW_PARTITION_VERSION.format(partition=target_partition), _CMD_STAT_SYSTEM]
+    )
+    try:
+        _parse_version(partition_output)
+    except RuntimeError:
+        return False
+    return cli_error(health_output) is None
 
 
 def warm_reboot(
@@ -138,7 +208,8 @@ def warm_reboot(
         save_config (bool): If True, saves configuration before reboot (default: True)
 
     Raises:
-        RuntimeError: If reboot command fails
+        RuntimeError: If the save or reboot command fails, or the device does not
+            close the session after the reboot
         ValueError: If partition number is invalid
 
     Example:
@@ -154,6 +225,8 @@ def warm_reboot(
         - Warm reboot attempts connection draining (limited effectiveness)
         - Typical reboot time: 5-10 minutes depending on platform
         - Command: ``reboot -w -p <partition>``
+        - The save is sent in the same write as the reboot, so a failed save cannot
+          stop the reboot; it is reported once the reboot has been sent
 
     Warning:
         This operation causes immediate service disruption. Ensure proper
@@ -164,8 +237,10 @@ def warm_reboot(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement warm reboot
-    raise NotImplementedError("warm_reboot not yet implemented")
+    _check_partition(partition)
+    cmds = [_CMD_SAVE_CONFIG] if save_config else []
+    cmds.append(_CMD_WARM_REBOOT.format(partition=partition))
+    _send_reboot(ssh_client, cmds)
 
 
 def upgrade_to_partition(
@@ -180,8 +255,9 @@ def upgrade_to_partition(
     software version.
 
     Reboot Process:
-        1. Optionally save running configuration
-        2. Execute reboot command targeting specific partition
+        1. Unless forced, run :func:`verify_upgrade_readiness`
+        2. Save running configuration and execute the reboot command, written to the
+           device in a single send
         3. SSH connection terminates immediately
         4. Device performs boot sequence (5-10 minutes)
         5. Services resume on target partition with new software
@@ -192,7 +268,8 @@ def upgrade_to_partition(
         force (bool): If True, skip safety checks and force reboot (default: False)
 
     Raises:
-        RuntimeError: If reboot command fails to execute
+        RuntimeError: If the save or reboot command fails, or the device does not
+            close the session after the reboot
         ValueError: If partition number is invalid (not 0 or 1)
         PermissionError: If insufficient privileges to reboot device
 
@@ -217,6 +294,8 @@ def upgrade_to_partition(
         - SSH connection will drop immediately upon reboot
         - Device unavailable for 5-10 minutes during boot
         - Configuration is preserved across reboot
+        - The save is sent in the same write as the reboot, so a failed save cannot
+          stop the reboot; call :func:`save_config_before_upgrade` first if it must
         - Use external monitoring to verify successful boot
 
     Warning:
@@ -235,5 +314,8 @@ def upgrade_to_partition(
 
     .. versionadded:: 0.1.0
     """
-    # TODO: Implement partition upgrade reboot
-    raise NotImplementedError("upgrade_to_partition not yet implemented")
+    _check_partition(partition)
+    if not force and not verify_upgrade_readiness(ssh_client, partition):
+        raise RuntimeError(f"Partition {partition} is not ready for upgrade")
+    # save and reboot go out in one write; the device runs them in order
+    _send_reboot(ssh_client, [_CMD_SAVE_CONFIG, _CMD_REBOOT.format(partition=partition)])
@@ -24,10 +24,33 @@ Example:
 
 import os
 import logging
+import functools
+from typing import Tuple
 
-logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 
+# supported direct upgrades between releases; builds within a release may always move forward
+_UPGRADE_MATRIX = (
+    ("12.1", "13.0"),
+    ("12.1", "13.1"),
+    ("13.0", "13.1"),
+    ("13.0", "14.1"),
+    ("13.1", "14.1"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ns_version(version: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Split ``"14.1-25.109"`` into ``((14, 1), (25, 109))``."""
+    release, _, build = version.partition("-")
+    return tuple(int(x) for x in release.split(".")), tuple(int(x) for x in build.split(".") if x)
+
+
+# built once at import so each validation is a single set lookup
+_UPGRADE_EDGES = frozenset(
+    (_parse_ns_version(current)[0], _parse_ns_version(target)[0]) for current, target in _UPGRADE_MATRIX
+)
+
 
 class SoftwareLookupException(Exception):
     """Exception raised when software lookup or validation fails.
@@ -85,14 +108,17 @@ def get_target_software(device_model: str) -> dict:
 
     Note:
         This is a placeholder implementation. Production version will integrate
-        with actual NetScaler software matrix and artifact repository.
+        with actual NetScaler software matrix and artifact repository. Local
+        checksums should come from
+        :func:`swimlib.f5.actions.image_copy.compute_local_sha256`, which hashes in
+        :func:`hashlib.file_digest`'s C loop and caches digests by path, size and mtime.
 
     .. versionadded:: 0.1.0
     """
     # Placeholder implementation
     # TODO: Integrate with actual NetScaler software matrix
 
-    log.warning(f"NetScaler pre-validation not yet implemented for model: {device_model}")
+    log.warning("NetScaler pre-validation not yet implemented for model: %s", device_model)
 
     # Return placeholder configuration
     return {
@@ -133,14 +159,17 @@ def validate_ns_version(current_version: str, target_version: str) -> bool:
                 print("Direct upgrade not supported - intermediate version required")
 
     Note:
-        Placeholder implementation. Production version will implement full
-        NetScaler version compatibility matrix.
+        Release-to-release paths come from ``_UPGRADE_MATRIX``; moving to a newer
+        build of the same release is always allowed.
 
     .. versionadded:: 0.1.0
     """
-    # Placeholder - always returns True for now
-    log.info(f"Version validation: {current_version} -> {target_version}")
-    return True
+    log.info("Version validation: %s -> %s", current_version, target_version)
+    current_release, current_build = _parse_ns_version(current_version)
+    target_release, target_build = _parse_ns_version(target_version)
+    if current_release == target_release:
+        return target_build >= current_build
+    return (current_release, target_release) in _UPGRADE_EDGES
 
 
 def check_ns_license(ssh_client) -> dict:
@@ -16,6 +16,8 @@ Functions:
     run_image_copy: Transfer software artifacts to device
     run_image_stage: Install software to alternate partition
     run_image_upgrade: Reboot device to activate upgrade
+    run_device: Run the full workflow for one device
+    run_devices: Run the workflow for many devices concurrently
     main: Main workflow entry point
 
 Example:
@@ -45,19 +47,53 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
+from __future__ import annotations
+
 import os
-import json
+import copy
+import logging
+import contextlib
+import functools
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type, TYPE_CHECKING
 
-import paramiko
-from swimlib.asdb import ASDBClient
+from swimlib.asdb import ASDBClient, ASDBExecutionResolved
 from swimlib.netscaler.preval import get_target_software
 from swimlib.ssh_connect import SSHConnection, SSHAuthError, validate_remote_storage
 
+if TYPE_CHECKING:
+    import paramiko
+
+try:
+    import orjson
+
+    def _decode(data: str) -> Any:
+        return orjson.loads(data)
+except ImportError:  # optional dependency: pip install swimlib[fast]
+    import json
+
+    def _decode(data: str) -> Any:
+        return json.loads(data)
+
+
+log = logging.getLogger(__name__)
 
 asdb = ASDBClient()
 
+# keepalive interval that stops NAT and firewall idle timers tearing down the session
+# while the CLI shell sits quiet between commands or during long installs
+SSH_KEEPALIVE_SECONDS = 30
+
+# rekey after 64 GiB / 2**32 packets rather than paramiko's 512 MiB, so multi-GB build
+# transfers are not stalled by repeated key exchanges; same limits as the F5 workflow
+SSH_REKEY_BYTES = 2**36
+SSH_REKEY_PACKETS = 2**32
+
+# upper bound on devices upgraded concurrently when SWIMLIB_DEVICE_JSON holds a list
+MAX_PARALLEL_DEVICES = int(os.getenv("SWIMLIB_MAX_PARALLEL_DEVICES", "8"))
+
 
 class PreValStatus(str, Enum):
     """Pre-validation status enumeration for ASDB status icons.
@@ -76,10 +112,10 @@ class PreValStatus(str, Enum):
             from swimlib.netscaler.run import PreValStatus
 
             # On success
-            asdb.pre_validation_status(device, PreValStatus.PASS)
+            asdb.pre_validation_status(PreValStatus.PASS)
 
             # On authentication failure
-            asdb.pre_validation_status(device, PreValStatus.FAILAUTH)
+            asdb.pre_validation_status(PreValStatus.FAILAUTH)
 
     .. versionadded:: 0.1.0
     """
@@ -91,13 +127,44 @@ class PreValStatus(str, Enum):
     LICENSE_INVALID = "license_invalid"
 
 
-def validate_target_software(device: Dict) -> dict:
+def _pre_val_guard(
+    status: PreValStatus, label: str, catch: Type[BaseException] = Exception
+) -> Callable:
+    """Report ``catch`` errors from a validate_* function to ASDB and resolve the execution.
+
+    The wrapped function takes an optional ``client`` keyword; errors are reported through
+    it, or through the module-level client when it is omitted. Guards can be stacked, with
+    the innermost one handling the most specific exception.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except catch as e:
+                reporter = kwargs.get("client") or asdb
+                reporter.pre_validation_status(status)
+                reporter.resolve_execution(f"error: {label}: {e}")
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_target_software(device_model: str) -> Mapping:
+    """Resolve target software once per device model; lookup failures are not cached."""
+    return MappingProxyType(get_target_software(device_model))
+
+
+@_pre_val_guard(PreValStatus.IMAGE_MISSING, "Software lookup failed")
+def validate_target_software(device: Dict, *, client: Optional[ASDBClient] = None) -> dict:
     """Validate and retrieve target software configuration for NetScaler device.
 
     Looks up software artifacts based on device model and validates local availability.
 
     Args:
         device (dict): Device configuration dictionary containing device_type_model
+        client (Optional[ASDBClient]): ASDB client to report through
+            (default: the module-level client)
 
     Returns:
         dict: Updated device dictionary with software configuration
@@ -110,23 +177,25 @@ def validate_target_software(device: Dict) -> dict:
 
     .. versionadded:: 0.1.0
     """
-    try:
-        device_model = device.get("device_type_model")
-        artifacts = get_target_software(device_model)
-        device.update(artifacts)
-        return device
-    except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.IMAGE_MISSING)
-        asdb.resolve_execution(f"error: Software lookup failed: {e}")
+    device_model = device.get("device_type_model")
+    artifacts = _cached_target_software(device_model)
+    device.update(copy.deepcopy(dict(artifacts)))
+    return device
 
 
-def validate_remote_connection(device: Dict, username: str, password: str) -> paramiko.SSHClient:
+@_pre_val_guard(PreValStatus.FAIL, "SSH connection failed")
+@_pre_val_guard(PreValStatus.FAILAUTH, "SSH authentication failed", SSHAuthError)
+def validate_remote_connection(
+    device: Dict, username: str, password: str, *, client: Optional[ASDBClient] = None
+) -> paramiko.SSHClient:
     """Establish and validate SSH connection to NetScaler device.
 
     Args:
         device (dict): Device configuration with device_address
         username (str): SSH username (typically 'nsroot')
         password (str): SSH password
+        client (Optional[ASDBClient]): ASDB client to report through
+            (default: the module-level client)
 
     Returns:
         paramiko.SSHClient: Connected SSH client
@@ -137,27 +206,34 @@ def validate_remote_connection(device: Dict, username: str, password: str) -> pa
 
     Note:
         On failure, updates ASDB with appropriate status and resolves execution.
+        A connection that fails during setup is closed immediately; otherwise the
+        caller owns the returned client and must close it (see :func:`run_device`).
 
     .. versionadded:: 0.1.0
     """
-    try:
-        ip = device.get("device_address")
-        ssh_client = SSHConnection(ip, username, password).__enter__()
-        return ssh_client
-    except SSHAuthError as e:
-        asdb.pre_validation_status(device, PreValStatus.FAILAUTH)
-        asdb.resolve_execution(f"error: SSH authentication failed: {e}")
-    except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.FAIL)
-        asdb.resolve_execution(f"error: SSH connection failed: {e}")
-
-
-def validate_remote_storage_ns(ssh_client: paramiko.SSHClient, device: Dict) -> None:
+    ip = device.get("device_address")
+    with contextlib.ExitStack() as stack:
+        ssh_client = stack.enter_context(SSHConnection(ip, username, password))
+        transport = ssh_client.get_transport()
+        transport.set_keepalive(SSH_KEEPALIVE_SECONDS)
+        transport.packetizer.REKEY_BYTES = SSH_REKEY_BYTES
+        transport.packetizer.REKEY_PACKETS = SSH_REKEY_PACKETS
+        # tuned and ready: hand ownership to the caller instead of closing on exit
+        stack.pop_all()
+    return ssh_client
+
+
+@_pre_val_guard(PreValStatus.DISK_FULL, "Storage validation failed")
+def validate_remote_storage_ns(
+    ssh_client: paramiko.SSHClient, device: Dict, *, client: Optional[ASDBClient] = None
+) -> None:
     """Validate storage capacity on NetScaler device.
 
     Args:
         ssh_client (paramiko.SSHClient): Connected SSH client
         device (dict): Device configuration with remote_folder
+        client (Optional[ASDBClient]): ASDB client to report through
+            (default: the module-level client)
 
     Raises:
         Exception: If storage validation fails
@@ -167,12 +243,8 @@ def validate_remote_storage_ns(ssh_client: paramiko.SSHClient, device: Dict) ->
 
     .. versionadded:: 0.1.0
     """
-    try:
-        folder_path = device.get("remote_folder", "/var/nsinstall")
-        validate_remote_storage(ssh_client, folder_path, min_gb=3)
-    except Exception as e:
-        asdb.pre_validation_status(device, PreValStatus.DISK_FULL)
-        asdb.resolve_execution(f"error: Storage validation failed: {e}")
+    folder_path = device.get("remote_folder", "/var/nsinstall")
+    validate_remote_storage(ssh_client, folder_path, min_gb=3)
 
 
 def run_image_copy(ssh_client: paramiko.SSHClient, device: Dict) -> None:
@@ -189,7 +261,7 @@ def run_image_copy(ssh_client: paramiko.SSHClient, device: Dict) -> None:
     .. versionadded:: 0.1.0
     """
     # Placeholder - will be implemented in actions.image_copy
-    print(f"[NetScaler] Image copy - placeholder")
+    log.info("Image copy placeholder for %s", device.get("device_name"))
 
 
 def run_image_stage(ssh_client: paramiko.SSHClient, device: Dict) -> None:
@@ -206,7 +278,7 @@ def run_image_stage(ssh_client: paramiko.SSHClient, device: Dict) -> None:
     .. versionadded:: 0.1.0
     """
     # Placeholder - will be implemented in actions.image_stage
-    print(f"[NetScaler] Image stage - placeholder")
+    log.info("Image stage placeholder for %s", device.get("device_name"))
 
 
 def run_image_upgrade(ssh_client: paramiko.SSHClient, device: Dict) -> None:
@@ -223,7 +295,102 @@ def run_image_upgrade(ssh_client: paramiko.SSHClient, device: Dict) -> None:
     .. versionadded:: 0.1.0
     """
     # Placeholder - will be implemented in actions.image_upgrade
-    print(f"[NetScaler] Image upgrade - placeholder")
+    log.info("Image upgrade placeholder for %s", device.get("device_name"))
+
+
+# steps run after pre-validation for each execution_type; each one builds on the last
+_WORKFLOW = {
+    "dry_run": (),
+    "image_copy": (run_image_copy,),
+    "image_stage": (run_image_copy, run_image_stage),
+    "image_upgrade": (run_image_copy, run_image_stage, run_image_upgrade),
+}
+
+
+def run_device(device: Dict, username: str, password: str, client: Optional[ASDBClient] = None) -> int:
+    """Run the full NetScaler workflow for one device and return its exit code.
+
+    A dedicated ASDB client is created for the device unless one is given, so several
+    devices can run side by side on worker threads.
+
+    Args:
+        device (dict): Device configuration dictionary
+        username (str): SSH username
+        password (str): SSH password
+        client (Optional[ASDBClient]): ASDB client to report through
+            (default: a new client for ``device``)
+
+    Returns:
+        int: 0 on success, otherwise the code the execution was resolved with
+
+    Note:
+        The device's SSH connection is closed once its workflow finishes.
+
+    .. versionadded:: 0.1.0
+    """
+    client = client or ASDBClient(device=device)
+    client.device = device
+    execution_type = device.get("execution_type", "dry_run")
+    ssh_client: Optional[paramiko.SSHClient] = None
+
+    try:
+        client.start()
+
+        # Always run pre-validation
+        validate_target_software(device, client=client)
+        ssh_client = validate_remote_connection(device, username, password, client=client)
+        validate_remote_storage_ns(ssh_client, device, client=client)
+
+        # Stop here if dry_run
+        if execution_type == "dry_run":
+            log.info("Dry run complete for %s", device.get("device_name"))
+            return 0
+
+        for step in _WORKFLOW.get(execution_type, ()):
+            step(ssh_client, device)
+        return 0
+    except ASDBExecutionResolved as exc:
+        return exc.exit_code
+    finally:
+        if ssh_client is not None:
+            ssh_client.close()
+        client.close()
+
+
+def run_devices(devices: List[Dict], username: str, password: str) -> int:
+    """Run the NetScaler workflow for many devices concurrently.
+
+    Each device spends nearly all of its time blocked on SSH and ASDB I/O, so devices
+    are driven from a thread pool capped at ``MAX_PARALLEL_DEVICES``.
+
+    Args:
+        devices (List[dict]): Device configuration dictionaries
+        username (str): SSH username
+        password (str): SSH password
+
+    Returns:
+        int: The highest exit code returned by any device (0 if all succeeded)
+
+    Note:
+        A device whose workflow raises an unexpected exception is logged and counted
+        as exit code 1; the remaining devices still run to completion.
+
+    .. versionadded:: 0.1.0
+    """
+    if not devices:
+        return 0
+
+    def run_one(device: Dict) -> int:
+        # an unexpected error on one device must not discard the other devices' results
+        try:
+            return run_device(device, username, password)
+        except Exception:
+            log.exception("Workflow failed for %s", device.get("device_name"))
+            return 1
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DEVICES, len(devices))) as ex:
+        codes = list(ex.map(run_one, devices))
+    return max(codes)
 
 
 def main():
@@ -237,10 +404,14 @@ def main():
     - image_stage: Copy + install to alternate partition
     - image_upgrade: Copy + install + reboot
 
+    SWIMLIB_DEVICE_JSON may hold a single device object or a list of devices; a list
+    is upgraded concurrently and the process exits non-zero if any device failed.
+
     Environment Variables:
-        SWIMLIB_DEVICE_JSON: JSON device configuration
+        SWIMLIB_DEVICE_JSON: JSON device configuration, or a list of them
         SWIMLIB_SSH_USERNAME: SSH username (default: nsroot)
         SWIMLIB_SSH_PASSWORD: SSH password (default: nsroot)
+        SWIMLIB_MAX_PARALLEL_DEVICES: Concurrent device limit for lists (default: 8)
 
     Example:
         Execute dry run validation::
@@ -252,32 +423,18 @@ def main():
 
     .. versionadded:: 0.1.0
     """
-    device = json.loads(os.getenv("SWIMLIB_DEVICE_JSON", "{}"))
+    # no-op when the embedding application has already configured logging
+    logging.basicConfig(level=logging.INFO)
+    device = _decode(os.getenv("SWIMLIB_DEVICE_JSON", "{}"))
     username = os.getenv("SWIMLIB_SSH_USERNAME", "nsroot")
     password = os.getenv("SWIMLIB_SSH_PASSWORD", "nsroot")
-    execution_type = device.get("execution_type", "dry_run")
-
-    # Always run pre-validation
-    validate_target_software(device)
-    ssh_client = validate_remote_connection(device, username, password)
-    validate_remote_storage_ns(ssh_client, device)
-
-    # Stop here if dry_run
-    if execution_type == "dry_run":
-        print("[NetScaler] Dry run complete")
-        return
-
-    # Run image copy for image_copy, image_stage, or image_upgrade
-    if execution_type in ("image_copy", "image_stage", "image_upgrade"):
-        run_image_copy(ssh_client, device)
-
-    # Run image stage for image_stage or image_upgrade
-    if execution_type in ("image_stage", "image_upgrade"):
-        run_image_stage(ssh_client, device)
 
-    # Run image upgrade only for image_upgrade
-    if execution_type == "image_upgrade":
-        run_image_upgrade(ssh_client, device)
+    if isinstance(device, list):
+        code = run_devices(device, username, password)
+    else:
+        code = run_device(device, username, password, client=asdb)
+    if code:
+        raise SystemExit(code)
 
 
 if __name__ == "__main__":
@@ -16,9 +16,15 @@ Each device model configuration includes:
 - Software artifact details (filenames, paths, MD5 checksums, download URLs)
 
 Module Attributes:
-    software_matrix (Dict[str, Dict[str, Any]]): Complete mapping of device models to
-        software configurations. Keys are device model names (e.g., "BIG-IP Virtual Edition"),
-        values are configuration dictionaries.
+    software_matrix (Mapping[str, Dict[str, Any]]): Complete read-only mapping of device
+        models to software configurations. Keys are device model names (e.g., "BIG-IP
+        Virtual Edition"), values are configuration dictionaries.
+
+Functions:
+    iter_all_artifacts: Yield every (model, artifact) pair in matrix order.
+    iter_unique_artifacts: Yield each distinct artifact once.
+    lookup_by_filename: Return the device models that install a given artifact.
+    lookup_by_md5: Return the artifact with a given MD5 checksum.
 
 Software Version Strategy:
     - Virtual Edition and vCMP Guests: 21.0.0 (latest major release)
@@ -86,7 +92,37 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
-software_matrix = {
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# the iSeries and 7200 hardware platforms all run the same 17.5.1.3 EHF images; one shared
+# entry keeps them from drifting apart
+_HARDWARE_17_5_1_3: Dict[str, Any] = {
+    "target_version": "17.5.1.3-0.125.19",
+    "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
+    "remote_folder": "/shared/images/",
+    "artifacts": [
+        {
+            "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
+            "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
+            "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
+            "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
+            "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
+        },
+        {
+            "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
+            "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
+            "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
+            "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
+            "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
+        }
+    ]
+}
+
+# a model moves to the shared 17.5.1.3 images by adding it here
+_HARDWARE_17_5_1_3_MODELS = ("BIG-IP 7200", "BIG-IP i2800", "BIG-IP i5800", "BIG-IP i7800", "BIG-IP i10800")
+
+_SOFTWARE_MATRIX: Dict[str, Dict[str, Any]] = {
     "BIG-IP vCMP Guests": {
         "target_version": "21.0.0",
         "local_folder": "/project-volume/images/21.0.0/",
@@ -122,111 +158,7 @@ software_matrix = {
             }
         ]
     },
-    "BIG-IP 7200": {
-        "target_version": "17.5.1.3-0.125.19",
-        "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
-        "remote_folder": "/shared/images/",
-        "artifacts": [
-            {
-                "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
-            },
-            {
-                "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
-            }
-        ]
-    },
-    "BIG-IP i2800": {
-        "target_version": "17.5.1.3-0.125.19",
-        "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
-        "remote_folder": "/shared/images/",
-        "artifacts": [
-            {
-                "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
-            },
-            {
-                "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
-            }
-        ]
-    },
-    "BIG-IP i5800": {
-        "target_version": "17.5.1.3-0.125.19",
-        "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
-        "remote_folder": "/shared/images/",
-        "artifacts": [
-            {
-                "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
-            },
-            {
-                "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
-            }
-        ]
-    },
-    "BIG-IP i7800": {
-        "target_version": "17.5.1.3-0.125.19",
-        "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
-        "remote_folder": "/shared/images/",
-        "artifacts": [
-            {
-                "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
-            },
-            {
-                "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
-            }
-        ]
-    },
-    "BIG-IP i10800": {
-        "target_version": "17.5.1.3-0.125.19",
-        "local_folder": "/project-volume/images/17.5.1.3-0.125.19/",
-        "remote_folder": "/shared/images/",
-        "artifacts": [
-            {
-                "filename": "BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "remote_path": "/shared/images/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip",
-                "md5": "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/BIGIP-17.5.1.3-0.125.19.ALL-FSOS.qcow2.zip"
-            },
-            {
-                "filename": "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "local_path": "/project-volume/images/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "remote_path": "/shared/images/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso",
-                "md5": "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-                "download_url": "https://nexus-dev.onef5serv.net/repository/network-device-images/f5/17.5.1.3-0.125.19/Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"
-            }
-        ]
-    },
+    **dict.fromkeys(_HARDWARE_17_5_1_3_MODELS, _HARDWARE_17_5_1_3),
 
     # Added sample models with mock data
     "BIG-IP i15800": {
@@ -279,4 +211,88 @@ software_matrix = {
         ]
     }
     # Additional platforms (e.g., i15800, rSeries tenants, older 5000/7000 series) can be added following the same pattern.
-}
\ No newline at end of file
+}
+
+# read-only so no caller can add or replace a model for the rest of the process
+software_matrix: Mapping[str, Dict[str, Any]] = MappingProxyType(_SOFTWARE_MATRIX)
+
+
+def iter_all_artifacts() -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """Yield ``(model, artifact)`` for every artifact of every model, in matrix order.
+
+    Models that share an entry each yield its artifacts.
+
+    Yields:
+        Tuple[str, Mapping[str, Any]]: Model name and an artifact dictionary shared with
+        :data:`software_matrix`
+
+    .. versionadded:: 0.1.0
+    """
+    for model, config in software_matrix.items():
+        for artifact in config["artifacts"]:
+            yield model, artifact
+
+
+def iter_unique_artifacts() -> Iterator[Tuple[str, Mapping[str, Any]]]:
+    """Yield each distinct artifact once, keyed by MD5, with the first model that uses it.
+
+    Use this for bulk work such as checksum verification, where an image shared by
+    several models only needs handling once.
+
+    Yields:
+        Tuple[str, Mapping[str, Any]]: First model name and the artifact dictionary
+
+    .. versionadded:: 0.1.0
+    """
+    seen = set()
+    for model, artifact in iter_all_artifacts():
+        if artifact["md5"] not in seen:
+            seen.add(artifact["md5"])
+            yield model, artifact
+
+
+def _build_indexes() -> Tuple[Mapping[str, Tuple[str, ...]], Mapping[str, Mapping[str, Any]]]:
+    by_filename: Dict[str, List[str]] = {}
+    by_md5: Dict[str, Mapping[str, Any]] = {}
+    for model, artifact in iter_all_artifacts():
+        by_filename.setdefault(artifact["filename"], []).append(model)
+        by_md5[artifact["md5"]] = artifact
+    return (
+        MappingProxyType({name: tuple(models) for name, models in by_filename.items()}),
+        MappingProxyType(by_md5),
+    )
+
+
+# built once at import: artifact filename -> models that install it, md5 -> artifact
+_by_filename: Mapping[str, Tuple[str, ...]]
+_by_md5: Mapping[str, Mapping[str, Any]]
+_by_filename, _by_md5 = _build_indexes()
+
+
+def lookup_by_filename(filename: str) -> Tuple[str, ...]:
+    """Return the device models whose configuration includes an artifact named ``filename``.
+
+    Args:
+        filename: Artifact filename (e.g., "BIGIP-21.0.0.iso")
+
+    Returns:
+        Tuple[str, ...]: Matching model names in matrix order; empty if none match
+
+    .. versionadded:: 0.1.0
+    """
+    return _by_filename.get(filename, ())
+
+
+def lookup_by_md5(md5: str) -> Optional[Mapping[str, Any]]:
+    """Return the artifact whose MD5 checksum is ``md5``, or None if no artifact matches.
+
+    Args:
+        md5: Hex MD5 checksum
+
+    Returns:
+        Optional[Mapping[str, Any]]: Artifact dictionary shared with :data:`software_matrix`;
+        copy it before modifying
+
+    .. versionadded:: 0.1.0
+    """
+    return _by_md5.get(md5)
@@ -14,6 +14,7 @@ Classes:
 
 Functions:
     validate_remote_storage: Validates remote folder existence and available disk space.
+    validate_remote_storage_batch: Validates several remote folders in one remote command.
 
 Example:
     Basic SSH connection with context manager::
@@ -45,8 +46,20 @@ See Also:
 .. versionadded:: 0.1.0
 """
 
+import shlex
+from typing import Dict, Mapping
+
 from paramiko import SSHClient, AutoAddPolicy, AuthenticationException
 
+# the one place host keys are accepted unverified; stateless, so every connection shares it
+_HOST_KEY_POLICY = AutoAddPolicy()
+
+# printed instead of the free space when the folder is absent; stat output is never this word
+_FOLDER_MISSING = "MISSING"
+_GIB = 1024 ** 3
+# seconds the storage check may go without output before it is treated as hung
+_STORAGE_TIMEOUT = 30
+
 
 class SSHAuthError(Exception):
     """Custom exception raised when SSH authentication fails.
@@ -108,6 +121,7 @@ class SSHConnection:
         ip (str): IP address or hostname of the remote device.
         username (str): SSH username for authentication.
         password (str): SSH password for authentication.
+        compress (bool): Whether zlib compression is negotiated on the transport.
         client (paramiko.SSHClient | None): The underlying paramiko SSH client instance.
 
     Example:
@@ -133,7 +147,7 @@ class SSHConnection:
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, ip, username, password):
+    def __init__(self, ip, username, password, compress=False):
         """Initialize SSH connection context manager.
 
         :param ip: IP address or hostname of the remote device
@@ -142,6 +156,8 @@ class SSHConnection:
         :type username: str
         :param password: SSH password for authentication
         :type password: str
+        :param compress: Negotiate zlib compression on the transport (default: False)
+        :type compress: bool
 
         Example:
             Create connection context::
@@ -155,6 +171,7 @@ class SSHConnection:
         self.ip = ip
         self.username = username
         self.password = password
+        self.compress = compress
         self.client = None
 
     def __enter__(self):
@@ -181,17 +198,23 @@ class SSHConnection:
         .. versionadded:: 0.1.0
         """
         self.client = SSHClient()
-        self.client.set_missing_host_key_policy(AutoAddPolicy())
+        self.client.set_missing_host_key_policy(_HOST_KEY_POLICY)
         try:
             self.client.connect(
                 hostname=self.ip,
                 username=self.username,
                 password=self.password,
                 look_for_keys=False,
-                allow_agent=False
+                allow_agent=False,
+                compress=self.compress,
             )
         except AuthenticationException as e:
+            # a rejected login leaves the transport running; release its socket and thread
+            self.client.close()
             raise SSHAuthError(f"Authentication failed for {self.username}@{self.ip}") from e
+        except Exception:
+            self.client.close()
+            raise
         return self.client
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -230,13 +253,12 @@ class SSHConnection:
 def validate_remote_storage(ssh_client, folder_path="/shared/images", min_gb=5):
     """Validate that a remote folder exists and has sufficient disk space available.
 
-    This function checks two conditions on the remote system:
+    This function checks two conditions on the remote system, in a single command:
     1. The specified folder path exists
     2. The filesystem containing the folder has at least min_gb gigabytes of free space
 
-    The disk space check uses the 'df' command to determine available space on the
-    mount point containing the folder. For example, if folder_path is "/shared/images",
-    it checks the available space on the "/shared" mount point.
+    The disk space check runs ``stat -f`` on the folder itself, so it reports the space
+    available to unprivileged users on whichever filesystem actually holds the folder.
 
     :param ssh_client: Connected paramiko SSHClient instance for executing remote commands
     :type ssh_client: paramiko.SSHClient
@@ -265,31 +287,65 @@ def validate_remote_storage(ssh_client, folder_path="/shared/images", min_gb=5):
             except RemoteStorageError as e:
                 print(f"Validation failed: {e}")
 
-    Note:
-        The function extracts the mount point from the folder path by taking the first
-        path component after the root. For example:
-        - "/shared/images" -> checks "/shared"
-        - "/var/tmp/files" -> checks "/var"
+    .. versionadded:: 0.1.0
+    """
+    validate_remote_storage_batch(ssh_client, {folder_path: min_gb})
+
+
+def validate_remote_storage_batch(
+    ssh_client: SSHClient, specs: Mapping[str, float]
+) -> Dict[str, float]:
+    """Validate several remote folders and their free space with a single remote command.
+
+    Each folder is checked exactly as :func:`validate_remote_storage` checks one, but all
+    of them share one ``exec_command``, so validating N folders costs one round trip
+    instead of N.
+
+    :param ssh_client: Connected paramiko SSHClient instance for executing remote commands
+    :type ssh_client: paramiko.SSHClient
+    :param specs: Remote folder path -> minimum free space in gigabytes
+    :type specs: Mapping[str, int | float]
+    :return: Remote folder path -> available gigabytes on its filesystem
+    :rtype: Dict[str, float]
+    :raises RemoteStorageError: For the first folder, in ``specs`` order, that is missing,
+        short of space, or whose free space cannot be determined, or if the device stops
+        responding for ``_STORAGE_TIMEOUT`` seconds
+
+    Example:
+        Check the image and hotfix folders together::
+
+            validate_remote_storage_batch(ssh, {"/shared/images": 20, "/var/tmp": 2})
 
     .. versionadded:: 0.1.0
     """
-    # Check folder exists
-    stdin, stdout, stderr = ssh_client.exec_command(f"test -d {folder_path} && echo exists")
-    if stdout.read().decode().strip() != "exists":
-        raise RemoteStorageError(f"Remote folder does not exist: {folder_path}")
-
-    # Extract mount point from folder path (e.g., /shared/images -> /shared)
-    mount_point = "/" + folder_path.lstrip("/").split("/")[0]
-
-    # Check disk space
-    stdin, stdout, stderr = ssh_client.exec_command(f"df -BG {mount_point} | tail -1 | awk '{{print $4}}'")
-    output = stdout.read().decode().strip()
-
-    if not output:
-        raise RemoteStorageError(f"Unable to determine disk space for {mount_point}")
-
-    available_gb = float(output.rstrip('G'))
-    if available_gb < min_gb:
-        raise RemoteStorageError(
-            f"Insufficient disk space on {mount_point}: {available_gb}GB available, {min_gb}GB required"
-        )
+    # one line per folder: "<available blocks> <block size>" from a single stat, or the
+    # missing marker; echo keeps the line even when stat fails
+    script = "; ".join(
+        f"if test -d {shlex.quote(folder)}; then "
+        f"echo \"$(stat -f -c '%a %S' {shlex.quote(folder)} 2>/dev/null)\"; "
+        f"else echo {_FOLDER_MISSING}; fi"
+        for folder in specs
+    )
+    stdin, stdout, stderr = ssh_client.exec_command(script, timeout=_STORAGE_TIMEOUT)
+    try:
+        # a few short lines; one read to EOF is cheaper than a recv loop
+        lines = stdout.read().decode().splitlines()
+    except TimeoutError as e:
+        raise RemoteStorageError(f"Timed out checking storage for {', '.join(specs)}") from e
+
+    available = {}
+    for index, (folder_path, min_gb) in enumerate(specs.items()):
+        fields = lines[index].split() if index < len(lines) else []
+
+        if fields == [_FOLDER_MISSING]:
+            raise RemoteStorageError(f"Remote folder does not exist: {folder_path}")
+        if len(fields) != 2 or not all(field.isdigit() for field in fields):
+            raise RemoteStorageError(f"Unable to determine disk space for {folder_path}")
+
+        available_gb = int(fields[0]) * int(fields[1]) / _GIB
+        if available_gb < min_gb:
+            raise RemoteStorageError(
+                f"Insufficient disk space on {folder_path}: {available_gb:.1f}GB available, {min_gb}GB required"
+            )
+        available[folder_path] = available_gb
+    return available
@@ -0,0 +1,69 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def hash_cache_file(tmp_path, monkeypatch):
+    """Keep the persisted checksum cache out of the user's home directory."""
+    path = tmp_path / "hashes.json"
+    monkeypatch.setattr("swimlib.f5.actions.image_copy._HASH_CACHE_PATH", str(path))
+    return path
+
+
+class FakeCLIChannel:
+    """Stand-in for a NetScaler ``invoke_shell`` channel.
+
+    Each written line is answered with ``outputs[line]`` (or nothing), and
+    ``shell echo <text>`` lines print ``<text>`` the way the CLI would.
+    """
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.commands = []
+        self.writes = []
+        self.closed = False
+        self._pending = b"Done\r\n> "
+
+    def settimeout(self, timeout):
+        pass
+
+    def sendall(self, data):
+        self.writes.append(data.decode())
+        for line in data.decode().splitlines():
+            if line.startswith("shell echo "):
+                self._pending += f"{line}\r\n{line.removeprefix('shell echo ')}\r\n> ".encode()
+            else:
+                self.commands.append(line)
+                self._pending += f"{line}\r\n{self.outputs.get(line, '')} Done\r\n> ".encode()
+
+    def recv(self, size):
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def ns_cli():
+    """Return a factory for an SSHClient mock backed by a :class:`FakeCLIChannel`."""
+    from unittest.mock import Mock
+
+    def factory(outputs=None):
+        outputs = outputs or {}
+        ssh = Mock()
+        # the first channel is returned for inspection; later opens get their own
+        ssh.channels = [FakeCLIChannel(outputs)]
+
+        def invoke_shell():
+            if ssh.invoke_shell.call_count == 1:
+                return ssh.channels[0]
+            channel = FakeCLIChannel(outputs)
+            ssh.channels.append(channel)
+            return channel
+
+        ssh.invoke_shell.side_effect = invoke_shell
+        return ssh, ssh.channels[0]
+
+    return factory
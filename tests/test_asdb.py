@@ -0,0 +1,200 @@
+"""Unit tests for ASDB client module."""
+
+import json
+
+import pytest
+from unittest.mock import Mock
+from swimlib.asdb import ASDBClient, ASDBExecutionFailed, ASDBExecutionResolved, ASDBExecutionSucceeded
+
+
+def test_send_log_buffers_until_threshold():
+    """Test log entries are batched into a single append_log request."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client.device = {"execution_log_id": "log-123"}
+    client._log_buf_max = 3
+    client._session = Mock()
+
+    client.send_log("one")
+    client.send_log("two")
+    client._session.request.assert_not_called()
+
+    client.send_log("three", log_level="error")
+
+    client._session.request.assert_called_once()
+    kwargs = client._session.request.call_args.kwargs
+    assert kwargs["url"] == "https://asdb.example.com/swimv2/execution_log/log-123/append_log/"
+    assert [entry["message"] for entry in json.loads(kwargs["data"])] == ["one", "two", "three"]
+    assert client._log_buf == []
+
+
+def test_fail_device_execution_flushes_buffered_logs():
+    """Test failing an execution posts any pending log entries."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client.device = {"execution_log_id": "log-123", "execution_type": "dry_run"}
+    client._session = Mock()
+
+    client.send_log("pending")
+    with pytest.raises(SystemExit):
+        client.fail_device_execution("boom")
+
+    client._session.request.assert_called_once()
+    kwargs = client._session.request.call_args.kwargs
+    assert kwargs["url"] == "https://asdb.example.com/swimv2/execution_log/log-123/finalize/"
+    body = json.loads(kwargs["data"])
+    assert body["status"] == "failed"
+    assert [entry["message"] for entry in body["log"]] == ["pending", "boom"]
+    assert body["history"] is None  # dry_run executions record no history
+    assert client._log_buf == []
+
+
+def test_init_makes_no_requests_until_start():
+    """Test the 'inprogress' status update is deferred to start()."""
+    client = ASDBClient(
+        base_url="https://asdb.example.com",
+        api_token="token",
+        device={"execution_log_id": "log-123"},
+        mode="remote",
+    )
+    client._session = Mock()
+    client._session.request.assert_not_called()
+
+    client.start()
+
+    client._session.request.assert_called_once()
+    kwargs = client._session.request.call_args.kwargs
+    assert kwargs["method"] == "PATCH"
+    assert kwargs["url"] == "https://asdb.example.com/swimv2/execution_log/log-123/"
+    assert json.loads(kwargs["data"]) == {"execution_status": "inprogress"}
+
+
+def test_pass_device_execution_falls_back_without_finalize_endpoint():
+    """Test passing an execution sends logs, status and history separately on finalize 404."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client.device = {"execution_log_id": "log-123", "execution_type": "image_copy", "device_name": "bigip-01"}
+    client._session = Mock()
+    client._session.request.side_effect = lambda **kw: (
+        Mock(status_code=404, ok=False) if kw["url"].endswith("finalize/") else Mock(status_code=200, ok=True)
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        client.pass_device_execution("done")
+
+    assert exc_info.value.code == 0
+    calls = {(c.kwargs["method"], c.kwargs["url"]) for c in client._session.request.call_args_list}
+    assert calls == {
+        ("POST", "https://asdb.example.com/swimv2/execution_log/log-123/finalize/"),
+        ("POST", "https://asdb.example.com/swimv2/execution_log/log-123/append_log/"),
+        ("PATCH", "https://asdb.example.com/swimv2/execution_log/log-123/"),
+        ("POST", "https://asdb.example.com/swimv2/device_history/"),
+    }
+
+
+def test_pass_device_execution_falls_back_on_finalize_server_error():
+    """Test a finalize 500 falls back to separate calls but keeps finalize enabled."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client.device = {"execution_log_id": "log-123", "execution_type": "image_copy", "device_name": "bigip-01"}
+    client._session = Mock()
+    client._session.request.side_effect = lambda **kw: (
+        Mock(status_code=500, ok=False) if kw["url"].endswith("finalize/") else Mock(status_code=200, ok=True)
+    )
+
+    client.send_log("pending")
+    with pytest.raises(SystemExit):
+        client.pass_device_execution("done")
+
+    calls = {(c.kwargs["method"], c.kwargs["url"]) for c in client._session.request.call_args_list}
+    assert ("POST", "https://asdb.example.com/swimv2/execution_log/log-123/append_log/") in calls
+    assert ("PATCH", "https://asdb.example.com/swimv2/execution_log/log-123/") in calls
+    assert ("POST", "https://asdb.example.com/swimv2/device_history/") in calls
+    append = next(c for c in client._session.request.call_args_list if c.kwargs["url"].endswith("append_log/"))
+    assert [entry["message"] for entry in json.loads(append.kwargs["data"])] == ["pending", "done"]
+    assert client._finalize_supported is True
+
+
+def test_build_history_metadata_returns_independent_copies():
+    """Test metadata overlays device fields on a fresh copy of the template."""
+    client = ASDBClient(mode="local", device={"local_folder": "/images", "remote_folder": "/shared/images"})
+
+    first = client.build_history_metadata("21.0.0", "completed")
+    first["volume"] = "HD9.9"
+    second = client.build_history_metadata(None, "failed")
+
+    assert first["image_name"] == "BIGIP-21.0.0.iso"
+    assert first["source_location"] == "/images"
+    assert first["destination_location"] == "/shared/images"
+    assert second["volume"] == "HD1.1"
+    assert second["version"] == ""
+    assert second["upload_status"] == "failed"
+    assert len(second) == 13
+
+
+def test_resolve_execution_raises_typed_exit_exceptions():
+    """Test resolve_execution raises the success or failure exception by execution type."""
+    client = ASDBClient(mode="local", device={"execution_log_id": "log-123", "execution_type": "dry_run"})
+    with pytest.raises(ASDBExecutionSucceeded) as exc_info:
+        client.resolve_execution("validation only")
+    assert exc_info.value.code == 0
+
+    client.device = {"execution_log_id": "log-123", "execution_type": "image_copy"}
+    with pytest.raises(ASDBExecutionFailed) as exc_info:
+        client.resolve_execution("copy failed")
+    assert exc_info.value.code == 1
+    assert exc_info.value.message == "copy failed"
+    assert isinstance(exc_info.value, ASDBExecutionResolved)
+
+
+def test_flush_logs_at_exit_drains_live_clients():
+    """Test the atexit hook posts entries still buffered on live clients."""
+    from swimlib.asdb import _flush_live_clients
+
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client.device = {"execution_log_id": "log-123"}
+    client._session = Mock()
+    client.send_log("partial run")
+    client._session.request.assert_not_called()
+
+    _flush_live_clients()
+
+    client._session.request.assert_called_once()
+    assert json.loads(client._session.request.call_args.kwargs["data"])[0]["message"] == "partial run"
+
+
+def test_get_requests_revalidate_with_etag():
+    """Test GETs send If-None-Match and reuse the cached body on 304."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client._session = Mock()
+    first = Mock(status_code=200, headers={"ETag": '"v1"'})
+    not_modified = Mock(status_code=304, headers={})
+    client._session.request.side_effect = [first, not_modified]
+
+    assert client._make_request("GET", "swimv2/devices/bigip-01/") is first
+    assert client._make_request("GET", "swimv2/devices/bigip-01/") is first
+
+    second_call = client._session.request.call_args_list[1]
+    assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_get_requests_within_max_age_skip_network():
+    """Test a cached GET inside its max-age window is served without a request."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    client._session = Mock()
+    first = Mock(status_code=200, headers={"Cache-Control": "max-age=60"})
+    client._session.request.return_value = first
+
+    client._make_request("GET", "swimv2/devices/bigip-01/")
+    assert client._make_request("GET", "swimv2/devices/bigip-01/") is first
+    client._session.request.assert_called_once()
+
+
+def test_payloads_are_sent_as_preencoded_json():
+    """Test request bodies are serialized once to bytes and sent with a JSON content type."""
+    client = ASDBClient(base_url="https://asdb.example.com", api_token="token", mode="remote")
+    assert client._session.headers["Content-Type"] == "application/json"
+    client._session = Mock()
+
+    client.update_execution_log_status("log-123", "completed")
+
+    kwargs = client._session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert isinstance(kwargs["data"], bytes)
+    assert json.loads(kwargs["data"]) == {"execution_status": "completed"}
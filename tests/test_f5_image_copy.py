@@ -1,8 +1,18 @@
 """Unit tests for F5 image copy module."""
 
+import hashlib
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from swimlib.f5.actions.image_copy import compute_remote_md5, sftp_copy_artifacts
+from swimlib.f5.actions.image_copy import (
+    ImageCopyError,
+    compute_local_md5,
+    compute_local_sha256,
+    compute_remote_hash_batch,
+    compute_remote_md5,
+    sftp_copy_artifacts,
+    wants_compression,
+)
 
 
 def test_compute_remote_md5():
@@ -25,7 +35,7 @@ def test_sftp_copy_artifacts_skip_existing():
     mock_ssh.open_sftp.return_value = mock_sftp
 
     # File exists and checksum matches
-    mock_sftp.stat.return_value = True
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
 
     mock_stdout = Mock()
     mock_stdout.read.return_value = b"abc123  /remote/file.iso\n"
@@ -41,13 +51,16 @@ def test_sftp_copy_artifacts_skip_existing():
 
     sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
 
-    # Should not call put since checksum matches
-    mock_sftp.put.assert_not_called()
-    mock_sftp.close.assert_called_once()
+    # Should not upload since checksum matches; the session stays cached on the client
+    mock_sftp.file.assert_not_called()
+    mock_sftp.close.assert_not_called()
 
 
-def test_sftp_copy_artifacts_transfers_new_file():
+def test_sftp_copy_artifacts_transfers_new_file(tmp_path):
     """Test SFTP copy transfers files that don't exist."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+
     mock_ssh = Mock()
     mock_sftp = MagicMock()
     mock_ssh.open_sftp.return_value = mock_sftp
@@ -55,20 +68,445 @@ def test_sftp_copy_artifacts_transfers_new_file():
     # File does not exist
     mock_sftp.stat.side_effect = FileNotFoundError()
 
+    artifacts = [
+        {
+            "local_path": str(local_file),
+            "remote_path": "/remote/file.iso",
+            "md5": hashlib.md5(b"image contents").hexdigest()
+        }
+    ]
+
+    remote_file = mock_sftp.file.return_value.__enter__.return_value
+    remote_file.stat.return_value = Mock(st_size=len(b"image contents"), st_mtime=1700000000)
+    mock_ssh.exec_command.return_value = (None, Mock(), None)
+
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    # Should write the file with pipelining, verified against the local copy
+    mock_sftp.file.assert_called_once_with("/remote/file.iso", "wb")
+    remote_file.set_pipelined.assert_called_once_with(True)
+    remote_file.write.assert_called_once_with(b"image contents")
+    assert remote_file.MAX_REQUEST_SIZE == 255 * 1024
+    # One probe stat before, one fstat on the open handle after; no put(confirm=True) stat
+    mock_sftp.stat.assert_called_once_with("/remote/file.iso")
+    remote_file.stat.assert_called_once()
+    # Only preallocation and the checksum xattr run; nothing is hashed on the device
+    assert [c.args[0] for c in mock_ssh.exec_command.call_args_list] == [
+        ": > /remote/file.iso && fallocate -l 14 /remote/file.iso",
+        f"setfattr -n user.swimlib.md5 -v '{artifacts[0]['md5']} 14 1700000000' /remote/file.iso",
+    ]
+    mock_sftp.close.assert_not_called()
+
+
+def test_sftp_copy_artifacts_rejects_corrupt_local_image(tmp_path):
+    """Test SFTP copy refuses to keep a local file whose checksum is wrong."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.side_effect = FileNotFoundError()
+    remote_file = mock_sftp.file.return_value.__enter__.return_value
+    remote_file.stat.return_value = Mock(st_size=len(b"image contents"), st_mtime=1700000000)
+    mock_ssh.exec_command.return_value = (None, Mock(), None)
+
+    artifacts = [{"local_path": str(local_file), "remote_path": "/remote/file.iso", "md5": "abc123"}]
+
+    # Hashed during the upload, then the bad copy is removed
+    with pytest.raises(ImageCopyError, match="MD5 mismatch"):
+        sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+    mock_sftp.remove.assert_called_once_with("/remote/file.iso")
+    # no checksum xattr is recorded for the rejected image
+    assert [c.args[0].split()[0] for c in mock_ssh.exec_command.call_args_list] == [":"]
+
+    # Once the digest is known, nothing is sent at all
+    mock_sftp.file.reset_mock()
+    with pytest.raises(ImageCopyError, match="MD5 mismatch"):
+        sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_rejects_short_transfer(tmp_path):
+    """Test SFTP copy raises when the remote size does not match the local file."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_ssh.exec_command.return_value = (None, Mock(), None)
+    mock_sftp.stat.side_effect = FileNotFoundError()
+    mock_sftp.file.return_value.__enter__.return_value.stat.return_value = Mock(st_size=3)
+
+    artifacts = [{
+        "local_path": str(local_file),
+        "remote_path": "/remote/file.iso",
+        "md5": hashlib.md5(b"image contents").hexdigest(),
+    }]
+
+    with pytest.raises(IOError, match="size mismatch"):
+        sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+
+def test_compute_remote_md5_caches_by_stat():
+    """Test remote checksum is reused while size and mtime are unchanged."""
+    mock_ssh = Mock()
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = b"abc123  /path/to/file.iso\n"
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+    attrs = Mock(st_size=1024, st_mtime=1700000000)
+
+    assert compute_remote_md5(mock_ssh, "/path/to/file.iso", attrs) == "abc123"
+    assert compute_remote_md5(mock_ssh, "/path/to/file.iso", attrs) == "abc123"
+    mock_ssh.exec_command.assert_called_once()
+
+    attrs.st_mtime = 1700000001
+    compute_remote_md5(mock_ssh, "/path/to/file.iso", attrs)
+    assert mock_ssh.exec_command.call_count == 2
+
+
+def test_compute_local_md5(tmp_path):
+    """Test local checksum matches hashlib over the whole file."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"x" * 10000)
+
+    assert compute_local_md5(str(local_file)) == hashlib.md5(b"x" * 10000).hexdigest()
+    assert compute_local_sha256(str(local_file)) == hashlib.sha256(b"x" * 10000).hexdigest()
+
+
+def test_sftp_copy_artifacts_reuses_given_session():
+    """Test a caller-supplied SFTP session is used and left open."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
     mock_stdout = Mock()
     mock_stdout.read.return_value = b"abc123  /remote/file.iso\n"
     mock_ssh.exec_command.return_value = (None, mock_stdout, None)
 
+    artifacts = [{"local_path": "/local/file.iso", "remote_path": "/remote/file.iso", "md5": "abc123"}]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote", sftp=mock_sftp)
+
+    mock_ssh.open_sftp.assert_not_called()
+    mock_sftp.close.assert_not_called()
+
+
+def test_sftp_copy_artifacts_uses_artifact_hash_algo(tmp_path):
+    """Test artifacts with hash_algo are checked with the matching local and remote hash."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+    sha256 = hashlib.sha256(b"image contents").hexdigest()
+
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=14, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = f"{sha256}  /remote/file.iso\n".encode()
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    artifacts = [{
+        "local_path": str(local_file),
+        "remote_path": "/remote/file.iso",
+        "md5": "unused",
+        "sha256": sha256,
+        "hash_algo": "sha256",
+    }]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    assert mock_ssh.exec_command.call_args.args[0] == "sha256sum /remote/file.iso"
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_falls_back_to_md5_without_remote_command():
+    """Test a device without b3sum is checked with md5sum instead."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=14, st_mtime=1700000000)
+    missing = Mock()
+    missing.read.return_value = b""
+    md5_out = Mock()
+    md5_out.read.return_value = b"abc123  /remote/file.iso\n"
+    mock_ssh.exec_command.side_effect = [
+        (None, missing, Mock()),
+        (None, missing, Mock()),
+        (None, md5_out, None),
+    ]
+
+    artifacts = [{
+        "local_path": "/local/file.iso",
+        "remote_path": "/remote/file.iso",
+        "md5": "abc123",
+        "blake3": "f" * 64,
+        "hash_algo": "blake3",
+    }]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    assert [c.args[0] for c in mock_ssh.exec_command.call_args_list] == [
+        "getfattr --absolute-names -n user.swimlib.blake3 /remote/file.iso",
+        "b3sum /remote/file.iso",
+        "md5sum /remote/file.iso",
+    ]
+    mock_sftp.file.assert_not_called()
+
+
+def test_wants_compression_skips_precompressed_images():
+    """Test compression is only requested for artifacts that are not already compressed."""
+    assert not wants_compression([
+        {"remote_path": "/shared/images/BIGIP-21.0.0.iso"},
+        {"remote_path": "/shared/images/BIGIP-21.0.0.ALL-FSOS.qcow2.zip"},
+    ])
+    assert wants_compression([
+        {"remote_path": "/shared/images/BIGIP-21.0.0.iso"},
+        {"remote_path": "/shared/images/bigip.conf"},
+    ])
+
+
+def test_sftp_copy_artifacts_transfers_each_artifact_on_its_own_session(tmp_path):
+    """Test multiple artifacts are each uploaded over a dedicated SFTP session."""
+    artifacts = []
+    for name in ("image.iso", "hotfix.iso"):
+        local_file = tmp_path / name
+        local_file.write_bytes(name.encode())
+        artifacts.append({
+            "local_path": str(local_file),
+            "remote_path": f"/remote/{name}",
+            "md5": hashlib.md5(name.encode()).hexdigest(),
+        })
+
+    sessions = []
+
+    def open_session():
+        sftp = MagicMock()
+        sftp.stat.side_effect = FileNotFoundError()
+        remote_file = sftp.file.return_value.__enter__.return_value
+        remote_file.stat.side_effect = lambda: Mock(st_size=len(remote_file.write.call_args.args[0]), st_mtime=0)
+        sessions.append(sftp)
+        return sftp
+
+    mock_ssh = Mock()
+    mock_ssh.open_sftp.side_effect = open_session
+    mock_ssh.exec_command.return_value = (None, Mock(), None)
+
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    # one session probes for existing copies, then one per transfer
+    probe, *workers = sessions
+    probe.file.assert_not_called()
+    assert sorted(s.file.call_args.args[0] for s in workers) == ["/remote/hotfix.iso", "/remote/image.iso"]
+    probe.close.assert_not_called()
+    for sftp in workers:
+        sftp.close.assert_called_once()
+
+
+@patch("swimlib.f5.actions.image_copy.ThreadPoolExecutor")
+def test_sftp_copy_artifacts_single_worker_copies_in_order(mock_pool):
+    """Test max_workers=1 copies sequentially without a thread pool."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = b"abc123  /remote/a.iso\nffffff  /remote/b.iso\n"
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
     artifacts = [
-        {
-            "local_path": "/local/file.iso",
-            "remote_path": "/remote/file.iso",
-            "md5": "abc123"
-        }
+        {"local_path": "/local/a.iso", "remote_path": "/remote/a.iso", "md5": "abc123"},
+        {"local_path": "/local/b.iso", "remote_path": "/remote/b.iso", "md5": "abc123"},
     ]
+    with patch("swimlib.f5.actions.image_copy._transfer_artifact") as mock_transfer:
+        sftp_copy_artifacts(mock_ssh, artifacts, "/remote", max_workers=1)
+
+    mock_pool.assert_not_called()
+    mock_transfer.assert_called_once_with(mock_ssh, mock_sftp, artifacts[1])
+
+
+def test_compute_remote_hash_batch_runs_one_command():
+    """Test several remote files are hashed with a single exec_command."""
+    mock_ssh = Mock()
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = b"aaa  /shared/images/a.iso\nbbb  /shared/images/my image.iso\n"
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    digests = compute_remote_hash_batch(mock_ssh, ["/shared/images/a.iso", "/shared/images/my image.iso"])
+
+    assert digests == {"/shared/images/a.iso": "aaa", "/shared/images/my image.iso": "bbb"}
+    mock_ssh.exec_command.assert_called_once_with("md5sum /shared/images/a.iso '/shared/images/my image.iso'")
+
+
+def test_sftp_copy_artifacts_hashes_existing_files_in_one_command():
+    """Test existing remote copies are checked with one batched md5sum."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = b"aaa  /remote/a.iso\nbbb  /remote/b.iso\n"
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    artifacts = [
+        {"local_path": "/local/a.iso", "remote_path": "/remote/a.iso", "md5": "aaa"},
+        {"local_path": "/local/b.iso", "remote_path": "/remote/b.iso", "md5": "bbb"},
+    ]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    assert [c.args[0] for c in mock_ssh.exec_command.call_args_list] == [
+        "getfattr --absolute-names -n user.swimlib.md5 /remote/a.iso /remote/b.iso",
+        "md5sum /remote/a.iso /remote/b.iso",
+    ]
+    mock_sftp.file.assert_not_called()
+
+
+def test_remote_checksums_persist_across_runs(hash_cache_file, monkeypatch):
+    """Test a checksum saved by one run is reused by the next without rehashing."""
+    from swimlib.f5.actions import image_copy
+
+    mock_ssh = Mock()
+    mock_ssh.get_transport.return_value.getpeername.return_value = ("192.0.2.10", 22)
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = b"abc123  /remote/persist.iso\n"
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+    artifacts = [{"local_path": "/local/persist.iso", "remote_path": "/remote/persist.iso", "md5": "abc123"}]
+
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+    assert hash_cache_file.exists()
+
+    # simulate a new process: empty in-memory caches that load from disk
+    monkeypatch.setattr(image_copy, "_digest_cache", {})
+    monkeypatch.setattr(image_copy, "_hash_cache_loaded", False)
+    mock_ssh.exec_command.reset_mock()
+
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    mock_ssh.exec_command.assert_not_called()
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_trusts_matching_checksum_xattr():
+    """Test a checksum xattr matching the file's size and mtime replaces rehashing."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.side_effect = lambda path: Mock(st_size=1024, st_mtime=1700000000)
+    xattrs = Mock()
+    xattrs.read.return_value = (
+        b"# file: /remote/a.iso\nuser.swimlib.md5=\"aaa 1024 1700000000\"\n\n"
+        b"# file: /remote/b.iso\nuser.swimlib.md5=\"bbb 1024 1600000000\"\n\n"
+    )
+    hashes = Mock()
+    hashes.read.return_value = b"bbb  /remote/b.iso\n"
+    mock_ssh.exec_command.side_effect = [(None, xattrs, Mock()), (None, hashes, Mock())]
+
+    artifacts = [
+        {"local_path": "/local/a.iso", "remote_path": "/remote/a.iso", "md5": "aaa"},
+        {"local_path": "/local/b.iso", "remote_path": "/remote/b.iso", "md5": "bbb"},
+    ]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    # b.iso changed since its xattr was written, so only it is hashed
+    assert mock_ssh.exec_command.call_args_list[1].args[0] == "md5sum /remote/b.iso"
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_prefers_sha256_when_present():
+    """Test an artifact carrying both digests is checked with sha256sum by default."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = f"{'e' * 64}  /remote/both.iso\n".encode()
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    artifacts = [{"local_path": "/local/both.iso", "remote_path": "/remote/both.iso", "md5": "abc123", "sha256": "e" * 64}]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    assert mock_ssh.exec_command.call_args.args[0] == "sha256sum /remote/both.iso"
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_prefers_blake3_when_installed(monkeypatch):
+    """Test an artifact carrying a blake3 digest is checked with b3sum when blake3 is installed."""
+    monkeypatch.setattr("swimlib.f5.actions.image_copy.blake3", Mock())
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=1024, st_mtime=1700000000)
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = f"{'b' * 64}  /remote/both.iso\n".encode()
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    artifacts = [{"local_path": "/local/both.iso", "remote_path": "/remote/both.iso", "sha256": "e" * 64, "blake3": "b" * 64}]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    assert mock_ssh.exec_command.call_args.args[0] == "b3sum /remote/both.iso"
+    mock_sftp.file.assert_not_called()
+
+
+def test_sftp_copy_artifacts_skips_hash_on_size_mismatch(tmp_path):
+    """Test a remote copy with the wrong size is replaced without hashing it."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.return_value = Mock(st_size=3, st_mtime=1700000000)
+    remote_file = mock_sftp.file.return_value.__enter__.return_value
+    remote_file.stat.return_value = Mock(st_size=len(b"image contents"), st_mtime=1700000001)
+    mock_ssh.exec_command.return_value = (None, Mock(), None)
+
+    artifacts = [{
+        "local_path": str(local_file),
+        "remote_path": "/remote/file.iso",
+        "md5": hashlib.md5(b"image contents").hexdigest(),
+    }]
+    sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
+
+    mock_sftp.file.assert_called_once_with("/remote/file.iso", "wb")
+    assert [c.args[0].split()[0] for c in mock_ssh.exec_command.call_args_list] == [":", "setfattr"]
+
+
+def test_sftp_copy_artifacts_reuses_cached_session_across_calls():
+    """Test repeated calls on one SSH client share a single SFTP session."""
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_sftp.get_channel.return_value.closed = False
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.side_effect = FileNotFoundError()
+
+    with patch("swimlib.f5.actions.image_copy._transfer_artifact"):
+        sftp_copy_artifacts(mock_ssh, [{"local_path": "/l/a.iso", "remote_path": "/r/a.iso", "md5": "a"}], "/r")
+        sftp_copy_artifacts(mock_ssh, [{"local_path": "/l/b.iso", "remote_path": "/r/b.iso", "md5": "b"}], "/r")
+
+    mock_ssh.open_sftp.assert_called_once()
+    mock_sftp.close.assert_not_called()
+
+
+def test_sftp_copy_artifacts_writes_into_preallocated_file(tmp_path):
+    """Test a file preallocated with fallocate is written in place without truncation."""
+    local_file = tmp_path / "file.iso"
+    local_file.write_bytes(b"image contents")
+
+    mock_ssh = Mock()
+    mock_sftp = MagicMock()
+    mock_ssh.open_sftp.return_value = mock_sftp
+    mock_sftp.stat.side_effect = FileNotFoundError()
+    remote_file = mock_sftp.file.return_value.__enter__.return_value
+    remote_file.stat.return_value = Mock(st_size=14, st_mtime=1700000000)
+    done = Mock()
+    done.channel.recv_exit_status.return_value = 0
+    mock_ssh.exec_command.return_value = (None, done, None)
 
+    artifacts = [{
+        "local_path": str(local_file),
+        "remote_path": "/remote/file.iso",
+        "md5": hashlib.md5(b"image contents").hexdigest(),
+    }]
     sftp_copy_artifacts(mock_ssh, artifacts, "/remote")
 
-    # Should call put to transfer file
-    mock_sftp.put.assert_called_once_with("/local/file.iso", "/remote/file.iso")
-    mock_sftp.close.assert_called_once()
+    mock_sftp.file.assert_called_once_with("/remote/file.iso", "r+b")
@@ -2,14 +2,44 @@
 
 import pytest
 from unittest.mock import Mock
-from swimlib.f5.actions.image_stage import get_current_version, get_target_volume, stage_artifacts
+from swimlib.f5.actions.image_stage import (
+    ImageStageError,
+    get_current_version,
+    get_target_volume,
+    get_version_and_target_volume,
+    stage_artifacts,
+)
+
+
+def version_output(version):
+    """Build ``tmsh show sys version`` output for the given version."""
+    return (
+        "Sys::Version\n"
+        "Main Package\n"
+        "  Product     BIG-IP\n"
+        f"  Version     {version}\n"
+        "  Build       0.0.2\n"
+    ).encode()
+
+
+SOFTWARE_STATUS_OUTPUT = (
+    b"Sys::Software Status\n"
+    b"Volume    Product   Version   Build  Active    Status\n"
+    b"HD1.1     BIG-IP    17.1.1    0.0.2     yes  complete\n"
+    b"HD1.2     BIG-IP    16.1.3    0.0.4      no  complete\n"
+)
+
+
+def query_output(version):
+    """Build the combined version and software status output stage_artifacts reads."""
+    return version_output(version) + SOFTWARE_STATUS_OUTPUT
 
 
 def test_get_current_version():
     """Test retrieving current version from device."""
     mock_ssh = Mock()
     mock_stdout = Mock()
-    mock_stdout.read.return_value = b"17.1.1\n"
+    mock_stdout.read.return_value = version_output("17.1.1")
     mock_ssh.exec_command.return_value = (None, mock_stdout, None)
 
     result = get_current_version(mock_ssh)
@@ -22,7 +52,7 @@ def test_get_target_volume():
     """Test determining target volume for installation."""
     mock_ssh = Mock()
     mock_stdout = Mock()
-    mock_stdout.read.return_value = b"HD1.2\n"
+    mock_stdout.read.return_value = SOFTWARE_STATUS_OUTPUT
     mock_ssh.exec_command.return_value = (None, mock_stdout, None)
 
     result = get_target_volume(mock_ssh)
@@ -31,11 +61,22 @@ def test_get_target_volume():
     mock_ssh.exec_command.assert_called_once()
 
 
+def test_get_version_and_target_volume_uses_one_command():
+    """Test version and target volume are fetched by one tmsh process in one exec_command."""
+    mock_ssh = Mock()
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = query_output("17.1.1")
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    assert get_version_and_target_volume(mock_ssh) == ("17.1.1", "HD1.2")
+    mock_ssh.exec_command.assert_called_once_with('tmsh -c "show sys version; show sys software status"')
+
+
 def test_stage_artifacts_skips_if_already_on_target():
     """Test staging skips if device is already on target version."""
     mock_ssh = Mock()
     mock_stdout = Mock()
-    mock_stdout.read.return_value = b"21.0.0\n"
+    mock_stdout.read.return_value = query_output("21.0.0")
     mock_ssh.exec_command.return_value = (None, mock_stdout, None)
 
     artifacts = [
@@ -44,7 +85,7 @@ def test_stage_artifacts_skips_if_already_on_target():
 
     stage_artifacts(mock_ssh, artifacts, "21.0.0")
 
-    # Should only call exec_command once for version check
+    # Should only call exec_command once for the combined query
     assert mock_ssh.exec_command.call_count == 1
 
 
@@ -52,25 +93,80 @@ def test_stage_artifacts_installs_to_target_volume():
     """Test staging installs artifacts to target volume."""
     mock_ssh = Mock()
 
-    # First call returns current version, second returns target volume
+    # First call returns version and target volume together
     mock_stdout1 = Mock()
-    mock_stdout1.read.return_value = b"17.1.1\n"
+    mock_stdout1.read.return_value = query_output("17.1.1")
     mock_stdout2 = Mock()
-    mock_stdout2.read.return_value = b"HD1.2\n"
-    mock_stdout3 = Mock()
-    mock_stdout3.channel.recv_exit_status.return_value = 0
+    mock_stdout2.read.return_value = b"SWIMLIB_INSTALL_RC 0 /shared/images/BIGIP-21.0.0.iso\n"
 
     mock_ssh.exec_command.side_effect = [
-        (None, mock_stdout1, None),  # get_current_version
-        (None, mock_stdout2, None),  # get_target_volume
-        (None, mock_stdout3, None),  # install command
+        (None, mock_stdout1, None),  # get_version_and_target_volume
+        (None, mock_stdout2, None),  # install command
     ]
 
     artifacts = [
         {"remote_path": "/shared/images/BIGIP-21.0.0.iso"}
     ]
 
+    assert stage_artifacts(mock_ssh, artifacts, "21.0.0") == "HD1.2"
+
+    # Should call exec_command for the combined query and the install
+    assert mock_ssh.exec_command.call_count == 2
+
+
+def test_stage_artifacts_runs_all_installs_in_one_command():
+    """Test every install is backgrounded in a single remote shell and then awaited."""
+    mock_ssh = Mock()
+    mock_stdout1 = Mock()
+    mock_stdout1.read.return_value = query_output("17.1.1")
+    mock_stdout2 = Mock()
+    mock_stdout2.read.return_value = (
+        b"SWIMLIB_INSTALL_RC 0 /shared/images/Hotfix-BIGIP-21.0.0.iso\n"
+        b"SWIMLIB_INSTALL_RC 0 /shared/images/BIGIP-21.0.0.iso\n"
+    )
+    mock_ssh.exec_command.side_effect = [(None, mock_stdout1, None), (None, mock_stdout2, Mock())]
+    artifacts = [
+        {"remote_path": "/shared/images/BIGIP-21.0.0.iso"},
+        {"remote_path": "/shared/images/Hotfix-BIGIP-21.0.0.iso"},
+    ]
+
     stage_artifacts(mock_ssh, artifacts, "21.0.0")
 
-    # Should call exec_command for version, volume, and install
-    assert mock_ssh.exec_command.call_count == 3
+    assert mock_ssh.exec_command.call_args_list[1].args[0] == (
+        "(tmsh install sys software image /shared/images/BIGIP-21.0.0.iso volume HD1.2; "
+        "echo SWIMLIB_INSTALL_RC $? /shared/images/BIGIP-21.0.0.iso) & "
+        "(tmsh install sys software image /shared/images/Hotfix-BIGIP-21.0.0.iso volume HD1.2; "
+        "echo SWIMLIB_INSTALL_RC $? /shared/images/Hotfix-BIGIP-21.0.0.iso) & wait"
+    )
+
+
+def test_stage_artifacts_raises_on_failed_install():
+    """Test a non-zero install exit status raises ImageStageError."""
+    mock_ssh = Mock()
+    mock_stdout1 = Mock()
+    mock_stdout1.read.return_value = query_output("17.1.1")
+    mock_stdout2 = Mock()
+    mock_stdout2.read.return_value = b"SWIMLIB_INSTALL_RC 1 /shared/images/BIGIP-21.0.0.iso\n"
+    mock_ssh.exec_command.side_effect = [
+        (None, mock_stdout1, None),
+        (None, mock_stdout2, Mock()),
+    ]
+
+    with pytest.raises(ImageStageError, match=r"BIGIP-21.0.0.iso \(exit 1\)"):
+        stage_artifacts(mock_ssh, [{"remote_path": "/shared/images/BIGIP-21.0.0.iso"}], "21.0.0")
+
+
+def test_stage_queries_spawn_no_shell_pipelines():
+    """Test the staging queries run tmsh alone and leave all parsing to Python."""
+    mock_ssh = Mock()
+    mock_stdout = Mock()
+    mock_stdout.read.return_value = query_output("17.1.1")
+    mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+    get_current_version(mock_ssh)
+    get_target_volume(mock_ssh)
+    get_version_and_target_volume(mock_ssh)
+
+    for call in mock_ssh.exec_command.call_args_list:
+        assert call.args[0].startswith("tmsh ")
+        assert "|" not in call.args[0]
@@ -1,10 +1,8 @@
 """Unit tests for F5 pre-validation module."""
 
 import pytest
-import os
-import tempfile
-from unittest.mock import patch
-from swimlib.f5.preval import get_target_software, SoftwareLookupException
+from unittest.mock import MagicMock, Mock, patch
+from swimlib.f5.preval import get_target_software, SoftwareLookupException, _folder_entries
 
 
 def test_get_target_software_invalid_model():
@@ -29,25 +27,54 @@ def test_get_target_software_missing_file(mock_matrix):
 
 
 @patch("swimlib.f5.preval.software_matrix")
-def test_get_target_software_success(mock_matrix):
+def test_get_target_software_success(mock_matrix, tmp_path):
     """Test successful software lookup with existing files."""
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        mock_matrix.__contains__ = lambda self, key: True
-        mock_matrix.__getitem__ = lambda self, key: {
-            "target_version": "21.0.0",
-            "artifacts": [
-                {"local_path": tmp_path, "md5": "abc123"}
-            ]
-        }
-
-        result = get_target_software("BIG-IP Virtual Edition")
-
-        assert result["target_version"] == "21.0.0"
-        assert len(result["artifacts"]) == 1
-    finally:
-        # Clean up temp file
-        os.unlink(tmp_path)
+    image = tmp_path / "BIGIP-21.0.0.iso"
+    image.write_bytes(b"")
+    _folder_entries.cache_clear()
+
+    mock_matrix.__contains__ = lambda self, key: True
+    mock_matrix.__getitem__ = lambda self, key: {
+        "target_version": "21.0.0",
+        "artifacts": [
+            {"local_path": str(image), "md5": "abc123"}
+        ]
+    }
+
+    result = get_target_software("BIG-IP Virtual Edition")
+
+    assert result["target_version"] == "21.0.0"
+    assert len(result["artifacts"]) == 1
+
+
+@patch("swimlib.f5.preval.os.scandir")
+@patch("swimlib.f5.preval.software_matrix")
+def test_get_target_software_lists_shared_folder_once(mock_matrix, mock_scandir):
+    """Test images in one folder cost one listing across models, and a miss re-lists once."""
+    _folder_entries.cache_clear()
+
+    def listing(*names):
+        entries = [Mock() for _ in names]
+        for entry, name in zip(entries, names):
+            entry.name = name
+        return MagicMock(__enter__=Mock(return_value=iter(entries)))
+
+    mock_scandir.return_value = listing("shared.iso", "hotfix.iso")
+    mock_matrix.__contains__ = lambda self, key: True
+    mock_matrix.__getitem__ = lambda self, key: {
+        "target_version": "17.5.1.3-0.125.19",
+        "artifacts": [
+            {"local_path": "/images/shared.iso", "md5": "abc123"},
+            {"local_path": "/images/hotfix.iso", "md5": "def456"},
+        ]
+    }
+
+    get_target_software("BIG-IP i2800")
+    get_target_software("BIG-IP i5800")
+    mock_scandir.assert_called_once_with("/images")
+
+    _folder_entries.cache_clear()
+    mock_scandir.side_effect = [listing("shared.iso"), listing("shared.iso")]
+    with pytest.raises(SoftwareLookupException, match="Missing required image: /images/hotfix.iso"):
+        get_target_software("BIG-IP i2800")
+    assert mock_scandir.call_count == 3
@@ -4,6 +4,7 @@ import pytest
 import os
 import json
 from unittest.mock import Mock, patch, MagicMock
+from swimlib.asdb import ASDBExecutionFailed
 from swimlib.f5.run import (
     validate_target_software,
     validate_remote_connection,
@@ -11,13 +12,16 @@ from swimlib.f5.run import (
     run_image_copy,
     run_image_stage,
     run_image_upgrade,
-    PreValStatus
+    run_devices,
+    PreValStatus,
+    _cached_target_software,
 )
 
 
 @patch("swimlib.f5.run.get_target_software")
 def test_validate_target_software(mock_get_software):
     """Test validating and updating device with target software."""
+    _cached_target_software.cache_clear()
     mock_get_software.return_value = {
         "target_version": "21.0.0",
         "artifacts": []
@@ -30,6 +34,26 @@ def test_validate_target_software(mock_get_software):
     assert "artifacts" in device
 
 
+@patch("swimlib.f5.run.get_target_software")
+def test_validate_target_software_caches_per_model(mock_get_software):
+    """Test the software lookup runs once per model and devices get independent copies."""
+    _cached_target_software.cache_clear()
+    mock_get_software.return_value = {
+        "target_version": "21.0.0",
+        "artifacts": [{"filename": "BIGIP-21.0.0.iso"}]
+    }
+
+    first = {"device_type_model": "BIG-IP Virtual Edition"}
+    second = {"device_type_model": "BIG-IP Virtual Edition"}
+    validate_target_software(first)
+    validate_target_software(second)
+
+    mock_get_software.assert_called_once_with("BIG-IP Virtual Edition")
+    first["artifacts"][0]["remote_path"] = "/shared/images/BIGIP-21.0.0.iso"
+    assert "remote_path" not in second["artifacts"][0]
+    assert "remote_path" not in mock_get_software.return_value["artifacts"][0]
+
+
 @patch("swimlib.f5.run.SSHConnection")
 def test_validate_remote_connection_success(mock_ssh_conn):
     """Test successful SSH connection validation."""
@@ -41,6 +65,36 @@ def test_validate_remote_connection_success(mock_ssh_conn):
     result = validate_remote_connection(device, "admin", "password")
 
     assert result == mock_client
+    mock_ssh_conn.assert_called_once_with("192.168.1.100", "admin", "password", compress=False)
+    transport = mock_client.get_transport.return_value
+    transport.set_keepalive.assert_called_once_with(30)
+    assert transport.packetizer.REKEY_BYTES == 2**36
+
+
+@patch("swimlib.f5.run.SSHConnection")
+def test_validate_remote_connection_compresses_uncompressed_artifacts(mock_ssh_conn):
+    """Test SSH compression is negotiated when an artifact is not already compressed."""
+    mock_ssh_conn.return_value.__enter__ = Mock(return_value=Mock())
+
+    device = {"device_address": "192.168.1.100", "artifacts": [{"remote_path": "/shared/images/bigip.conf"}]}
+    validate_remote_connection(device, "admin", "password")
+
+    mock_ssh_conn.assert_called_once_with("192.168.1.100", "admin", "password", compress=True)
+
+
+@patch("swimlib.f5.run.SSHConnection")
+def test_validate_remote_connection_closes_connection_on_setup_failure(mock_ssh_conn):
+    """Test a connection that fails while being tuned is closed before reporting."""
+    conn = mock_ssh_conn.return_value
+    conn.__enter__ = Mock(return_value=Mock())
+    conn.__exit__ = Mock(return_value=False)
+    conn.__enter__.return_value.get_transport.return_value.set_keepalive.side_effect = OSError("reset")
+    client = Mock()
+
+    validate_remote_connection({"device_address": "192.168.1.100"}, "admin", "password", client=client)
+
+    conn.__exit__.assert_called_once()
+    client.pre_validation_status.assert_called_once_with(PreValStatus.FAIL)
 
 
 @patch("swimlib.f5.run.validate_remote_storage")
@@ -77,9 +131,12 @@ def test_run_image_stage(mock_stage):
         "target_version": "21.0.0"
     }
 
+    mock_stage.return_value = "HD1.2"
+
     run_image_stage(mock_ssh, device)
 
     mock_stage.assert_called_once_with(mock_ssh, device["artifacts"], "21.0.0")
+    assert device["target_volume"] == "HD1.2"
 
 
 @patch("swimlib.f5.run.upgrade_to_volume")
@@ -93,3 +150,64 @@ def test_run_image_upgrade(mock_get_volume, mock_upgrade):
     run_image_upgrade(mock_ssh, device)
 
     mock_upgrade.assert_called_once_with(mock_ssh, "HD1.2")
+
+
+@patch("swimlib.f5.run.upgrade_to_volume")
+@patch("swimlib.f5.run.get_target_volume")
+def test_run_image_upgrade_reuses_staged_volume(mock_get_volume, mock_upgrade):
+    """Test the volume found during staging is used without querying the device again."""
+    mock_ssh = Mock()
+    device = {"target_volume": "HD1.3"}
+
+    run_image_upgrade(mock_ssh, device)
+
+    mock_get_volume.assert_not_called()
+    mock_upgrade.assert_called_once_with(mock_ssh, "HD1.3")
+
+
+@patch("swimlib.f5.run.ASDBClient")
+@patch("swimlib.f5.run.check_remote_storage")
+@patch("swimlib.f5.run.validate_remote_connection")
+@patch("swimlib.f5.run.validate_target_software")
+def test_run_devices_uses_one_client_per_device(mock_software, mock_conn, mock_storage, mock_client_cls):
+    """Test fleet runs give each device its own ASDB client and report the worst exit code."""
+    clients = {}
+
+    def make_client(device):
+        clients[device["device_name"]] = Mock()
+        return clients[device["device_name"]]
+
+    def fail_second(device, *, client):
+        if device["device_name"] == "bigip-02":
+            raise ASDBExecutionFailed("error: Software lookup failed")
+
+    mock_client_cls.side_effect = make_client
+    mock_software.side_effect = fail_second
+    devices = [
+        {"device_name": "bigip-01", "execution_type": "dry_run"},
+        {"device_name": "bigip-02", "execution_type": "dry_run"},
+    ]
+
+    assert run_devices(devices, "admin", "password") == 1
+
+    assert set(clients) == {"bigip-01", "bigip-02"}
+    for name, client in clients.items():
+        client.start.assert_called_once()
+        client.close.assert_called_once()
+    assert mock_storage.call_count == 1
+    mock_conn.return_value.close.assert_called_once()
+
+
+@patch("swimlib.f5.run.run_device")
+def test_run_devices_maps_unexpected_errors_to_failure(mock_run_device):
+    """Test one device raising an unexpected error does not lose the others' exit codes."""
+    def run(device, username, password):
+        if device["device_name"] == "bigip-02":
+            raise OSError("socket closed")
+        return 0
+
+    mock_run_device.side_effect = run
+    devices = [{"device_name": "bigip-01"}, {"device_name": "bigip-02"}, {"device_name": "bigip-03"}]
+
+    assert run_devices(devices, "admin", "password") == 1
+    assert mock_run_device.call_count == 3
@@ -0,0 +1,39 @@
+"""Unit tests for NetScaler image copy module."""
+
+import pytest
+from swimlib.netscaler.actions.image_copy import validate_artifact_integrity
+
+SHA256_CMD = "shell sha256sum /var/nsinstall/build-14.1.tgz /var/nsinstall/kernel-14.1.tgz"
+
+ARTIFACTS = [
+    {"remote_path": "/var/nsinstall/build-14.1.tgz", "sha256": "aaa"},
+    {"remote_path": "/var/nsinstall/kernel-14.1.tgz", "sha256": "bbb"},
+]
+
+
+def test_validate_artifact_integrity_uses_one_command(ns_cli):
+    """Test every artifact is hashed by a single sha256sum call through the CLI shell escape."""
+    mock_ssh, channel = ns_cli(
+        {SHA256_CMD: "aaa  /var/nsinstall/build-14.1.tgz\r\nbbb  /var/nsinstall/kernel-14.1.tgz\r\n"}
+    )
+
+    assert validate_artifact_integrity(mock_ssh, ARTIFACTS) is True
+    assert channel.commands == [SHA256_CMD]
+
+
+def test_validate_artifact_integrity_raises_on_mismatch(ns_cli):
+    """Test a checksum mismatch raises ValueError naming the file."""
+    mock_ssh, _ = ns_cli(
+        {SHA256_CMD: "aaa  /var/nsinstall/build-14.1.tgz\r\nccc  /var/nsinstall/kernel-14.1.tgz\r\n"}
+    )
+
+    with pytest.raises(ValueError, match="kernel-14.1.tgz"):
+        validate_artifact_integrity(mock_ssh, ARTIFACTS)
+
+
+def test_validate_artifact_integrity_raises_when_file_not_hashed(ns_cli):
+    """Test a file sha256sum produced no digest for raises RuntimeError."""
+    mock_ssh, _ = ns_cli({SHA256_CMD: "aaa  /var/nsinstall/build-14.1.tgz\r\n"})
+
+    with pytest.raises(RuntimeError, match="kernel-14.1.tgz"):
+        validate_artifact_integrity(mock_ssh, ARTIFACTS)
@@ -0,0 +1,147 @@
+"""Unit tests for NetScaler image stage module."""
+
+import pytest
+from swimlib.netscaler._shell import discard_shell, get_shell
+from swimlib.netscaler.actions.image_stage import (
+    get_current_version,
+    get_target_partition,
+    stage_to_partition,
+    verify_staged_version,
+)
+
+
+def version_output(version):
+    """Build ``show ns version`` output for the given ``<release>-<build>`` version."""
+    release, build = version.split("-")
+    return f"\tNetScaler NS{release}: Build {build}.nc, Date: Jun 1 2024, 10:00:00   (64-bit)\r\n"
+
+
+def bootconfig_output(partition):
+    """Build ``show ns bootconfig`` output naming the active partition."""
+    return f"\tHDD Partition: {partition}\r\n"
+
+
+def test_get_current_version(ns_cli):
+    """Test parsing the running version from ``show ns version``."""
+    mock_ssh, _ = ns_cli({"show ns version": version_output("13.1-48.47")})
+
+    assert get_current_version(mock_ssh) == "13.1-48.47"
+
+
+def test_get_target_partition(ns_cli):
+    """Test the inactive partition is the opposite of the active one."""
+    mock_ssh, _ = ns_cli({"show ns bootconfig": bootconfig_output(0)})
+
+    assert get_target_partition(mock_ssh) == 1
+
+
+def test_verify_staged_version(ns_cli):
+    """Test comparing the staged partition version to the expected one."""
+    mock_ssh, _ = ns_cli({"show ns version -partition 1": version_output("14.1-25.109")})
+
+    assert verify_staged_version(mock_ssh, 1, "14.1-25.109") is True
+
+
+def test_helpers_share_one_channel(ns_cli):
+    """Test successive helpers reuse the cached shell instead of opening channels."""
+    mock_ssh, channel = ns_cli({
+        "show ns version": version_output("13.1-48.47"),
+        "show ns bootconfig": bootconfig_output(1),
+    })
+
+    get_current_version(mock_ssh)
+    get_target_partition(mock_ssh)
+
+    mock_ssh.invoke_shell.assert_called_once()
+    assert channel.commands == ["show ns version", "show ns bootconfig"]
+
+
+def test_discard_shell_closes_channel(ns_cli):
+    """Test a discarded shell is closed and the next call opens a new one."""
+    mock_ssh, channel = ns_cli()
+    get_shell(mock_ssh)
+
+    discard_shell(mock_ssh)
+
+    assert channel.closed
+    get_shell(mock_ssh)
+    assert mock_ssh.invoke_shell.call_count == 2
+
+
+def test_stage_to_partition_single_install_one_write(ns_cli):
+    """Test a single install shares one write with the staged-version check."""
+    mock_ssh, channel = ns_cli({
+        "show ns version": version_output("13.1-48.47"),
+        "show ns bootconfig": bootconfig_output(0),
+        "show ns version -partition 1": version_output("14.1-25.109"),
+    })
+
+    stage_to_partition(mock_ssh, [{"remote_path": "/var/nsinstall/build-14.1-25.109_nc.tgz"}], "14.1-25.109")
+
+    mock_ssh.invoke_shell.assert_called_once()
+    assert channel.commands[-2:] == [
+        "install ns build /var/nsinstall/build-14.1-25.109_nc.tgz -y -partition 1",
+        "show ns version -partition 1",
+    ]
+    assert "show ns version -partition 1\n" in channel.writes[-1]
+
+
+def test_stage_to_partition_concurrent_installs(ns_cli):
+    """Test several installs each run on their own channel."""
+    mock_ssh, channel = ns_cli({
+        "show ns version": version_output("13.1-48.47"),
+        "show ns bootconfig": bootconfig_output(0),
+        "show ns version -partition 1": version_output("14.1-25.109"),
+    })
+    artifacts = [
+        {"remote_path": "/var/nsinstall/build-14.1-25.109_nc.tgz"},
+        {"remote_path": "/var/nsinstall/kernel-14.1-25.109.tgz"},
+    ]
+
+    stage_to_partition(mock_ssh, artifacts, "14.1-25.109")
+
+    install_channels = mock_ssh.channels[1:]
+    assert sorted(c.commands[0] for c in install_channels) == [
+        "install ns build /var/nsinstall/build-14.1-25.109_nc.tgz -y -partition 1",
+        "install ns build /var/nsinstall/kernel-14.1-25.109.tgz -y -partition 1",
+    ]
+    assert all(c.closed for c in install_channels)
+    assert channel.commands[-1] == "show ns version -partition 1"
+
+
+def test_stage_to_partition_already_on_target(ns_cli):
+    """Test staging is refused when the device already runs the target version."""
+    mock_ssh, channel = ns_cli({
+        "show ns version": version_output("14.1-25.109"),
+        "show ns bootconfig": bootconfig_output(0),
+    })
+
+    with pytest.raises(ValueError):
+        stage_to_partition(mock_ssh, [{"remote_path": "/var/nsinstall/a.tgz"}], "14.1-25.109")
+    assert not any(cmd.startswith("install") for cmd in channel.commands)
+
+
+def test_stage_to_partition_install_error(ns_cli):
+    """Test a CLI error from an install raises RuntimeError naming the package."""
+    mock_ssh, _ = ns_cli({
+        "show ns version": version_output("13.1-48.47"),
+        "show ns bootconfig": bootconfig_output(1),
+        "install ns build /var/nsinstall/a.tgz -y -partition 0": "ERROR: Not enough space\r\n",
+        "show ns version -partition 0": version_output("13.1-48.47"),
+    })
+
+    with pytest.raises(RuntimeError, match="a.tgz"):
+        stage_to_partition(mock_ssh, [{"remote_path": "/var/nsinstall/a.tgz"}], "14.1-25.109")
+
+
+def test_stage_to_partition_explicit_partition_skips_bootconfig(ns_cli):
+    """Test an explicit partition skips the bootconfig probe."""
+    mock_ssh, channel = ns_cli({
+        "show ns version": version_output("13.1-48.47"),
+        "show ns version -partition 0": version_output("14.1-25.109"),
+    })
+
+    stage_to_partition(mock_ssh, [{"remote_path": "/var/nsinstall/a.tgz"}], "14.1-25.109", partition=0)
+
+    assert "show ns bootconfig" not in channel.commands
+    assert channel.commands[0] == "show ns version"
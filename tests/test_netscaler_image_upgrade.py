@@ -0,0 +1,99 @@
+"""Unit tests for NetScaler image upgrade module."""
+
+import socket
+from unittest.mock import Mock
+
+import pytest
+from swimlib.netscaler._shell import _shells, get_shell
+from swimlib.netscaler.actions.image_upgrade import (
+    save_config_before_upgrade,
+    upgrade_to_partition,
+    verify_upgrade_readiness,
+    warm_reboot,
+)
+
+STAGED_VERSION = "\tNetScaler NS14.1: Build 25.109.nc, Date: Jun 1 2024, 10:00:00   (64-bit)\r\n"
+
+
+def test_save_config_before_upgrade(ns_cli):
+    """Test ``save ns config`` is issued on the shared shell."""
+    mock_ssh, channel = ns_cli()
+
+    save_config_before_upgrade(mock_ssh)
+
+    assert channel.commands == ["save ns config"]
+
+
+def test_save_config_before_upgrade_error(ns_cli):
+    """Test a CLI error from ``save ns config`` raises RuntimeError."""
+    mock_ssh, _ = ns_cli({"save ns config": "ERROR: Operation not permitted\r\n"})
+
+    with pytest.raises(RuntimeError, match="not permitted"):
+        save_config_before_upgrade(mock_ssh)
+
+
+def test_verify_upgrade_readiness(ns_cli):
+    """Test readiness passes when the partition has software and health is clean."""
+    mock_ssh, channel = ns_cli({"show ns version -partition 1": STAGED_VERSION})
+
+    assert verify_upgrade_readiness(mock_ssh, target_partition=1) is True
+    assert len(channel.writes) == 2  # banner drain + one batch
+
+
+def test_verify_upgrade_readiness_empty_partition(ns_cli):
+    """Test readiness fails when the target partition has no parseable version."""
+    mock_ssh, _ = ns_cli({"show ns version -partition 0": "ERROR: No software on partition\r\n"})
+
+    assert verify_upgrade_readiness(mock_ssh, target_partition=0) is False
+
+
+def test_verify_upgrade_readiness_invalid_partition(ns_cli):
+    """Test an out-of-range partition raises ValueError before any command."""
+    mock_ssh, _ = ns_cli()
+
+    with pytest.raises(ValueError):
+        verify_upgrade_readiness(mock_ssh, target_partition=2)
+    mock_ssh.invoke_shell.assert_not_called()
+
+
+def test_upgrade_to_partition_single_send(ns_cli):
+    """Test save and reboot go out in one write and the shell is dropped afterwards."""
+    mock_ssh, channel = ns_cli({"show ns version -partition 1": STAGED_VERSION})
+
+    upgrade_to_partition(mock_ssh, partition=1)
+
+    assert channel.writes[-1] == "save ns config\nshell echo __END_3__\nreboot -p 1\n"
+    assert channel.closed
+    assert mock_ssh not in _shells
+
+
+def test_warm_reboot_without_save(ns_cli):
+    """Test ``save_config=False`` sends only the warm reboot."""
+    mock_ssh, channel = ns_cli()
+
+    warm_reboot(mock_ssh, partition=0, save_config=False)
+
+    assert channel.commands == ["reboot -w -p 0"]
+
+
+def test_upgrade_to_partition_reports_save_failure(ns_cli):
+    """Test a failed save is reported as such even though the reboot was already sent."""
+    mock_ssh, channel = ns_cli({
+        "show ns version -partition 1": STAGED_VERSION,
+        "save ns config": "ERROR: Operation not permitted\r\n",
+    })
+
+    with pytest.raises(RuntimeError, match="save ns config failed: ERROR: Operation not permitted"):
+        upgrade_to_partition(mock_ssh, partition=1)
+    assert channel.commands[-1] == "reboot -p 1"
+
+
+def test_warm_reboot_times_out_when_channel_stays_open(ns_cli):
+    """Test a channel that goes quiet without closing is not mistaken for a reboot."""
+    mock_ssh, channel = ns_cli()
+    get_shell(mock_ssh)
+    channel.recv = Mock(side_effect=socket.timeout)
+
+    with pytest.raises(RuntimeError, match="did not close the session"):
+        warm_reboot(mock_ssh, partition=0, save_config=False)
+    assert mock_ssh not in _shells
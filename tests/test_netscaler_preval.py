@@ -0,0 +1,30 @@
+"""Unit tests for NetScaler preval module."""
+
+import pickle
+
+from swimlib.netscaler.preval import SoftwareLookupException, validate_ns_version
+
+
+def test_validate_ns_version_supported_path():
+    """Test a release pair in the upgrade matrix is accepted."""
+    assert validate_ns_version("13.1-48.47", "14.1-25.109") is True
+
+
+def test_validate_ns_version_unsupported_path():
+    """Test a release jump missing from the matrix is rejected."""
+    assert validate_ns_version("12.1-65.25", "14.1-25.109") is False
+
+
+def test_validate_ns_version_same_release():
+    """Test builds within a release may move forward or stay put, but not back."""
+    assert validate_ns_version("14.1-25.109", "14.1-25.109") is True
+    assert validate_ns_version("14.1-12.35", "14.1-25.109") is True
+    assert validate_ns_version("14.1-25.109", "14.1-12.35") is False
+
+
+def test_software_lookup_exception_round_trips_through_pickle():
+    """Test lookup failures survive being shipped between worker processes."""
+    error = pickle.loads(pickle.dumps(SoftwareLookupException("Device model 'X' not found")))
+
+    assert isinstance(error, SoftwareLookupException)
+    assert str(error) == "Device model 'X' not found"
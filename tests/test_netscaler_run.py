@@ -0,0 +1,175 @@
+"""Unit tests for NetScaler run module."""
+
+from unittest.mock import Mock, patch
+import pytest
+from swimlib.asdb import ASDBExecutionFailed
+from swimlib.netscaler import run
+from swimlib.netscaler.run import (
+    run_devices, validate_remote_connection, validate_target_software, _cached_target_software
+)
+
+
+@patch("swimlib.netscaler.run.get_target_software")
+def test_validate_target_software_caches_per_model(mock_get_software):
+    """Test the software lookup runs once per model and devices get independent copies."""
+    _cached_target_software.cache_clear()
+    mock_get_software.return_value = {
+        "target_version": "14.1-25.109",
+        "artifacts": [{"filename": "build-14.1-25.109_nc.tgz"}]
+    }
+
+    first = {"device_type_model": "NetScaler VPX"}
+    second = {"device_type_model": "NetScaler VPX"}
+    validate_target_software(first)
+    validate_target_software(second)
+
+    mock_get_software.assert_called_once_with("NetScaler VPX")
+    assert first["target_version"] == "14.1-25.109"
+    first["artifacts"][0]["remote_path"] = "/var/nsinstall/build-14.1-25.109_nc.tgz"
+    assert "remote_path" not in second["artifacts"][0]
+
+
+@patch("swimlib.netscaler.run.SSHConnection")
+def test_validate_remote_connection_sets_keepalive(mock_ssh_conn):
+    """Test the transport is kept alive and tuned for long build transfers."""
+    mock_client = Mock()
+    mock_ssh_conn.return_value.__enter__ = Mock(return_value=mock_client)
+
+    result = validate_remote_connection({"device_address": "192.168.1.100"}, "nsroot", "password")
+
+    assert result == mock_client
+    transport = mock_client.get_transport.return_value
+    transport.set_keepalive.assert_called_once_with(30)
+    assert transport.packetizer.REKEY_BYTES == 2**36
+
+
+@patch("swimlib.netscaler.run.ASDBClient")
+@patch("swimlib.netscaler.run.validate_remote_storage_ns")
+@patch("swimlib.netscaler.run.validate_remote_connection")
+@patch("swimlib.netscaler.run.validate_target_software")
+def test_run_devices_uses_one_client_per_device(mock_software, mock_conn, mock_storage, mock_client_cls):
+    """Test fleet runs give each device its own ASDB client and report the worst exit code."""
+    clients = {}
+
+    def make_client(device):
+        clients[device["device_name"]] = Mock()
+        return clients[device["device_name"]]
+
+    def fail_second(device, *, client):
+        if device["device_name"] == "ns-02":
+            raise ASDBExecutionFailed("error: Software lookup failed")
+
+    mock_client_cls.side_effect = make_client
+    mock_software.side_effect = fail_second
+    devices = [
+        {"device_name": "ns-01", "device_address": "192.168.1.100", "execution_type": "dry_run"},
+        {"device_name": "ns-02", "device_address": "192.168.1.101", "execution_type": "dry_run"},
+    ]
+
+    assert run_devices(devices, "nsroot", "password") == 1
+
+    assert set(clients) == {"ns-01", "ns-02"}
+    for client in clients.values():
+        client.start.assert_called_once()
+        client.close.assert_called_once()
+    assert mock_storage.call_count == 1
+    mock_conn.return_value.close.assert_called_once()
+
+
+@patch("swimlib.netscaler.run.run_device")
+def test_run_devices_maps_unexpected_errors_to_failure(mock_run_device):
+    """Test one device raising an unexpected error does not lose the others' exit codes."""
+    def run(device, username, password):
+        if device["device_name"] == "ns-02":
+            raise OSError("socket closed")
+        return 0
+
+    mock_run_device.side_effect = run
+    devices = [{"device_name": "ns-01"}, {"device_name": "ns-02"}, {"device_name": "ns-03"}]
+
+    assert run_devices(devices, "nsroot", "password") == 1
+    assert mock_run_device.call_count == 3
+
+
+@patch("swimlib.netscaler.run.run_devices", return_value=1)
+def test_main_runs_device_list_as_fleet(mock_run_devices, monkeypatch):
+    """Test a JSON list in SWIMLIB_DEVICE_JSON is parsed and handed to the fleet runner."""
+    monkeypatch.setenv("SWIMLIB_DEVICE_JSON", '[{"device_name": "ns-01"}, {"device_name": "ns-02"}]')
+
+    with pytest.raises(SystemExit) as exc:
+        run.main()
+
+    assert exc.value.code == 1
+    devices = mock_run_devices.call_args.args[0]
+    assert [d["device_name"] for d in devices] == ["ns-01", "ns-02"]
+
+
+@pytest.mark.parametrize("execution_type, expected", [
+    ("dry_run", []),
+    ("image_copy", ["copy"]),
+    ("image_stage", ["copy", "stage"]),
+    ("image_upgrade", ["copy", "stage", "upgrade"]),
+])
+@patch("swimlib.netscaler.run.validate_remote_storage_ns")
+@patch("swimlib.netscaler.run.validate_remote_connection")
+@patch("swimlib.netscaler.run.validate_target_software")
+def test_run_device_runs_workflow_steps(mock_software, mock_conn, mock_storage, execution_type, expected):
+    """Test each execution_type runs its workflow steps in order."""
+    calls = []
+    steps = {
+        name: Mock(side_effect=lambda ssh, device, name=name: calls.append(name))
+        for name in ("copy", "stage", "upgrade")
+    }
+    workflow = {
+        "dry_run": (),
+        "image_copy": (steps["copy"],),
+        "image_stage": (steps["copy"], steps["stage"]),
+        "image_upgrade": (steps["copy"], steps["stage"], steps["upgrade"]),
+    }
+    device = {"device_address": "192.168.1.100", "execution_type": execution_type}
+
+    with patch.dict(run._WORKFLOW, workflow):
+        assert run.run_device(device, "nsroot", "password", client=Mock()) == 0
+
+    assert calls == expected
+
+
+@patch("swimlib.netscaler.run.SSHConnection")
+def test_validate_remote_connection_closes_connection_on_setup_failure(mock_ssh_conn):
+    """Test a connection that fails while being tuned is closed before reporting."""
+    conn = mock_ssh_conn.return_value
+    conn.__enter__ = Mock(return_value=Mock())
+    conn.__exit__ = Mock(return_value=False)
+    conn.__enter__.return_value.get_transport.return_value.set_keepalive.side_effect = OSError("reset")
+    client = Mock()
+
+    validate_remote_connection({"device_address": "192.168.1.100"}, "nsroot", "password", client=client)
+
+    conn.__exit__.assert_called_once()
+    client.pre_validation_status.assert_called_once_with(run.PreValStatus.FAIL)
+
+
+@patch("swimlib.netscaler.run.SSHConnection")
+def test_validate_remote_connection_reports_auth_failure(mock_ssh_conn):
+    """Test a rejected login is reported as FAILAUTH rather than a generic failure."""
+    mock_ssh_conn.return_value.__enter__ = Mock(side_effect=run.SSHAuthError("bad password"))
+    client = Mock()
+
+    validate_remote_connection({"device_address": "192.168.1.100"}, "nsroot", "wrong", client=client)
+
+    client.pre_validation_status.assert_called_once_with(run.PreValStatus.FAILAUTH)
+    client.resolve_execution.assert_called_once_with("error: SSH authentication failed: bad password")
+
+
+@patch("swimlib.netscaler.run.validate_remote_storage_ns")
+@patch("swimlib.netscaler.run.validate_remote_connection")
+@patch("swimlib.netscaler.run.validate_target_software")
+def test_run_device_logs_dry_run(mock_software, mock_conn, mock_storage, caplog, capsys):
+    """Test workflow progress goes to the module logger rather than stdout."""
+    device = {"device_name": "ns-01", "device_address": "192.168.1.100", "execution_type": "dry_run"}
+
+    with caplog.at_level("INFO", logger="swimlib.netscaler.run"):
+        assert run.run_device(device, "nsroot", "password", client=Mock()) == 0
+
+    assert "Dry run complete for ns-01" in caplog.text
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,32 @@
+"""Unit tests for the shared NetScaler CLI shell."""
+
+import subprocess
+import sys
+
+from unittest.mock import Mock
+from swimlib.netscaler._shell import NSShell
+
+
+def test_batch_reassembles_output_split_across_reads():
+    """Test sentinels and multi-byte characters split over several recv calls."""
+    stream = "banner\r\n__END_0__\r\n> show ns version\r\nné NS14.1\r\n__END_1__\r\n> ".encode()
+    channel = Mock()
+    channel.recv.side_effect = [stream[i:i + 3] for i in range(0, len(stream), 3)]
+    ssh = Mock()
+    ssh.invoke_shell.return_value = channel
+
+    shell = NSShell(ssh)
+    output = shell.batch(["show ns version"])
+
+    assert output == ["\n> show ns version\r\nné NS14.1\r\n"]
+
+
+def test_action_modules_import_without_paramiko():
+    """Test importing the NetScaler action modules does not load paramiko."""
+    code = (
+        "import sys\n"
+        "import swimlib.netscaler.actions.image_stage, swimlib.netscaler.actions.image_upgrade\n"
+        "import swimlib.netscaler.actions.image_copy, swimlib.netscaler.actions.ha_manager\n"
+        "assert 'paramiko' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
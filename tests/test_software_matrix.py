@@ -0,0 +1,41 @@
+"""Unit tests for the software matrix module."""
+
+from swimlib.software_matrix import (
+    software_matrix, iter_all_artifacts, iter_unique_artifacts, lookup_by_filename, lookup_by_md5
+)
+
+
+def test_lookup_by_filename_lists_every_model():
+    """Test a shared artifact maps back to every model that installs it."""
+    models = lookup_by_filename("Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso")
+
+    assert models == ("BIG-IP 7200", "BIG-IP i2800", "BIG-IP i5800", "BIG-IP i7800", "BIG-IP i10800")
+    assert lookup_by_filename("missing.iso") == ()
+
+
+def test_lookup_by_md5_returns_matrix_artifact():
+    """Test an MD5 resolves to the artifact held in the matrix."""
+    artifact = lookup_by_md5("1234567890abcdef1234567890abcdef")
+
+    assert artifact is software_matrix["BIG-IP Virtual Edition"]["artifacts"][1]
+    assert lookup_by_md5("0" * 32) is None
+
+
+def test_hardware_models_share_one_entry():
+    """Test the 17.5.1.3 hardware models all resolve to the same configuration object."""
+    models = ("BIG-IP 7200", "BIG-IP i2800", "BIG-IP i5800", "BIG-IP i7800", "BIG-IP i10800")
+    entries = {id(software_matrix[model]) for model in models}
+
+    assert len(entries) == 1
+    assert software_matrix["BIG-IP i2800"]["target_version"] == "17.5.1.3-0.125.19"
+
+
+def test_iter_unique_artifacts_skips_shared_images():
+    """Test images shared across models are yielded once, with their first model."""
+    all_pairs = list(iter_all_artifacts())
+    unique = list(iter_unique_artifacts())
+
+    assert len(all_pairs) == sum(len(config["artifacts"]) for config in software_matrix.values())
+    assert len({artifact["md5"] for _, artifact in unique}) == len(unique)
+    hotfix = [model for model, a in unique if a["filename"] == "Hotfix-BIGIP-17.5.1.3-0.125.19-ENG.iso"]
+    assert hotfix == ["BIG-IP 7200"]
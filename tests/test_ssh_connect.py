@@ -0,0 +1,64 @@
+"""Unit tests for SSH connection helpers."""
+
+from unittest.mock import Mock
+import pytest
+from swimlib.ssh_connect import validate_remote_storage, validate_remote_storage_batch, RemoteStorageError
+
+
+def _ssh_returning(output):
+    """Build a mock SSH client whose exec_command prints ``output``."""
+    ssh = Mock()
+    stdout = Mock()
+    stdout.read.return_value = output.encode()
+    ssh.exec_command.return_value = (Mock(), stdout, Mock())
+    return ssh
+
+
+def test_validate_remote_storage_uses_one_command():
+    """Test the folder and free-space checks share one exec_command."""
+    ssh = _ssh_returning(f"{11 * 2**18} 4096\n")
+
+    validate_remote_storage(ssh, "/shared/images", min_gb=5)
+
+    ssh.exec_command.assert_called_once()
+    command = ssh.exec_command.call_args.args[0]
+    assert "test -d /shared/images" in command
+    assert "stat -f -c '%a %S' /shared/images" in command
+
+
+@pytest.mark.parametrize("output, message", [
+    ("MISSING\n", "Remote folder does not exist"),
+    ("", "Unable to determine disk space"),
+    ("stat: cannot read file system information\n", "Unable to determine disk space"),
+    (f"{2**19} 4096\n", "Insufficient disk space on /shared/images: 2.0GB available"),
+])
+def test_validate_remote_storage_failures(output, message):
+    """Test each failure mode raises RemoteStorageError with its message."""
+    with pytest.raises(RemoteStorageError, match=message):
+        validate_remote_storage(_ssh_returning(output), "/shared/images", min_gb=5)
+
+
+def test_validate_remote_storage_batch_checks_all_folders_at_once():
+    """Test several folders are validated by one command and reported per folder."""
+    ssh = _ssh_returning(f"{42 * 2**18} 4096\n{7 * 2**20} 1024\n")
+
+    result = validate_remote_storage_batch(ssh, {"/shared/images": 20, "/var/tmp": 2})
+
+    ssh.exec_command.assert_called_once()
+    assert result == {"/shared/images": 42.0, "/var/tmp": 7.0}
+
+    with pytest.raises(RemoteStorageError, match="Remote folder does not exist: /var/tmp"):
+        validate_remote_storage_batch(
+            _ssh_returning(f"{42 * 2**18} 4096\nMISSING\n"), {"/shared/images": 20, "/var/tmp": 2}
+        )
+
+
+def test_validate_remote_storage_times_out():
+    """Test a hung storage check is bounded and reported as a storage failure."""
+    ssh = _ssh_returning("")
+    ssh.exec_command.return_value[1].read.side_effect = TimeoutError()
+
+    with pytest.raises(RemoteStorageError, match="Timed out checking storage for /shared/images"):
+        validate_remote_storage(ssh, "/shared/images", min_gb=5)
+
+    assert ssh.exec_command.call_args.kwargs["timeout"] == 30